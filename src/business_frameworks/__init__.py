@@ -2,18 +2,27 @@
 Business Frameworks - Strategic Framework Toolkit for MBA Students
 
 A comprehensive Python library for business strategy analysis and visualization.
+
+Names are imported lazily on first access, and plotting libraries are only
+imported when a chart is drawn, so ``import business_frameworks`` stays cheap.
 """
 
+import importlib
+
 __version__ = "0.2.1"
 
-from business_frameworks.porters_five_forces import PortersFiveForces
-from business_frameworks.swot import SWOT
-from business_frameworks.pestel import PESTEL
-from business_frameworks.bcg_matrix import BCGMatrix
-from business_frameworks.ansoff_matrix import AnsoffMatrix
+# Public name -> module that defines it (loaded on first attribute access)
+_LAZY_IMPORTS = {
+    "PortersFiveForces": "business_frameworks.porters_five_forces",
+    "SWOT": "business_frameworks.swot",
+    "PESTEL": "business_frameworks.pestel",
+    "BCGMatrix": "business_frameworks.bcg_matrix",
+    "AnsoffMatrix": "business_frameworks.ansoff_matrix",
+    "CompanyDataLoader": "business_frameworks.company_data",
+}
 
 # Convenience features
-from business_frameworks import templates
+_LAZY_SUBMODULES = ("templates",)
 
 __all__ = [
     "PortersFiveForces",
@@ -21,5 +30,21 @@ __all__ = [
     "PESTEL",
     "BCGMatrix",
     "AnsoffMatrix",
+    "CompanyDataLoader",
     "templates",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
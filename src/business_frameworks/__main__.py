@@ -0,0 +1,7 @@
+"""Allow ``python -m business_frameworks`` as an alias for ``strategykit``."""
+
+import sys
+
+from business_frameworks.cli import main
+
+sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Advance widths of DejaVu Sans, matplotlib's default font, at 1pt.
+
+Lets ``labels.text_size`` measure common characters without loading
+matplotlib (the SVG renderer relies on this). Characters not listed here are
+measured through matplotlib. Regenerate with ``labels._glyph_advance``
+if the default font changes.
+"""
+
+from typing import Dict
+
+CHARS = ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~•…–—‘’“”€£¥°±×÷§©®™'
+
+_NORMAL = (
+    0.3178, 0.4009, 0.46, 0.838, 0.6362, 0.9502, 0.7798, 0.2748, 0.3902, 0.3902, 0.5,
+    0.838, 0.3178, 0.3608, 0.3178, 0.3369, 0.6362, 0.6362, 0.6362, 0.6362, 0.6362, 0.6362,
+    0.6362, 0.6362, 0.6362, 0.6362, 0.3369, 0.3369, 0.838, 0.838, 0.838, 0.5308, 1, 0.6841,
+    0.6861, 0.6983, 0.77, 0.6319, 0.5752, 0.7748, 0.752, 0.295, 0.295, 0.6558, 0.5572,
+    0.8628, 0.7481, 0.7872, 0.603, 0.7872, 0.6948, 0.6348, 0.6108, 0.7319, 0.6841, 0.9888,
+    0.685, 0.6108, 0.685, 0.3902, 0.3369, 0.3902, 0.838, 0.5, 0.5, 0.6128, 0.6348, 0.5498,
+    0.6348, 0.6153, 0.352, 0.6348, 0.6338, 0.2778, 0.2778, 0.5791, 0.2778, 0.9741, 0.6338,
+    0.6119, 0.6348, 0.6348, 0.4111, 0.5209, 0.392, 0.6338, 0.5919, 0.8178, 0.5919, 0.5919,
+    0.5248, 0.6362, 0.3369, 0.6362, 0.838, 0.5898, 1, 0.5, 1, 0.3178, 0.3178, 0.5181,
+    0.5181, 0.6362, 0.6362, 0.6362, 0.5, 0.838, 0.838, 0.838, 0.5, 1, 1, 1,
+)
+_BOLD = (
+    0.3481, 0.4561, 0.5209, 0.838, 0.6958, 1.002, 0.872, 0.3061, 0.457, 0.457, 0.523,
+    0.838, 0.3798, 0.415, 0.3798, 0.3653, 0.6958, 0.6958, 0.6958, 0.6958, 0.6958, 0.6958,
+    0.6958, 0.6958, 0.6958, 0.6958, 0.3998, 0.3998, 0.838, 0.838, 0.838, 0.5802, 1, 0.7739,
+    0.7622, 0.7339, 0.8302, 0.6831, 0.6831, 0.8208, 0.8369, 0.372, 0.372, 0.7748, 0.6372,
+    0.9952, 0.8369, 0.8502, 0.733, 0.8502, 0.77, 0.7202, 0.6822, 0.812, 0.7739, 1.103,
+    0.7709, 0.7241, 0.7252, 0.457, 0.3653, 0.457, 0.838, 0.5, 0.5, 0.6748, 0.7158, 0.5928,
+    0.7158, 0.6783, 0.435, 0.7158, 0.7119, 0.3428, 0.3428, 0.665, 0.3428, 1.042, 0.7119,
+    0.687, 0.7158, 0.7158, 0.4931, 0.5952, 0.478, 0.7119, 0.6519, 0.9239, 0.645, 0.6519,
+    0.582, 0.7119, 0.3653, 0.7119, 0.838, 0.6392, 1, 0.5, 1, 0.3798, 0.3798, 0.6572,
+    0.6572, 0.6958, 0.6958, 0.6958, 0.5, 0.838, 0.838, 0.838, 0.5, 1, 1, 1,
+)
+
+# font weight -> char -> advance in points at 1pt
+ADVANCES: Dict[str, Dict[str, float]] = {
+    "normal": dict(zip(CHARS, _NORMAL)),
+    "bold": dict(zip(CHARS, _BOLD)),
+}
@@ -0,0 +1,204 @@
+"""
+Shared figure plumbing for the framework ``plot`` methods.
+
+Interactive plots go through pyplot as before. Headless plots (``show=False``)
+build a standalone ``Figure`` that pyplot never tracks, so batch rendering
+leaves no global state behind. Output can go to a file, a writable buffer or
+straight back as bytes.
+
+Figures that are not handed back to the caller are closed as soon as their
+output is written: dropped from pyplot and stripped of artists and pixel
+buffer, so a long-running process does not wait on the garbage collector for
+megabytes per chart. ``closing`` (and ``figure_context`` behind each
+framework's ``figure()`` method) gives callers the same guarantee for the
+figures they keep.
+"""
+
+import io
+import sys
+import weakref
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, ContextManager, Iterator, List, Optional, Tuple, Union
+
+DEFAULT_DPI = 300  # print quality for saved files; pass a lower dpi for thumbnails
+FORMATS = ("png", "svg", "pdf", "webp", "jpg", "jpeg", "eps", "ps", "tif", "tiff")
+
+# figure -> callbacks that need its final layout (run by ``finish``); figures
+# from ``new_canvas`` get an entry until they are finished
+_AFTER_LAYOUT: "weakref.WeakKeyDictionary[Any, List[Callable[[], None]]]" = weakref.WeakKeyDictionary()
+
+
+def is_interactive_backend() -> bool:
+    """Whether pyplot would open a window (or notebook output) on ``show()``."""
+    import matplotlib
+
+    try:
+        from matplotlib.backends import BackendFilter, backend_registry
+        headless = backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE)
+    except ImportError:  # matplotlib < 3.9
+        from matplotlib.rcsetup import non_interactive_bk as headless
+    return matplotlib.get_backend().lower() not in {name.lower() for name in headless}
+
+
+def resolve_show(show: Optional[bool], return_bytes: bool = False,
+                 buffer: Optional[BinaryIO] = None) -> bool:
+    """
+    Decide whether a plot is shown.
+
+    ``None`` means automatic: show on an interactive backend unless the
+    caller asked for bytes or a buffer, otherwise draw headless.
+    """
+    if show is not None:
+        return show
+    if return_bytes or buffer is not None:
+        return False
+    return is_interactive_backend()
+
+
+def new_canvas(figsize: Tuple[float, float], show: bool) -> Any:
+    """Create an empty figure, registered with pyplot only when it will be shown."""
+    if show:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=figsize)
+    else:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    _AFTER_LAYOUT[fig] = []  # laid out by finish()
+    return fig
+
+
+def close(fig: Any) -> None:
+    """
+    Release ``fig`` now rather than at the next garbage collection.
+
+    Removes it from pyplot (if it was ever registered there), clears its
+    artists and swaps in a bare canvas so the Agg pixel buffer is freed.
+    The figure must not be drawn again.
+    """
+    if fig is None:
+        return
+    from matplotlib.backend_bases import FigureCanvasBase
+
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        pyplot.close(fig)
+    fig.clear()
+    FigureCanvasBase(fig)
+
+
+@contextmanager
+def closing(fig: Any) -> Iterator[Any]:
+    """Yield ``fig`` and ``close`` it when the block ends, even on error."""
+    try:
+        yield fig
+    finally:
+        close(fig)
+
+
+def figure_context(plot: Callable[..., Any], **plot_kw: Any) -> ContextManager[Any]:
+    """
+    Draw a chart headless and close its figure when the ``with`` block ends.
+
+    Backs the ``figure()`` method of each framework: nothing is left
+    registered with pyplot and the figure's memory is released on exit,
+    even if the block raises.
+
+    Args:
+        plot: A framework plot method (``swot.plot``, ``pestel.plot_impact_matrix``)
+        **plot_kw: Drawing options for it (e.g. ``figsize``)
+
+    Example:
+        >>> with swot.figure(figsize=(8, 6)) as fig:
+        ...     fig.savefig("swot.png", dpi=150)
+    """
+    return closing(plot(show=False, **plot_kw))
+
+
+def new_figure(figsize: Tuple[float, float], show: bool, **subplot_kw: Any) -> Tuple[Any, Any]:
+    """Create ``(fig, ax)`` with a single subplot."""
+    fig = new_canvas(figsize, show)
+    return fig, fig.add_subplot(**subplot_kw)
+
+
+def after_layout(fig: Any, callback: Callable[[], None]) -> None:
+    """
+    Run ``callback`` once ``finish`` has laid out ``fig``.
+
+    For drawing that depends on the final size of an axes (text fitted to a
+    box), which is only known once every panel and title is in place.
+    Figures that ``finish`` will not lay out (not from ``new_canvas``, or
+    already finished) run ``callback`` straight away.
+    """
+    callbacks = _AFTER_LAYOUT.get(fig)
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+def tight_layout(fig: Any, rect: Tuple[float, float, float, float] = (0, 0, 1, 1)) -> None:
+    """Fit the subplots into ``rect`` of the figure, once."""
+    try:
+        from matplotlib.layout_engine import TightLayoutEngine
+    except ImportError:  # matplotlib < 3.6, where tight_layout() leaves nothing behind
+        fig.tight_layout(rect=rect)
+        return
+    # Same as fig.tight_layout(), minus the placeholder layout engine it leaves
+    # behind, which would make every untrimmed savefig draw the figure twice
+    TightLayoutEngine(rect=rect).execute(fig)
+
+
+def encode(fig: Any, format: str = "png", dpi: float = DEFAULT_DPI,
+           bbox_inches: Optional[str] = 'tight') -> bytes:
+    """Render ``fig`` to image bytes without touching the filesystem."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format, dpi=dpi, bbox_inches=bbox_inches)
+    return buffer.getvalue()
+
+
+def finish(fig: Any, save_path: Optional[str], show: bool, format: Optional[str] = None,
+           dpi: float = DEFAULT_DPI, return_bytes: bool = False,
+           buffer: Optional[BinaryIO] = None,
+           bbox_inches: Optional[str] = 'tight',
+           layout_rect: Tuple[float, float, float, float] = (0, 0, 1, 1)) -> Union[None, bytes, Any]:
+    """
+    Lay out, write the requested outputs and optionally show.
+
+    ``bbox_inches='tight'`` crops each output to its content, which costs an
+    extra draw per output; pass None when ``tight_layout`` already fits it.
+    ``layout_rect`` is the figure area the subplots are fitted into;
+    ``after_layout`` callbacks run once it is laid out.
+
+    The figure is closed unless it is returned or still on screen.
+
+    Returns:
+        Image bytes when ``return_bytes``; otherwise the figure when it was
+        not shown, else None
+    """
+    if format is not None and format.lower() not in FORMATS:
+        raise ValueError(f"Unsupported format {format!r}; expected one of {', '.join(FORMATS)}")
+    tight_layout(fig, layout_rect)
+    for callback in _AFTER_LAYOUT.pop(fig, ()):
+        callback()
+    if save_path:
+        fig.savefig(save_path, format=format, dpi=dpi, bbox_inches=bbox_inches)
+    data = None
+    if return_bytes or buffer is not None:
+        data = encode(fig, format or "png", dpi, bbox_inches)
+        if buffer is not None:
+            buffer.write(data)
+    if show:
+        import matplotlib.pyplot as plt
+        plt.show()
+        # A blocking show() returns once its window is closed (at once on a
+        # headless backend); in interactive mode the window is still up
+        if not (plt.isinteractive() and is_interactive_backend()):
+            close(fig)
+    elif return_bytes:
+        close(fig)
+    if return_bytes:
+        return data
+    return None if show else fig
@@ -4,9 +4,28 @@ Ansoff Matrix (Product/Market Expansion Grid)
 Analyzes growth strategies based on products and markets.
 """
 
-from typing import List, Optional, Dict
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+from typing import Any, ContextManager, BinaryIO, List, Optional, Dict
+
+from business_frameworks._plotting import DEFAULT_DPI, figure_context, finish, new_figure, resolve_show
+from business_frameworks.text_layout import draw_fitted
+
+# Initiative text area inside each unit quadrant (data units), above the CURRENT marker
+ITEM_LEFT, ITEM_TOP, ITEM_WIDTH, ITEM_HEIGHT = 0.05, 0.70, 0.92, 0.58
+
+# Quadrant colours by risk level
+STRATEGY_COLORS = {
+    'Market Penetration': '#90EE90',      # Light green (low risk)
+    'Market Development': '#FFD700',      # Gold (medium risk)
+    'Product Development': '#FFA500',     # Orange (medium risk)
+    'Diversification': '#FF6347',         # Tomato red (high risk)
+}
+# (strategy, x, y) of each unit quadrant in the 2x2 grid
+QUADRANTS = [
+    ('Market Penetration', 0, 1),
+    ('Market Development', 1, 1),
+    ('Product Development', 0, 0),
+    ('Diversification', 1, 0),
+]
 
 
 class AnsoffMatrix:
@@ -127,39 +146,96 @@ class AnsoffMatrix:
         print(report)
         return report
     
-    def plot(self, figsize=(12, 10), save_path: Optional[str] = None) -> None:
+    def to_dict(self) -> Dict:
+        """Export analysis to dictionary format."""
+        return {
+            "company": self.company,
+            "current_strategy": self.current_strategy,
+            "strategies": {
+                name: {"initiatives": list(details["initiatives"]), "risk": details["risk"],
+                       "priority": details["priority"]}
+                for name, details in self.strategies.items()
+            },
+        }
+    
+    def _repr_svg_(self) -> str:
+        """Notebook display as SVG (no matplotlib needed)."""
+        from business_frameworks.svg import render_svg
+        return render_svg(self)
+    
+    def figure(self, **plot_kw: Any) -> ContextManager[Any]:
+        """Headless ``plot(**plot_kw)`` figure, closed when the ``with`` block ends."""
+        return figure_context(self.plot, **plot_kw)
+    
+    def plot(self, figsize: Optional[tuple] = None, save_path: Optional[str] = None,
+             show: Optional[bool] = None, format: Optional[str] = None,
+             dpi: Optional[float] = None, return_bytes: bool = False,
+             buffer: Optional[BinaryIO] = None, renderer: Optional[Any] = None) -> Any:
         """
         Create Ansoff Matrix visualization.
         
+        Initiatives are wrapped to the quadrant width at the largest font
+        (9pt down to 7pt) at which they fit; any that still do not fit are
+        summarised as "+N more".
+        
         Args:
-            figsize: Figure size tuple
+            figsize: Figure size tuple (default (12, 10), or the renderer's)
             save_path: Optional path to save figure
+            show: Display the chart; None (default) shows it only on an
+                interactive backend and when no bytes/buffer are requested
+            format: Image format for files, bytes and buffers
+                ('png', 'svg', 'pdf', 'webp', ...; files default to their extension)
+            dpi: Output resolution (default ``DEFAULT_DPI``, or the renderer's;
+                lower it for thumbnails)
+            return_bytes: Return the encoded image instead of the figure
+            buffer: Writable binary file object to receive the image
+            renderer: ``grid_render.GridRenderer`` to draw on instead of a new
+                figure; it reuses its cached static layer across calls, for
+                batches of PNGs at the renderer's size and dpi (ValueError if
+                ``figsize`` or ``dpi`` asks for others)
+
+        Returns:
+            Image bytes when ``return_bytes`` is set; otherwise the matplotlib
+            Figure when it is not shown (None when drawn with a ``renderer``)
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        if renderer is not None:
+            return renderer.plot(self, save_path, show, format, return_bytes, buffer,
+                                 figsize=figsize, dpi=dpi)
+        show = resolve_show(show, return_bytes, buffer)
+        fig, ax = new_figure(figsize or (12, 10), show)
+        self._draw(ax)
+        
+        # Add axis labels
+        fig.text(0.5, 0.95, 'PRODUCTS', ha='center', fontsize=14,
+                fontweight='bold')
+        fig.text(0.25, 0.93, 'EXISTING', ha='center', fontsize=11)
+        fig.text(0.75, 0.93, 'NEW', ha='center', fontsize=11)
+        
+        fig.text(0.08, 0.5, 'MARKETS', va='center', rotation=90,
+                fontsize=14, fontweight='bold')
+        fig.text(0.06, 0.75, 'EXISTING', va='center', rotation=90, fontsize=11)
+        fig.text(0.06, 0.25, 'NEW', va='center', rotation=90, fontsize=11)
+        
+        # Main title
+        fig.suptitle(f'Ansoff Matrix: Growth Strategy Analysis\n{self.company}',
+                    fontsize=16, fontweight='bold', y=0.98)
+        
+        return finish(fig, save_path, show, format=format,
+                      dpi=DEFAULT_DPI if dpi is None else dpi,
+                      return_bytes=return_bytes, buffer=buffer)
+    
+    def _draw(self, ax: Any) -> None:
+        """Draw the four strategy quadrants onto ``ax``."""
+        import matplotlib.patches as mpatches
+        
         ax.set_xlim(0, 2)
         ax.set_ylim(0, 2)
         ax.axis('off')
         
-        # Define colors by risk level
-        colors = {
-            'Market Penetration': '#90EE90',      # Light green (low risk)
-            'Market Development': '#FFD700',      # Gold (medium risk)
-            'Product Development': '#FFA500',     # Orange (medium risk)
-            'Diversification': '#FF6347'          # Tomato red (high risk)
-        }
-        
-        # Define quadrants (strategy, x, y, color)
-        quadrants = [
-            ('Market Penetration', 0, 1, colors['Market Penetration']),
-            ('Market Development', 1, 1, colors['Market Development']),
-            ('Product Development', 0, 0, colors['Product Development']),
-            ('Diversification', 1, 0, colors['Diversification']),
-        ]
-        
-        for strategy, x, y, color in quadrants:
+        for strategy, x, y in QUADRANTS:
             # Draw rectangle
-            rect = mpatches.Rectangle((x, y), 1, 1, linewidth=3,
-                                     edgecolor='black', facecolor=color, alpha=0.3)
+            rect = mpatches.Rectangle((x, y), 1, 1, linewidth=3, edgecolor='black',
+                                     facecolor=STRATEGY_COLORS[strategy], alpha=0.3)
             ax.add_patch(rect)
             
             # Add title
@@ -174,13 +250,9 @@ class AnsoffMatrix:
             
             # Add initiatives
             initiatives = self.strategies[strategy]["initiatives"]
-            y_pos = y + 0.70
             if initiatives:
-                for init in initiatives[:3]:  # Show max 3
-                    text = init if len(init) <= 35 else init[:32] + "..."
-                    ax.text(x + 0.05, y_pos, f"• {text}",
-                           ha='left', va='top', fontsize=9)
-                    y_pos -= 0.12
+                draw_fitted(ax, initiatives, x + ITEM_LEFT, y + ITEM_TOP, ITEM_WIDTH, ITEM_HEIGHT,
+                            min_fontsize=7)
             
             # Highlight current strategy
             if self.current_strategy == strategy:
@@ -190,25 +262,3 @@ class AnsoffMatrix:
                 ax.text(x + 0.5, y + 0.05, "★ CURRENT",
                        ha='center', va='bottom', fontsize=11,
                        fontweight='bold', color='blue')
-        
-        # Add axis labels
-        fig.text(0.5, 0.95, 'PRODUCTS', ha='center', fontsize=14,
-                fontweight='bold')
-        fig.text(0.25, 0.93, 'EXISTING', ha='center', fontsize=11)
-        fig.text(0.75, 0.93, 'NEW', ha='center', fontsize=11)
-        
-        fig.text(0.08, 0.5, 'MARKETS', va='center', rotation=90,
-                fontsize=14, fontweight='bold')
-        fig.text(0.06, 0.75, 'EXISTING', va='center', rotation=90, fontsize=11)
-        fig.text(0.06, 0.25, 'NEW', va='center', rotation=90, fontsize=11)
-        
-        # Main title
-        fig.suptitle(f'Ansoff Matrix: Growth Strategy Analysis\n{self.company}',
-                    fontsize=16, fontweight='bold', y=0.98)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
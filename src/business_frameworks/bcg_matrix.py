@@ -4,11 +4,20 @@ BCG Matrix (Growth-Share Matrix)
 Analyzes business units or products based on market growth and market share.
 """
 
-from typing import List, Optional, Dict, Tuple
-import matplotlib.pyplot as plt
-import numpy as np
+from typing import Any, ContextManager, BinaryIO, List, Optional, Dict, Tuple
 from dataclasses import dataclass
 
+from business_frameworks._plotting import DEFAULT_DPI, figure_context, finish, new_figure, resolve_show
+from business_frameworks.labels import annotate_points
+
+CATEGORY_COLORS = {
+    "Star": "#FFD700",           # Gold
+    "Cash Cow": "#32CD32",       # Lime Green  
+    "Question Mark": "#FF69B4",  # Hot Pink
+    "Dog": "#808080"             # Gray
+}
+CATEGORIES = tuple(CATEGORY_COLORS)
+
 
 @dataclass
 class BusinessUnit:
@@ -143,44 +152,90 @@ class BCGMatrix:
         print(report)
         return report
     
+    def to_arrays(self) -> Dict[str, Any]:
+        """
+        Business units as parallel NumPy arrays.
+        
+        Returns:
+            Dict with 'name', 'market_share', 'market_growth', 'revenue' and
+            'category' (one of ``CATEGORIES``, classified with the same
+            thresholds as ``BusinessUnit.get_category``)
+        """
+        import numpy as np
+        
+        units = self.business_units
+        share = np.fromiter((bu.market_share for bu in units), float, len(units))
+        growth = np.fromiter((bu.market_growth for bu in units), float, len(units))
+        revenue = np.fromiter((bu.revenue for bu in units), float, len(units))
+        high_growth, high_share = growth >= 10, share >= 1.0
+        category = np.select(
+            [high_growth & high_share, high_growth, high_share],
+            ["Star", "Question Mark", "Cash Cow"], default="Dog")
+        return {
+            "name": np.array([bu.name for bu in units], dtype=object),
+            "market_share": share,
+            "market_growth": growth,
+            "revenue": revenue,
+            "category": category,
+        }
+    
+    def figure(self, **plot_kw: Any) -> ContextManager[Any]:
+        """Headless ``plot(**plot_kw)`` figure, closed when the ``with`` block ends."""
+        return figure_context(self.plot, **plot_kw)
+    
     def plot(self, figsize: Tuple[int, int] = (12, 10), 
-             save_path: Optional[str] = None) -> None:
+             save_path: Optional[str] = None, show: Optional[bool] = None,
+             max_labels: Optional[int] = 30, format: Optional[str] = None, dpi: float = DEFAULT_DPI,
+             return_bytes: bool = False, buffer: Optional[BinaryIO] = None) -> Any:
         """
         Create BCG Matrix visualization with bubble chart.
         
+        Draws one scatter per category, so large portfolios (thousands of
+        units) plot in about a second.
+        
         Args:
             figsize: Figure size tuple
             save_path: Optional path to save figure
+            show: Display the chart; None (default) shows it only on an
+                interactive backend and when no bytes/buffer are requested
+            format: Image format for files, bytes and buffers
+                ('png', 'svg', 'pdf', 'webp', ...; files default to their extension)
+            dpi: Output resolution (lower it for thumbnails)
+            return_bytes: Return the encoded image instead of the figure
+            buffer: Writable binary file object to receive the image
+            max_labels: Label at most this many units, largest revenue first
+                (None = all); labels that would overlap are moved or dropped
+        
+        Returns:
+            Image bytes when ``return_bytes`` is set; otherwise the matplotlib
+            Figure when it is not shown
         """
         if not self.business_units:
             print("No business units to plot. Add units first.")
-            return
+            return None
         
-        fig, ax = plt.subplots(figsize=figsize)
+        show = resolve_show(show, return_bytes, buffer)
+        fig, ax = new_figure(figsize, show)
+        self._draw(ax, max_labels)
         
-        # Define colors for each quadrant
-        colors_map = {
-            "Star": "#FFD700",           # Gold
-            "Cash Cow": "#32CD32",       # Lime Green  
-            "Question Mark": "#FF69B4",  # Hot Pink
-            "Dog": "#808080"             # Gray
-        }
+        return finish(fig, save_path, show, format=format, dpi=dpi,
+                      return_bytes=return_bytes, buffer=buffer)
+    
+    def _draw(self, ax: Any, max_labels: Optional[int] = 30) -> None:
+        """Draw the bubbles, quadrants and labels onto ``ax``."""
+        import numpy as np
         
-        # Plot each business unit
-        for bu in self.business_units:
-            category = bu.get_category()
-            color = colors_map[category]
-            
+        data = self.to_arrays()
+        share, growth = data["market_share"], data["market_growth"]
+        
+        # One scatter per category, in order of first appearance (legend order)
+        _, first = np.unique(data["category"], return_index=True)
+        for category in data["category"][np.sort(first)]:
+            mask = data["category"] == category
             # Bubble size proportional to revenue
-            size = bu.revenue * 5
-            
-            ax.scatter(bu.market_share, bu.market_growth, 
-                      s=size, alpha=0.6, c=color, edgecolors='black', 
-                      linewidth=2, label=category if category not in ax.get_legend_handles_labels()[1] else "")
-            
-            # Add labels
-            ax.annotate(bu.name, (bu.market_share, bu.market_growth),
-                       fontsize=9, ha='center', va='center', fontweight='bold')
+            ax.scatter(share[mask], growth[mask], s=data["revenue"][mask] * 5,
+                       alpha=0.6, c=CATEGORY_COLORS[category], edgecolors='black',
+                       linewidth=2, label=category)
         
         # Draw quadrant lines
         ax.axhline(y=10, color='black', linestyle='--', linewidth=2, alpha=0.7)
@@ -204,20 +259,18 @@ class BCGMatrix:
                     fontsize=14, fontweight='bold', pad=20)
         
         # Set reasonable axis limits
-        max_share = max(bu.market_share for bu in self.business_units) * 1.2
-        max_growth = max(bu.market_growth for bu in self.business_units) * 1.2
-        ax.set_xlim(0, max(max_share, 2.5))
-        ax.set_ylim(0, max(max_growth, 30))
+        ax.set_xlim(0, max(share.max() * 1.2, 2.5))
+        ax.set_ylim(0, max(growth.max() * 1.2, 30))
         
         ax.grid(True, alpha=0.3)
         ax.legend(loc='upper right', fontsize=10)
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        plt.show()
+        # Label the largest units first; crowded labels move aside or are dropped
+        labelled = np.arange(len(share))
+        if max_labels is not None and len(labelled) > max_labels:
+            labelled = np.argpartition(-data["revenue"], max_labels)[:max(max_labels, 0)]
+        annotate_points(ax, share[labelled], growth[labelled], data["name"][labelled],
+                        priority=data["revenue"][labelled], fontsize=9, fontweight='bold')
     
     def to_dict(self) -> Dict:
         """Export analysis to dictionary."""
@@ -235,3 +288,8 @@ class BCGMatrix:
             ],
             "portfolio_summary": self.get_portfolio_summary()
         }
+    
+    def _repr_svg_(self) -> str:
+        """Notebook display as SVG (no matplotlib needed)."""
+        from business_frameworks.svg import render_svg
+        return render_svg(self)
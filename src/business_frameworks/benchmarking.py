@@ -0,0 +1,193 @@
+"""
+Peer Benchmarking - Side-by-Side Comparison of a Set of Companies
+
+Builds one comparison table (Porter ratings, financial metrics, SWOT counts
+and overlapping competitors) for several companies in a single pass: each
+document is loaded once through the loader's shared cache and the numeric
+comparison is done on NumPy arrays.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from business_frameworks.company_data import CompanyDataLoader
+from business_frameworks.financial_metrics import (RAW_FIELDS, RANKED_METRICS, FinancialMetrics,
+                                                    _financial_row)
+
+
+FORCES = {
+    "competitive_rivalry": "Competitive Rivalry",
+    "supplier_power": "Supplier Power",
+    "buyer_power": "Buyer Power",
+    "threat_of_substitutes": "Threat of Substitutes",
+    "threat_of_new_entrants": "Threat of New Entrants",
+}
+SWOT_SECTIONS = ("strengths", "weaknesses", "opportunities", "threats")
+
+
+class PeerComparison:
+    """
+    Result of ``compare_companies``.
+
+    Attributes:
+        tickers: Tickers in the order given
+        names: Company names
+        porter_ratings: (n_companies x 5) array of force ratings, in ``FORCES`` order
+        financials: ``FinancialMetrics`` for the peer set, with percentiles
+            ranked within the peers (not the whole industry)
+        swot_counts: (n_companies x 4) array of SWOT item counts
+        shared_competitors: Competitor name -> tickers that list it (2+ only)
+    """
+
+    def __init__(self, tickers: List[str], names: List[str], industries: List[str],
+                 porter_ratings: np.ndarray, financials: FinancialMetrics,
+                 swot_counts: np.ndarray, competitors: List[List[str]]):
+        self.tickers = tickers
+        self.names = names
+        self.industries = industries
+        self.porter_ratings = porter_ratings
+        self.financials = financials
+        self.swot_counts = swot_counts
+        self.competitors = competitors
+
+        listed_by: Dict[str, List[str]] = {}
+        for ticker, names_listed in zip(tickers, competitors):
+            for name in names_listed:
+                listed_by.setdefault(name, []).append(ticker)
+        self.shared_competitors = {
+            name: owners for name, owners in sorted(listed_by.items()) if len(owners) > 1
+        }
+
+    def table(self) -> Dict[str, List]:
+        """Column-oriented data table, one entry per company in each column."""
+        table: Dict[str, List] = {
+            "ticker": list(self.tickers),
+            "name": list(self.names),
+            "industry": list(self.industries),
+        }
+        for i, label in enumerate(FORCES.values()):
+            table[label] = _nan_to_none(self.porter_ratings[:, i])
+        table["Porter Average"] = _nan_to_none(self.porter_ratings.mean(axis=1).round(2))
+        for metric in RANKED_METRICS:
+            table[metric] = _nan_to_none(self.financials.values[metric])
+            table[f"{metric}_peer_percentile"] = _nan_to_none(self.financials.percentiles[metric])
+        for i, section in enumerate(SWOT_SECTIONS):
+            table[section] = self.swot_counts[:, i].tolist()
+        table["competitors"] = [list(c) for c in self.competitors]
+        return table
+
+    def to_dict(self) -> Dict:
+        """Export comparison to dictionary format."""
+        return {"table": self.table(), "shared_competitors": dict(self.shared_competitors)}
+
+    def generate_report(self) -> str:
+        """Generate a side-by-side text report."""
+        label_width = 26
+        width = max(14, max(len(t) for t in self.tickers) + 2)
+        line = "=" * (label_width + width * len(self.tickers))
+
+        def row(label: str, cells: Iterable[str]) -> str:
+            return f"{label:<{label_width}}" + "".join(f"{c:>{width}}" for c in cells) + "\n"
+
+        report = f"\n{line}\nPEER BENCHMARK: {', '.join(self.names)}\n{line}\n\n"
+        report += row("", self.tickers)
+
+        report += "\nPORTER'S FIVE FORCES (1-5)\n"
+        for i, label in enumerate(FORCES.values()):
+            report += row(label, (f"{r:.0f}" if np.isfinite(r) else "n/a"
+                                  for r in self.porter_ratings[:, i]))
+        report += row("Average", (f"{r:.2f}" if np.isfinite(r) else "n/a"
+                                  for r in self.porter_ratings.mean(axis=1)))
+
+        report += "\nFINANCIALS (peer percentile)\n"
+        fin = self.financials
+        for metric, label in RANKED_METRICS.items():
+            cells = []
+            for value, pct in zip(fin.values[metric], fin.percentiles[metric]):
+                cells.append("n/a" if not np.isfinite(value) else
+                             f"{_short(metric, value)} ({pct * 100:.0f})")
+            report += row(label, cells)
+
+        report += "\nSWOT ITEMS\n"
+        for i, section in enumerate(SWOT_SECTIONS):
+            report += row(section.title(), (str(int(c)) for c in self.swot_counts[:, i]))
+
+        report += "\nOVERLAPPING COMPETITORS\n"
+        if self.shared_competitors:
+            for name, owners in self.shared_competitors.items():
+                report += f"  • {name}: {', '.join(owners)}\n"
+        else:
+            report += "  • None\n"
+        report += f"{line}\n"
+
+        print(report)
+        return report
+
+
+def _nan_to_none(values: np.ndarray) -> List[Optional[float]]:
+    return [float(v) if np.isfinite(v) else None for v in values]
+
+
+def _short(metric: str, value: float) -> str:
+    if metric == "revenue_fy2023":
+        return f"${value / 1e9:.0f}B"
+    if metric == "revenue_per_employee":
+        return f"${value / 1e3:.0f}K"
+    if metric in ("debt_to_equity", "price_to_sales"):
+        return f"{value:.1f}x"
+    return f"{value * 100:.1f}%"
+
+
+def compare_companies(tickers: Iterable[str],
+                      loader: Optional[CompanyDataLoader] = None) -> PeerComparison:
+    """
+    Benchmark several companies against each other in one pass.
+
+    Financial fields that are not numbers ("N/A") are treated as missing,
+    so one untidy document does not stop the comparison.
+
+    Args:
+        tickers: Stock tickers to compare (e.g. ['AAPL', 'MSFT', 'GOOGL']);
+            repeats are compared once
+        loader: Loader to read from (its cache is shared with other calls)
+
+    Returns:
+        PeerComparison with a data table and a side-by-side report
+
+    Example:
+        >>> comparison = compare_companies(['AAPL', 'MSFT'])
+        >>> comparison.generate_report()
+        >>> comparison.table()['profit_margin']
+    """
+    loader = loader or CompanyDataLoader()
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    if not tickers:
+        raise ValueError("Need at least one ticker to compare")
+
+    names: List[str] = []
+    industries: List[str] = []
+    competitors: List[List[str]] = []
+    ratings = np.zeros((len(tickers), len(FORCES)))
+    swot_counts = np.zeros((len(tickers), len(SWOT_SECTIONS)), dtype=np.int64)
+    columns: Dict[str, List[float]] = {field: [] for field in RAW_FIELDS}
+
+    for i, ticker in enumerate(tickers):
+        data = loader._document(ticker)
+        industry, row = _financial_row(data, strict=False)
+        pf = data.get("porters_five_forces", {})
+        swot = data.get("swot_analysis", {})
+
+        names.append(data["meta"]["company_name"])
+        industries.append(industry)
+        ratings[i] = [float(pf.get(force, {}).get("rating", np.nan)) for force in FORCES]
+        swot_counts[i] = [len(swot.get(section, [])) for section in SWOT_SECTIONS]
+        rivalry = pf.get("competitive_rivalry", {})
+        competitors.append([c["name"] for c in rivalry.get("key_competitors", [])])
+        for field, value in zip(RAW_FIELDS, row):
+            columns[field].append(value)
+
+    # One peer group, so percentiles rank each company against the others
+    financials = FinancialMetrics(tickers, ["peers"] * len(tickers), columns)
+    return PeerComparison(tickers, names, industries, ratings, financials,
+                          swot_counts, competitors)
@@ -0,0 +1,247 @@
+"""
+Chart Cache - Rendered Charts Keyed by What They Show
+
+Curated data changes rarely, but charts are requested on every page view.
+ChartCache keys each rendered image by a stable hash of the framework's
+``to_dict()`` content, the render options (engine, format, dpi) and the
+library version, so an unchanged analysis is rendered once and then served as
+bytes. Any edit to the analysis, a different option or a library upgrade gives
+a new key; stale entries simply age out.
+
+Entries live in an in-memory LRU bounded by total bytes, with an optional
+on-disk tier (also size-bounded, least recently used evicted first) that
+survives restarts and can be shared by worker processes.
+
+Example:
+    >>> cache = ChartCache(max_bytes=64 * 2**20, disk_dir=".chart-cache")
+    >>> png = cache.render(loader.get_swot("AAPL"))            # miss: renders
+    >>> png = cache.render(loader.get_swot("AAPL"))            # hit: bytes
+    >>> svg = cache.render(porters, engine="svg", format="svg")
+    >>> cache.stats()["hit_rate"]
+    0.5
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+ENGINES = ("matplotlib", "svg")
+
+
+def chart_key(analysis: Any, **options: Any) -> str:
+    """
+    Stable content hash for a chart.
+
+    Args:
+        analysis: Framework object with ``to_dict()``
+        **options: Render options that change the output (format, dpi, ...)
+
+    Returns:
+        Hex SHA-256 of the framework type, its content, the options and the
+        library version
+    """
+    from business_frameworks import __version__
+
+    if not hasattr(analysis, "to_dict"):
+        raise ValueError(f"{type(analysis).__name__} has no to_dict(); cannot key a chart on it")
+    payload = {
+        "kind": type(analysis).__name__,
+        "data": analysis.to_dict(),
+        "options": options,
+        "version": __version__,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ChartCache:
+    """
+    Size-bounded LRU cache of rendered chart bytes with an optional disk tier.
+
+    Thread-safe. Rendering happens outside the lock, so two threads missing on
+    the same chart may both render it; the result is identical either way.
+
+    Args:
+        max_bytes: Memory budget for cached images
+        disk_dir: Directory for the disk tier (None = memory only)
+        max_disk_bytes: Disk budget (None = unbounded)
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, disk_dir: Optional[Union[str, Path]] = None,
+                 max_disk_bytes: Optional[int] = 1024 * 2**20):
+        if max_bytes < 0 or (max_disk_bytes is not None and max_disk_bytes < 0):
+            raise ValueError("Cache budgets must be non-negative")
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self._disk: "OrderedDict[str, int]" = OrderedDict()  # key -> size, oldest first
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        if self._disk_dir is not None:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+
+    def render(self, analysis: Any, format: str = "png", dpi: int = 100,
+               engine: str = "matplotlib") -> bytes:
+        """
+        Return the chart image, rendering it only on a cache miss.
+
+        Args:
+            analysis: Any framework object
+            format: Image format ('png', 'svg', 'pdf'; 'svg' only for the svg engine)
+            dpi: Resolution (matplotlib engine)
+            engine: 'matplotlib' (``render_figure``) or 'svg' (``business_frameworks.svg``)
+
+        Returns:
+            Encoded image bytes
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+        if engine == "svg" and format != "svg":
+            raise ValueError("The svg engine only produces format='svg'")
+        options = {"engine": engine, "format": format}
+        if engine == "matplotlib":
+            options["dpi"] = dpi
+        key = chart_key(analysis, **options)
+
+        data = self.get(key)
+        if data is None:
+            data = _render(analysis, engine, format, dpi)
+            self.put(key, data)
+        return data
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached bytes for ``key`` (memory, then disk), or None."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+        data = self._read_disk(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store_memory(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store rendered bytes under ``key`` in both tiers."""
+        with self._lock:
+            self._store_memory(key, data)
+        self._write_disk(key, data)
+
+    def clear(self) -> None:
+        """Drop the memory tier (disk entries are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup counters, hit rate and tier sizes."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._memory),
+                "bytes": self._memory_bytes,
+                "evictions": self.evictions,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+                "disk_evictions": self.disk_evictions,
+            }
+
+    # -- memory tier (callers hold the lock) --------------------------------
+
+    def _store_memory(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return  # would evict everything else and still not fit
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    # -- disk tier -------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self._disk_dir / key[:2] / key
+
+    def _scan_disk(self) -> None:
+        """Index existing entries, least recently used first."""
+        entries = []
+        for path in self._disk_dir.glob("??/*"):
+            if path.is_file() and not path.name.endswith(".tmp"):
+                stat = path.stat()
+                entries.append((stat.st_mtime_ns, path.name, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if self._disk_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # mark as recently used for later scans
+        except OSError:
+            return None
+        with self._lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self._disk_dir is None:
+            return
+        if self.max_disk_bytes is not None and len(data) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)  # atomic, so readers never see a partial image
+
+        victims = []
+        with self._lock:
+            self._disk_bytes += len(data) - self._disk.pop(key, 0)
+            self._disk[key] = len(data)
+            while self.max_disk_bytes is not None and self._disk_bytes > self.max_disk_bytes:
+                victim, size = self._disk.popitem(last=False)
+                self._disk_bytes -= size
+                self.disk_evictions += 1
+                victims.append(victim)
+        for victim in victims:
+            try:
+                self._path(victim).unlink()
+            except OSError:
+                pass
+
+
+def _render(analysis: Any, engine: str, format: str, dpi: int) -> bytes:
+    if engine == "svg":
+        from business_frameworks.svg import render_svg
+        return render_svg(analysis).encode("utf-8")
+    from business_frameworks.render_pool import render_figure
+    return render_figure(analysis, format=format, dpi=dpi)
@@ -0,0 +1,302 @@
+"""
+StrategyKit Command Line - Batch Jobs over the Curated Company Universe
+
+    strategykit report  [TICKERS...] [-j N] [-o DIR]
+    strategykit render  [TICKERS...] -o DIR [--frameworks porters,swot] [--format png] [--dpi N]
+    strategykit export  [TICKERS...] [-o DIR]
+    strategykit index build [TICKERS...] [-o DIR]
+    strategykit validate [TICKERS...]
+    strategykit bench   [TICKERS...] [--repeat N]
+
+TICKERS may be tickers, shell-style globs (``'A*'``) or ``@file`` with one
+ticker per line; the default is the whole universe. Every command emits one
+JSON record per ticker: to stdout as JSONL, or into ``DIR/<command>.jsonl``
+next to the written artifacts when ``-o DIR`` is given. ``-j N`` runs tickers
+in N worker processes. Only the standard library is imported until a command
+actually needs the frameworks or matplotlib.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+_LOADERS: Dict[Optional[str], Any] = {}
+
+
+def _loader(data_dir: Optional[str]) -> Any:
+    """One CompanyDataLoader (and document cache) per process and data dir."""
+    if data_dir not in _LOADERS:
+        from business_frameworks.company_data import CompanyDataLoader
+        _LOADERS[data_dir] = CompanyDataLoader(data_dir=data_dir)
+    return _LOADERS[data_dir]
+
+
+def _write(opts: Dict, name: str, text: str) -> Dict:
+    path = Path(opts["out_dir"]) / name
+    path.write_text(text, encoding="utf-8")
+    return {"path": str(path)}
+
+
+# ---------------------------------------------------------------------------
+# Per-ticker tasks. Each returns a JSON-serialisable record.
+# ---------------------------------------------------------------------------
+
+def _task_report(loader: Any, ticker: str, opts: Dict) -> Dict:
+    report = loader.get_company_report(ticker)
+    if opts["out_dir"]:
+        return _write(opts, f"{ticker}.txt", report)
+    return {"report": report}
+
+
+def _task_render(loader: Any, ticker: str, opts: Dict) -> Dict:
+    from business_frameworks.render_pool import render_figure
+
+    paths, seconds = {}, {}
+    for framework in opts["frameworks"]:
+        analysis = getattr(loader, f"get_{framework}")(ticker)
+        path = Path(opts["out_dir"]) / f"{ticker}_{framework}.{opts['format']}"
+        start = time.perf_counter()
+        render_figure(analysis, str(path), opts["format"], opts["dpi"])
+        seconds[framework] = round(time.perf_counter() - start, 4)
+        paths[framework] = str(path)
+    return {"paths": paths, "seconds": seconds}
+
+
+def _task_export(loader: Any, ticker: str, opts: Dict) -> Dict:
+    record = {
+        "porters": loader.get_porters(ticker).to_dict(),
+        "swot": loader.get_swot(ticker).to_dict(),
+    }
+    if opts["out_dir"]:
+        return _write(opts, f"{ticker}.json", json.dumps(record, indent=2))
+    return record
+
+
+def _task_index(loader: Any, ticker: str, opts: Dict) -> Dict:
+    from business_frameworks.evidence import max_fact
+    from business_frameworks.financial_metrics import get_metrics
+
+    data = loader.load_company(ticker)
+    metrics = get_metrics(loader)
+    swot = data["swot_analysis"]
+    return {
+        "name": data["meta"]["company_name"],
+        "industry": data["company_profile"]["industry"],
+        "dataset_version": metrics.version,
+        "porters": {force: details["rating"]
+                    for force, details in data["porters_five_forces"].items()
+                    if isinstance(details, dict) and "rating" in details},
+        "threats": [
+            {"factor": t["factor"], "impact": t.get("impact_score"),
+             "likelihood": t.get("likelihood_score"),
+             "max_percent": max_fact(t, "percent"), "max_amount": max_fact(t, "currency")}
+            for t in swot.get("threats", [])
+        ],
+        "facts": sum(len(item.get("facts", ())) for section in
+                     ("strengths", "weaknesses", "opportunities", "threats")
+                     for item in swot.get(section, [])),
+        "metrics": metrics.rank(ticker) if ticker in metrics else {},
+    }
+
+
+def _task_validate(loader: Any, ticker: str, opts: Dict) -> Dict:
+    from business_frameworks.company_data import validate_document
+
+    try:
+        problems = validate_document(loader.load_company(ticker))
+    except ValueError as exc:  # unreadable JSON
+        problems = [str(exc)]
+    record: Dict[str, Any] = {"valid": not problems, "problems": problems}
+    if problems:
+        record["error"] = f"{len(problems)} problem(s)"
+    return record
+
+
+def _task_bench(loader: Any, ticker: str, opts: Dict) -> Dict:
+    timings: Dict[str, float] = {}
+    steps = {
+        "load": lambda: loader._read_document(ticker),
+        "porters": lambda: loader.get_porters(ticker),
+        "swot": lambda: loader.get_swot(ticker),
+        "report": lambda: loader.get_company_report(ticker),
+    }
+    for name, step in steps.items():
+        best = float("inf")
+        for _ in range(opts["repeat"]):
+            start = time.perf_counter()
+            step()
+            best = min(best, time.perf_counter() - start)
+        timings[f"{name}_ms"] = round(best * 1000, 3)
+    return timings
+
+
+_TASKS: Dict[str, Callable[[Any, str, Dict], Dict]] = {
+    "report": _task_report,
+    "render": _task_render,
+    "export": _task_export,
+    "index": _task_index,
+    "validate": _task_validate,
+    "bench": _task_bench,
+}
+
+
+def _run_task(job: tuple) -> Dict:
+    """Run one (command, ticker, opts) job; module-level so it pickles."""
+    command, ticker, opts = job
+    try:
+        record = _TASKS[command](_loader(opts["data_dir"]), ticker, opts)
+    except Exception as exc:
+        record = {"error": f"{type(exc).__name__}: {exc}"}
+    return {"ticker": ticker, **record}
+
+
+def _run_all(command: str, tickers: List[str], opts: Dict, jobs: int) -> Iterator[Dict]:
+    """Yield records in ticker order, using a process pool when jobs > 1."""
+    work = [(command, ticker, opts) for ticker in tickers]
+    if jobs <= 1 or len(work) <= 1:
+        yield from map(_run_task, work)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, len(work) // (jobs * 4))
+        yield from pool.map(_run_task, work, chunksize=chunksize)
+
+
+def resolve_tickers(patterns: Sequence[str], available: Sequence[str]) -> List[str]:
+    """
+    Expand tickers and globs against the available universe.
+
+    Plain tickers are kept even if unknown (so the command reports an error
+    for them); globs only match existing tickers. Order follows the
+    patterns, duplicates are dropped.
+    """
+    if not patterns:
+        return list(available)
+    selected: List[str] = []
+    seen = set()
+    for pattern in patterns:
+        pattern = pattern.strip().upper()
+        if not pattern:
+            continue
+        if any(ch in pattern for ch in "*?["):
+            matches = fnmatch.filter(available, pattern)
+        else:
+            matches = [pattern]
+        for ticker in matches:
+            if ticker not in seen:
+                seen.add(ticker)
+                selected.append(ticker)
+    return selected
+
+
+def _shard(tickers: List[str], spec: Optional[str]) -> List[str]:
+    if not spec:
+        return tickers
+    from business_frameworks.sharding import shard_of
+
+    index, _, total = spec.partition("/")
+    index, total = int(index), int(total)
+    if not 0 <= index < total:
+        raise ValueError(f"Invalid shard {spec!r}; expected I/N with 0 <= I < N")
+    return [t for t in tickers if shard_of(t, total) == index]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="strategykit",
+        description="Batch strategy analysis over the curated company universe.",
+        fromfile_prefix_chars="@",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("tickers", nargs="*", metavar="TICKER",
+                        help="tickers or globs (default: all); @file reads a list")
+    common.add_argument("-j", "--jobs", type=int, default=1,
+                        help="worker processes (default: 1)")
+    common.add_argument("-o", "--out-dir", help="write artifacts and records here")
+    common.add_argument("--data-dir", help="company data directory (default: bundled)")
+    common.add_argument("--shard", metavar="I/N",
+                        help="only process shard I of N (stable ticker hash)")
+
+    commands.add_parser("report", parents=[common], help="full text company reports")
+
+    render = commands.add_parser("render", parents=[common], help="framework charts")
+    render.add_argument("--frameworks", default="porters,swot",
+                        help="comma-separated: porters,swot (default: both)")
+    render.add_argument("--format", default="png", choices=["png", "svg", "pdf"])
+    render.add_argument("--dpi", type=int, default=300, help="image resolution (default: 300)")
+
+    commands.add_parser("export", parents=[common], help="framework data as JSON")
+
+    index = commands.add_parser("index", help="universe index")
+    index_commands = index.add_subparsers(dest="index_command", metavar="ACTION")
+    index_commands.required = True
+    index_commands.add_parser("build", parents=[common],
+                              help="facts and metric ranks per company")
+
+    commands.add_parser("validate", parents=[common], help="check data files")
+
+    bench = commands.add_parser("bench", parents=[common], help="time the data path")
+    bench.add_argument("--repeat", type=int, default=5, help="runs per step (best kept)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for the ``strategykit`` console script."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    command = args.command
+
+    if command == "render" and not args.out_dir:
+        parser.error("render needs --out-dir")
+    opts: Dict[str, Any] = {"data_dir": args.data_dir, "out_dir": args.out_dir}
+    if command == "render":
+        opts["frameworks"] = [f.strip() for f in args.frameworks.split(",") if f.strip()]
+        unknown = set(opts["frameworks"]) - {"porters", "swot"}
+        if unknown:
+            parser.error(f"unknown frameworks: {', '.join(sorted(unknown))}")
+        opts["format"] = args.format
+        opts["dpi"] = args.dpi
+    if command == "bench":
+        opts["repeat"] = max(1, args.repeat)
+
+    try:
+        tickers = _shard(resolve_tickers(args.tickers, _loader(args.data_dir).list_tickers()),
+                         args.shard)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+        sink = open(Path(args.out_dir) / f"{command}.jsonl", "w", encoding="utf-8")
+    else:
+        sink = sys.stdout
+
+    start = time.perf_counter()
+    failed = total = 0
+    try:
+        for record in _run_all(command, tickers, opts, args.jobs):
+            total += 1
+            failed += "error" in record
+            sink.write(json.dumps(record) + "\n")
+            sink.flush()
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"{command}: {total - failed} ok, {failed} failed in {elapsed:.2f}s",
+          file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,52 +5,290 @@ Load pre-researched company data from our curated knowledge base.
 All data sourced from authoritative sources (SEC filings, academic cases, etc.)
 """
 
+import copy
+import hashlib
 import json
 import os
+import queue
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, List
-from business_frameworks import PortersFiveForces, SWOT, BCGMatrix, PESTEL
+from typing import Callable, Hashable, Iterable, Iterator, Optional, Dict, List, Tuple, Union
+from business_frameworks.evidence import annotate_document
+from business_frameworks.porters_five_forces import PortersFiveForces
+from business_frameworks.swot import SWOT, SWOTItem
 
 
-class CompanyDataLoader:
-    """Load pre-researched company analysis from our knowledge base."""
+class _Flight:
+    """One in-progress load that concurrent callers wait on."""
+    __slots__ = ("done", "value", "error")
     
     def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class _SingleFlightCache:
+    """
+    Thread-safe memo with single-flight misses.
+    
+    When several threads miss on the same key at once, only the first runs
+    the load; the others wait for its result (or its exception) instead of
+    repeating the work. Failed loads are not cached. With ``max_size`` the
+    least recently used values are evicted beyond that many entries.
+    """
+    
+    def __init__(self, max_size: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._values: "OrderedDict" = OrderedDict()
+        self._inflight: Dict = {}
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.evictions = 0
+    
+    def get(self, key, load: Callable):
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                self._values.move_to_end(key)
+                return self._values[key]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        
+        try:
+            value = load()
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                del self._inflight[key]
+                self.errors += 1
+            flight.done.set()
+            raise
+        flight.value = value
+        with self._lock:
+            self._values[key] = value
+            while self.max_size is not None and len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+                self.evictions += 1
+            del self._inflight[key]
+        flight.done.set()
+        return value
+    
+    def peek(self, key, default=None):
+        """Return a cached value without loading or counting a lookup."""
+        with self._lock:
+            return self._values.get(key, default)
+    
+    def discard_where(self, predicate: Callable) -> None:
+        """Drop cached values whose key matches ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._values if predicate(key)]:
+                del self._values[key]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'size': len(self._values),
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'evictions': self.evictions,
+            }
+
+
+class CompanyDataLoader:
+    """
+    Load pre-researched company analysis from our knowledge base.
+    
+    Parsed documents are cached per loader (least recently used first out
+    beyond ``max_documents``) and re-read when their file changes.
+    ``load_company`` hands every caller its own copy, so editing a result
+    never affects other callers (use ``overlay.OverlayStore`` for per-user
+    edits). The cache is thread-safe: concurrent requests for the same
+    ticker wait on a single file read.
+    
+    Args:
+        data_dir: Directory of ``<TICKER>.json`` files (default: bundled data)
+        cache: Keep parsed documents in memory (default True)
+        max_documents: Most documents kept in memory (None = unbounded)
+    """
+    
+    def __init__(self, data_dir: Optional[Union[str, Path]] = None, cache: bool = True,
+                 max_documents: Optional[int] = 256):
         # Find data directory (now inside the package)
-        current_dir = Path(__file__).parent
-        self.data_dir = current_dir / "data" / "companies"
+        if data_dir is None:
+            data_dir = Path(__file__).parent / "data" / "companies"
+        self.data_dir = Path(data_dir)
+        self._documents = _SingleFlightCache(max_documents) if cache else None
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Document cache counters.
         
-    def list_available_companies(self) -> List[str]:
-        """Get list of companies with curated data available."""
+        ``misses`` counts file reads, ``coalesced`` counts requests that
+        waited on another thread's in-flight read instead of reading again.
+        """
+        if self._documents is None:
+            return {'size': 0, 'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0, 'evictions': 0}
+        return self._documents.stats()
+    
+    def clear_cache(self) -> None:
+        """Forget cached documents (e.g. after the data files changed)."""
+        if self._documents is not None:
+            self._documents.clear()
+    
+    def list_tickers(self) -> List[str]:
+        """Get sorted tickers with curated data (no files are parsed)."""
         if not self.data_dir.exists():
             return []
+        return sorted(file.stem for file in self.data_dir.glob("*.json"))
         
+    def dataset_version(self) -> str:
+        """
+        Short hash identifying the current state of the data files.
+        
+        Built from file names, sizes and modification times, so it is cheap
+        (no parsing) and changes whenever a company file is edited, added or
+        removed. Used to key derived caches such as universe metrics.
+        """
+        digest = hashlib.sha1()
+        if self.data_dir.exists():
+            for file in sorted(self.data_dir.glob("*.json")):
+                stat = file.stat()
+                digest.update(f"{file.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()[:16]
+    
+    def _cache_scope(self) -> Hashable:
+        """Identity of the data this loader sees, for caches derived from it."""
+        return str(self.data_dir.resolve())
+        
+    def list_available_companies(self) -> List[str]:
+        """Get list of companies with curated data available."""
         companies = []
-        for file in self.data_dir.glob("*.json"):
-            ticker = file.stem
-            with open(file, 'r') as f:
-                data = json.load(f)
-                companies.append({
-                    'ticker': ticker,
-                    'name': data['meta']['company_name'],
-                    'quality_score': data['meta']['data_quality_score'],
-                    'last_updated': data['meta']['last_updated']
-                })
+        for ticker, data in self.iter_companies(sections=['meta']):
+            companies.append({
+                'ticker': ticker,
+                'name': data['meta']['company_name'],
+                'quality_score': data['meta']['data_quality_score'],
+                'last_updated': data['meta']['last_updated']
+            })
         
         return companies
     
     def load_company(self, ticker: str) -> Dict:
-        """Load all data for a specific company."""
-        file_path = self.data_dir / f"{ticker.upper()}.json"
+        """Load all data for a specific company (a copy the caller may modify)."""
+        if self._documents is None:
+            return self._read_document(ticker.upper())
+        return copy.deepcopy(self._document(ticker))
+    
+    def _document(self, ticker: str) -> Dict:
+        """The shared parsed document; callers inside the package only read it."""
+        ticker = ticker.upper()
+        if self._documents is None:
+            return self._read_document(ticker)
+        return self._documents.get(self._cache_key(ticker), lambda: self._read_document(ticker))
+    
+    def _cache_key(self, ticker: str) -> Tuple:
+        """Ticker plus file size and mtime, so an edited file misses the cache."""
+        try:
+            stat = (self.data_dir / f"{ticker}.json").stat()
+        except OSError:
+            return (ticker, None)  # the read reports the missing file
+        return (ticker, stat.st_size, stat.st_mtime_ns)
+    
+    def _read_document(self, ticker: str) -> Dict:
+        file_path = self.data_dir / f"{ticker}.json"
         
         if not file_path.exists():
-            available = [c['ticker'] for c in self.list_available_companies()]
             raise ValueError(
-                f"No data for {ticker}. Available companies: {available}"
+                f"No data for {ticker}. Available companies: {self.list_tickers()}"
             )
         
         with open(file_path, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
+        # Parse numbers out of evidence text once, at ingest time
+        return annotate_document(data)
+    
+    def iter_companies(
+        self,
+        filter: Optional[Callable[[str], bool]] = None,
+        sections: Optional[Iterable[str]] = None,
+        prefetch: int = 2,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream company documents in ticker order with bounded memory.
+        
+        Only ``prefetch`` documents are ever held ahead of the consumer, so
+        memory stays flat however large the universe is. Stages can be
+        chained as ordinary generators.
+        
+        Args:
+            filter: Optional predicate on the ticker, applied before the file
+                is read
+            sections: Optional top-level sections to keep (e.g.
+                ``['meta', 'financial_overview']``); the rest of each
+                document is dropped as soon as it is parsed
+            prefetch: Number of documents read ahead on a background thread
+                (0 reads synchronously)
+            on_error: Called as ``on_error(ticker, exc)`` for a document that
+                cannot be read, which is then skipped; by default the error
+                is raised and the stream ends
+        
+        Yields:
+            ``(ticker, data)`` tuples; like ``load_company``, each document
+            is the consumer's to modify
+        
+        Example:
+            >>> loader = CompanyDataLoader()
+            >>> docs = loader.iter_companies(sections=['financial_overview'])
+            >>> margins = ((t, d['financial_overview']['profit_margin']) for t, d in docs)
+            >>> high = [t for t, m in margins if m > 0.2]
+        """
+        tickers = [t for t in self.list_tickers() if filter is None or filter(t)]
+        keep = list(sections) if sections is not None else None
+        
+        def read(ticker: str) -> Optional[Dict]:
+            # Streaming must not fill the document cache, but may use it.
+            cached = (self._documents.peek(self._cache_key(ticker))
+                      if self._documents is not None else None)
+            try:
+                data = cached if cached is not None else self._read_document(ticker)
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(ticker, exc)
+                return None
+            if keep is not None:
+                data = {name: data[name] for name in keep if name in data}
+            # A cached document is shared with load_company(); a fresh read is ours
+            return copy.deepcopy(data) if cached is not None else data
+        
+        stream = (((ticker, read(ticker)) for ticker in tickers) if prefetch <= 0
+                  else _prefetched(tickers, read, prefetch))
+        for ticker, data in stream:
+            if data is not None:
+                yield ticker, data
     
     def get_porters(self, ticker: str) -> PortersFiveForces:
         """
@@ -67,7 +305,7 @@ class CompanyDataLoader:
             >>> porters = loader.get_porters('AAPL')
             >>> porters.generate_report()
         """
-        data = self.load_company(ticker)
+        data = self._document(ticker)
         pf = data['porters_five_forces']
         
         # Create Porter's Five Forces
@@ -108,27 +346,30 @@ class CompanyDataLoader:
             >>> swot = loader.get_swot('AAPL')
             >>> swot.plot()
         """
-        data = self.load_company(ticker)
+        data = self._document(ticker)
         swot_data = data['swot_analysis']
         
-        # Extract just the factor text with evidence
+        # Keep the structured fields; text is only formatted when displayed
         strengths = [
-            f"{s['factor']} ({s['evidence']})" 
+            SWOTItem(s['factor'], evidence=s.get('evidence'), source=s.get('source'))
             for s in swot_data['strengths']
         ]
         
         weaknesses = [
-            f"{w['factor']} ({w['evidence']})" 
+            SWOTItem(w['factor'], evidence=w.get('evidence'), source=w.get('source'))
             for w in swot_data['weaknesses']
         ]
         
         opportunities = [
-            f"{o['factor']} - {o['potential']}" 
+            SWOTItem(o['factor'], evidence=o.get('evidence'), source=o.get('source'),
+                     potential=o.get('potential'), timeframe=o.get('timeframe'))
             for o in swot_data['opportunities']
         ]
         
         threats = [
-            f"{t['factor']} (Impact: {t['impact']}/5, Likelihood: {t['likelihood']}/5)" 
+            SWOTItem(t['factor'], evidence=t.get('evidence'), source=t.get('source'),
+                     impact=_rating(t, 'impact'), likelihood=_rating(t, 'likelihood'),
+                     timeframe=t.get('timeframe'))
             for t in swot_data['threats']
         ]
         
@@ -150,7 +391,7 @@ class CompanyDataLoader:
         Returns:
             Formatted text report with citations
         """
-        data = self.load_company(ticker)
+        data = self._document(ticker)
         
         report = f"\n{'='*80}\n"
         report += f"COMPREHENSIVE STRATEGIC ANALYSIS: {data['meta']['company_name']}\n"
@@ -183,6 +424,7 @@ class CompanyDataLoader:
         report += f"Market Cap: ${fin['market_cap']/1e9:.0f}B\n"
         report += f"Profit Margin: {fin['profit_margin']*100:.1f}%\n"
         report += f"Source: {fin['source']}\n\n"
+        report += self._industry_rank_section(ticker)
         
         # Porter's Five Forces Summary
         report += f"{'='*80}\n"
@@ -254,6 +496,134 @@ class CompanyDataLoader:
         return report
 
 
+    def _industry_rank_section(self, ticker: str) -> str:
+        """
+        Percentile ranks of the company's financials within its industry.
+        
+        Ranks are a bonus on top of the company's own data, so a universe
+        that cannot be ranked (or a company left out of it) shows "n/a"
+        rather than failing the report.
+        """
+        from business_frameworks.financial_metrics import RANKED_METRICS, get_metrics
+        
+        try:
+            metrics = get_metrics(self)
+        except Exception as exc:
+            return f"Industry Rank: n/a ({type(exc).__name__})\n\n"
+        if ticker.upper() in metrics.skipped:
+            return f"Industry Rank: n/a ({metrics.skipped[ticker.upper()]})\n\n"
+        if ticker not in metrics:
+            return ""
+        ranks = metrics.rank(ticker)
+        if not ranks:
+            return ""
+        peers = next(iter(ranks.values()))['peers']
+        noun = "company" if peers == 1 else "companies"
+        section = f"Industry Rank ({metrics.industry_of(ticker)}, {peers} {noun}):\n"
+        for metric, rank in ranks.items():
+            section += (f"  {RANKED_METRICS[metric]}: {rank['percentile']*100:.0f}th percentile "
+                        f"(z = {rank['zscore']:+.2f})\n")
+        return section + "\n"
+
+
+REQUIRED_SECTIONS = ('meta', 'company_profile', 'financial_overview',
+                     'porters_five_forces', 'swot_analysis')
+FORCE_KEYS = ('competitive_rivalry', 'supplier_power', 'buyer_power',
+              'threat_of_substitutes', 'threat_of_new_entrants')
+
+
+def validate_document(data: Dict) -> List[str]:
+    """
+    Check a company document against the structure the loader relies on.
+    
+    Returns:
+        List of problems (empty when the document is valid)
+    """
+    problems = [f"missing section '{name}'" for name in REQUIRED_SECTIONS if name not in data]
+    if problems:
+        return problems
+    
+    for field in ('ticker', 'company_name', 'data_quality_score', 'last_updated'):
+        if field not in data['meta']:
+            problems.append(f"meta: missing '{field}'")
+    
+    pf = data['porters_five_forces']
+    for force in FORCE_KEYS:
+        rating = pf.get(force, {}).get('rating')
+        if not isinstance(rating, int) or not 1 <= rating <= 5:
+            problems.append(f"porters_five_forces.{force}: rating must be 1-5, got {rating!r}")
+    
+    swot = data['swot_analysis']
+    for section in ('strengths', 'weaknesses', 'opportunities', 'threats'):
+        for i, item in enumerate(swot.get(section, [])):
+            if not item.get('factor'):
+                problems.append(f"swot_analysis.{section}[{i}]: missing 'factor'")
+    for i, threat in enumerate(swot.get('threats', [])):
+        for name in ('impact', 'likelihood'):
+            score = _rating(threat, name)
+            if score is None or not 1 <= score <= 5:
+                problems.append(f"swot_analysis.threats[{i}]: {name} must be 1-5, "
+                                f"got {threat.get(name)!r}")
+    
+    fin = data['financial_overview']
+    for field in ('revenue_fy2023', 'net_income_fy2023', 'market_cap', 'profit_margin'):
+        if not isinstance(fin.get(field), (int, float)):
+            problems.append(f"financial_overview: '{field}' must be a number")
+    return problems
+
+
+def _rating(item: Dict, name: str) -> Optional[int]:
+    """Integer 1-5 rating (curated files store these as strings)."""
+    try:
+        return int(item[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+_END = object()
+
+
+def _prefetched(tickers: List[str], read: Callable[[str], Dict],
+                depth: int) -> Iterator[Tuple[str, Dict]]:
+    """Read documents on a background thread through a bounded queue."""
+    buffer: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        for ticker in tickers:
+            try:
+                item = (ticker, read(ticker), None)
+            except Exception as exc:  # re-raised in the consumer
+                item = (ticker, None, exc)
+            if not put(item) or item[2] is not None:
+                return
+        put(_END)
+    
+    worker = threading.Thread(target=produce, name="company-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            ticker, data, error = item
+            if error is not None:
+                raise error
+            yield ticker, data
+    finally:
+        stop.set()
+        worker.join()
+
+
 # Convenience functions for easy access
 def load_company_analysis(ticker: str):
     """
@@ -0,0 +1,150 @@
+"""
+Dashboard - Every Framework for a Company in One Figure
+
+Rendering each framework separately pays for a figure, a layout pass and a
+rasterization five times over. ``render_dashboard`` draws every available
+framework into the subplots of a single figure instead, so the whole company
+view costs one ``tight_layout`` and one rasterization and comes back as one
+artifact (file, buffer or bytes).
+
+Example:
+    >>> png = render_dashboard("AAPL", return_bytes=True)
+    >>> render_dashboard([swot, porters, bcg], layout=(1, 3),
+    ...                  save_path="dashboard.pdf", format="pdf")
+"""
+
+import math
+from typing import Any, BinaryIO, List, Mapping, Optional, Sequence, Tuple, Union
+
+from business_frameworks._plotting import DEFAULT_DPI, finish, new_canvas, resolve_show
+from business_frameworks.ansoff_matrix import AnsoffMatrix
+from business_frameworks.bcg_matrix import BCGMatrix
+from business_frameworks.pestel import PESTEL
+from business_frameworks.porters_five_forces import PortersFiveForces
+from business_frameworks.swot import SWOT
+
+# Framework types a dashboard can draw
+FRAMEWORKS = (SWOT, PortersFiveForces, PESTEL, BCGMatrix, AnsoffMatrix)
+PANEL_SIZE = (9.0, 7.5)  # inches per panel when no figsize is given
+TITLE_BAND = 0.5  # inches above the panels for the dashboard title
+
+
+def auto_layout(panels: int) -> Tuple[int, int]:
+    """
+    Grid shape for ``panels`` subplots: one row up to two, then two rows.
+
+    Example:
+        >>> auto_layout(5)
+        (2, 3)
+    """
+    if panels < 1:
+        raise ValueError("A dashboard needs at least one framework")
+    if panels <= 2:
+        return 1, panels
+    return 2, math.ceil(panels / 2)
+
+
+def _frameworks(source: Any, loader: Any) -> Tuple[List[Any], Optional[str]]:
+    """Resolve a ticker, mapping or sequence into framework objects and a title."""
+    if isinstance(source, str):
+        if loader is None:
+            from business_frameworks.company_data import CompanyDataLoader
+            loader = CompanyDataLoader()
+        ticker = source.upper()
+        return [loader.get_swot(ticker), loader.get_porters(ticker)], ticker
+    if isinstance(source, Mapping):
+        source = source.values()
+    objects = list(source)
+    for obj in objects:
+        if not isinstance(obj, FRAMEWORKS):
+            raise ValueError(f"Cannot draw {type(obj).__name__} on a dashboard")
+    return objects, None
+
+
+def _draw_panel(ax: Any, obj: Any, max_labels: Optional[int]) -> None:
+    """Draw one framework onto its panel, adding a title where plot() uses a suptitle."""
+    if isinstance(obj, SWOT):
+        obj._draw(ax)
+        ax.set_title(f'SWOT Analysis: {obj.company}', fontsize=14, fontweight='bold')
+    elif isinstance(obj, AnsoffMatrix):
+        obj._draw(ax)
+        ax.set_title(f'Ansoff Matrix\n{obj.company}', fontsize=14, fontweight='bold')
+    elif isinstance(obj, PESTEL) and not obj.factors:
+        _empty(ax, f'PESTEL Impact Matrix\n{obj.industry}', "No factors")
+    elif isinstance(obj, PESTEL):
+        obj._draw(ax)
+    elif isinstance(obj, BCGMatrix) and not obj.business_units:
+        _empty(ax, f'BCG Matrix\n{obj.company}', "No business units")
+    elif isinstance(obj, BCGMatrix):
+        obj._draw(ax, max_labels)
+    else:
+        obj._draw(ax)
+
+
+def _empty(ax: Any, title: str, message: str) -> None:
+    ax.axis('off')
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.text(0.5, 0.5, message, ha='center', va='center', fontsize=12,
+            style='italic', transform=ax.transAxes)
+
+
+def render_dashboard(source: Union[str, Mapping[str, Any], Sequence[Any]],
+                     layout: Optional[Tuple[int, int]] = None,
+                     figsize: Optional[Tuple[float, float]] = None,
+                     title: Optional[str] = None, loader: Any = None,
+                     save_path: Optional[str] = None, show: Optional[bool] = None,
+                     format: Optional[str] = None, dpi: float = DEFAULT_DPI,
+                     return_bytes: bool = False, buffer: Optional[BinaryIO] = None,
+                     max_labels: Optional[int] = 30) -> Union[None, bytes, Any]:
+    """
+    Draw several frameworks into one figure with a single layout pass.
+
+    Args:
+        source: Ticker (every framework the curated data covers), a
+            mapping of frameworks (drawn in value order) or a sequence of
+            framework objects
+        layout: (rows, cols) grid; defaults to ``auto_layout``
+        figsize: Figure size; defaults to 9x7.5 inches per panel
+        title: Figure title (defaults to the ticker, if one was given)
+        loader: CompanyDataLoader to use for a ticker
+        save_path: Path to save figure (optional)
+        show: Display the figure; None shows only on an interactive backend
+            when no bytes or buffer are requested
+        format: Output format (png, svg, pdf, webp, ...); inferred from
+            ``save_path`` when omitted, png for bytes/buffer
+        dpi: Output resolution
+        return_bytes: Return the encoded image instead of the figure
+        buffer: Writable binary stream to receive the encoded image
+        max_labels: Bubble labels per BCG panel
+
+    Returns:
+        Image bytes when ``return_bytes`` is set; otherwise the matplotlib
+        Figure when it is not shown
+
+    Example:
+        >>> render_dashboard("AAPL", save_path="aapl.png", dpi=150)
+    """
+    objects, ticker = _frameworks(source, loader)
+    rows, cols = layout or auto_layout(len(objects))
+    if rows < 1 or cols < 1 or rows * cols < len(objects):
+        raise ValueError(f"A {rows}x{cols} layout cannot hold {len(objects)} frameworks")
+    if figsize is None:
+        figsize = (PANEL_SIZE[0] * cols, PANEL_SIZE[1] * rows)
+
+    show = resolve_show(show, return_bytes, buffer)
+    fig = new_canvas(figsize, show)
+    for i, obj in enumerate(objects):
+        polar = isinstance(obj, PortersFiveForces)
+        ax = fig.add_subplot(rows, cols, i + 1, projection='polar' if polar else None)
+        _draw_panel(ax, obj, max_labels)
+
+    title = title or ticker
+    top = 1.0
+    if title:
+        # Keep a band for the title so panel titles never run into it
+        top -= TITLE_BAND / figsize[1]
+        fig.text(0.5, 1.0 - TITLE_BAND / figsize[1] / 2, title, ha='center', va='center',
+                 fontsize=18, fontweight='bold')
+    # The layout pass already fits every panel, so skip the cropping redraw
+    return finish(fig, save_path, show, format=format, dpi=dpi, return_bytes=return_bytes,
+                  buffer=buffer, bbox_inches=None, layout_rect=(0, 0, 1, top))
@@ -0,0 +1,178 @@
+"""
+Evidence Facts - Typed Numbers Extracted from Curated Evidence Text
+
+SWOT entries and Porter justifications carry free-text evidence such as
+"20% of revenue from Greater China" or "$166B cash, $97B net income
+(FY2023)". This module parses percentages, currency amounts, years and
+plain quantities out of that text ONCE, when a document is loaded, and
+stores them next to the text as ``facts``. Cross-company queries then
+compare numbers instead of running regexes per request.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Text fields scanned for facts, wherever they appear in an item
+TEXT_FIELDS = ("evidence", "potential", "strategic_value", "justification")
+
+_SCALES = {
+    "k": 1e3, "thousand": 1e3,
+    "m": 1e6, "million": 1e6,
+    "b": 1e9, "bn": 1e9, "billion": 1e9,
+    "t": 1e12, "trillion": 1e12,
+}
+_SCALE = r"(?:\s?(?P<{0}>[TBMK]|bn|trillion|billion|million|thousand)\b)?"
+
+_FACT_PATTERN = re.compile(
+    r"(?P<currency>\$\s?(?P<c_num>\d[\d,]*(?:\.\d+)?)" + _SCALE.format("c_scale") + r"\+?)"
+    r"|(?P<percent>(?:(?P<p_low>\d+(?:\.\d+)?)\s?[-–]\s?)?"
+    r"(?P<p_num>\d+(?:\.\d+)?)\s?(?:%|percent\b)\+?)"
+    r"|(?P<year>\b(?:FY\s?)?(?P<y_num>(?:19|20)\d{2})\b)"
+    r"|(?P<quantity>(?<![\w.#$])(?P<q_num>\d[\d,]*(?:\.\d+)?)"
+    + _SCALE.format("q_scale") + r"\+?(?![\w%]))",
+    re.IGNORECASE,
+)
+
+
+def _number(text: str, scale: Optional[str] = None) -> float:
+    value = float(text.replace(",", ""))
+    if scale:
+        value *= _SCALES[scale.lower()]
+    return value
+
+
+def extract_facts(text: str) -> List[Dict[str, Any]]:
+    """
+    Parse numeric facts out of a piece of evidence text.
+
+    Args:
+        text: Free text, e.g. ``"$85B services revenue, 30%+ margin"``
+
+    Returns:
+        List of facts in text order. Each fact is a dict with ``kind``
+        (``'currency'``, ``'percent'``, ``'year'`` or ``'quantity'``),
+        ``value`` (a float, currency in USD and scaled by K/M/B/bn/T), ``unit``
+        and the matched ``text``. Percentage ranges such as ``30-40%`` use
+        the upper bound as ``value`` and add ``low``.
+
+    Example:
+        >>> extract_facts("20% of revenue from Greater China")
+        [{'kind': 'percent', 'value': 20.0, 'unit': '%', 'text': '20%'}]
+    """
+    facts = []
+    for match in _FACT_PATTERN.finditer(text or ""):
+        if match.group("currency"):
+            fact = {"kind": "currency",
+                    "value": _number(match.group("c_num"), match.group("c_scale")),
+                    "unit": "USD"}
+        elif match.group("percent"):
+            fact = {"kind": "percent", "value": float(match.group("p_num")), "unit": "%"}
+            if match.group("p_low"):
+                fact["low"] = float(match.group("p_low"))
+        elif match.group("year"):
+            fact = {"kind": "year", "value": float(match.group("y_num")), "unit": "year"}
+        else:
+            fact = {"kind": "quantity",
+                    "value": _number(match.group("q_num"), match.group("q_scale")),
+                    "unit": None}
+        fact["text"] = match.group(0).strip()
+        facts.append(fact)
+    return facts
+
+
+def _annotate_item(item: Dict) -> Dict:
+    facts = []
+    for field in TEXT_FIELDS:
+        text = item.get(field)
+        if isinstance(text, str):
+            for fact in extract_facts(text):
+                fact["field"] = field
+                facts.append(fact)
+    item["facts"] = facts
+    for score in ("impact", "likelihood"):
+        if score in item:
+            try:
+                item[f"{score}_score"] = int(item[score])
+            except (TypeError, ValueError):
+                item[f"{score}_score"] = None
+    return item
+
+
+def annotate_document(data: Dict) -> Dict:
+    """
+    Add typed ``facts`` to every SWOT item and Porter force of a document.
+
+    Threats (and any item with ``impact``/``likelihood``) also get integer
+    ``impact_score``/``likelihood_score`` fields, since the curated files
+    store those ratings as strings. The document is modified in place and
+    returned; running it twice is harmless.
+    """
+    swot = data.get("swot_analysis", {})
+    for section in ("strengths", "weaknesses", "opportunities", "threats"):
+        for item in swot.get(section, []):
+            _annotate_item(item)
+    for force in data.get("porters_five_forces", {}).values():
+        if isinstance(force, dict) and "rating" in force:
+            _annotate_item(force)
+    return data
+
+
+def max_fact(item: Dict, kind: str) -> Optional[float]:
+    """Largest fact value of ``kind`` in an annotated item, or None."""
+    values = [fact["value"] for fact in item.get("facts", ()) if fact["kind"] == kind]
+    return max(values) if values else None
+
+
+def find_swot_items(
+    loader: Any = None,
+    section: str = "threats",
+    min_impact: Optional[int] = None,
+    min_likelihood: Optional[int] = None,
+    min_percent: Optional[float] = None,
+    min_amount: Optional[float] = None,
+    where: Optional[Callable[[Dict], bool]] = None,
+) -> Iterator[Tuple[str, Dict]]:
+    """
+    Stream SWOT items across the universe that match numeric criteria.
+
+    Args:
+        loader: CompanyDataLoader to query (default: bundled data)
+        section: 'strengths', 'weaknesses', 'opportunities' or 'threats'
+        min_impact: Minimum ``impact_score``
+        min_likelihood: Minimum ``likelihood_score``
+        min_percent: Item must cite a percentage at least this large
+        min_amount: Item must cite a currency amount at least this large (USD)
+        where: Extra predicate on the annotated item
+
+    Items read through an ``OverlayStore`` tenant loader carry the tenant's
+    overrides and appended items, which were never annotated at ingest, so
+    they are annotated here from their merged raw fields.
+
+    Yields:
+        ``(ticker, item)`` tuples
+
+    Example:
+        >>> # threats with likelihood >= 4 citing > 20% revenue exposure
+        >>> hits = list(find_swot_items(min_likelihood=4, min_percent=20))
+    """
+    if section not in ("strengths", "weaknesses", "opportunities", "threats"):
+        raise ValueError(f"Invalid SWOT section: {section}")
+    if loader is None:
+        from business_frameworks.company_data import CompanyDataLoader
+        loader = CompanyDataLoader()
+
+    def at_least(value: Optional[float], minimum: Optional[float]) -> bool:
+        return minimum is None or (value is not None and value >= minimum)
+
+    for ticker, data in loader.iter_companies(sections=["swot_analysis"]):
+        for item in data.get("swot_analysis", {}).get(section, []):
+            if not isinstance(item, dict):  # overlay view, possibly patched
+                item = _annotate_item(dict(item))
+            if not (at_least(item.get("impact_score"), min_impact)
+                    and at_least(item.get("likelihood_score"), min_likelihood)
+                    and at_least(max_fact(item, "percent"), min_percent)
+                    and at_least(max_fact(item, "currency"), min_amount)):
+                continue
+            if where is None or where(item):
+                yield ticker, item
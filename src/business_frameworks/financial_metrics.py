@@ -0,0 +1,274 @@
+"""
+Financial Metrics - Universe-Wide Ratios, Industry Percentiles and Z-Scores
+
+Loads the ``financial_overview`` section of every covered company into NumPy
+arrays and answers questions like "is this margin top decile in its
+industry?" with a handful of vectorized passes instead of per-company loops.
+Results are cached per data directory and dataset version, so they are only
+recomputed when the curated files change.
+"""
+
+import math
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from business_frameworks.company_data import CompanyDataLoader, _SingleFlightCache
+
+
+# Fields read from ``financial_overview`` (plus ``employees`` from the profile)
+RAW_FIELDS = (
+    "revenue_fy2023",
+    "net_income_fy2023",
+    "market_cap",
+    "pe_ratio",
+    "profit_margin",
+    "roe",
+    "debt_to_equity",
+    "cash_reserves",
+    "employees",
+)
+
+# Metrics that get industry percentile ranks and z-scores, with report labels
+RANKED_METRICS = {
+    "revenue_fy2023": "Revenue",
+    "profit_margin": "Profit Margin",
+    "net_margin": "Net Margin",
+    "roe": "Return on Equity",
+    "earnings_yield": "Earnings Yield",
+    "price_to_sales": "Price / Sales",
+    "cash_to_market_cap": "Cash / Market Cap",
+    "revenue_per_employee": "Revenue per Employee",
+    "debt_to_equity": "Debt / Equity",
+}
+
+
+class FinancialMetrics:
+    """
+    Column-oriented financial data for a set of companies.
+
+    Every metric is a float64 array aligned with ``tickers``; missing values
+    are NaN and are left out of the rankings. ``percentiles[metric]`` holds
+    the mid-rank percentile (0-1) within the company's industry and
+    ``zscores[metric]`` the industry z-score.
+
+    Example:
+        >>> metrics = get_metrics()
+        >>> metrics.rank('AAPL')['profit_margin']['percentile']
+        >>> metrics.top('profit_margin', fraction=0.1)  # top decile per industry
+    """
+
+    def __init__(self, tickers: Sequence[str], industries: Sequence[str],
+                 columns: Dict[str, Iterable[float]], version: Optional[str] = None,
+                 skipped: Optional[Dict[str, str]] = None):
+        self.tickers = np.asarray(tickers, dtype=object)
+        self.version = version
+        self.skipped: Dict[str, str] = dict(skipped or {})  # ticker -> why it was left out
+        self.industry_names, codes = np.unique(np.asarray(industries, dtype=object).astype(str),
+                                               return_inverse=True)
+        self.industry_codes = codes.reshape(-1).astype(np.intp)
+        self.industry_sizes = np.bincount(self.industry_codes, minlength=len(self.industry_names))
+        self._index = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+        n = len(self.tickers)
+        self.values: Dict[str, np.ndarray] = {}
+        for field in RAW_FIELDS:
+            column = columns.get(field)
+            self.values[field] = (np.full(n, np.nan) if column is None
+                                  else np.asarray(column, dtype=np.float64))
+        self._derive()
+
+        self.percentiles: Dict[str, np.ndarray] = {}
+        self.zscores: Dict[str, np.ndarray] = {}
+        for metric in RANKED_METRICS:
+            self.percentiles[metric], self.zscores[metric] = _industry_ranks(
+                self.values[metric], self.industry_codes, len(self.industry_names))
+
+    @classmethod
+    def from_loader(cls, loader: Optional[CompanyDataLoader] = None) -> "FinancialMetrics":
+        """
+        Stream the universe's financial sections into arrays.
+
+        Documents that cannot be read, or whose financial fields are not
+        numbers, are left out and listed in ``skipped`` so one bad file
+        does not stop the whole universe from being ranked.
+        """
+        loader = loader or CompanyDataLoader()
+        version = loader.dataset_version()
+        tickers: List[str] = []
+        industries: List[str] = []
+        columns: Dict[str, List[float]] = {field: [] for field in RAW_FIELDS}
+        skipped: Dict[str, str] = {}
+
+        def unreadable(ticker: str, exc: Exception) -> None:
+            skipped[ticker] = f"unreadable ({type(exc).__name__})"
+
+        for ticker, data in loader.iter_companies(
+                sections=["company_profile", "financial_overview"], on_error=unreadable):
+            try:
+                industry, row = _financial_row(data)
+            except ValueError as exc:
+                skipped[ticker] = str(exc)
+                continue
+            tickers.append(ticker)
+            industries.append(industry)
+            for field, value in zip(RAW_FIELDS, row):
+                columns[field].append(value)
+
+        return cls(tickers, industries, columns, version=version, skipped=skipped)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.upper() in self._index
+
+    def industry_of(self, ticker: str) -> str:
+        return str(self.industry_names[self.industry_codes[self._position(ticker)]])
+
+    def rank(self, ticker: str) -> Dict[str, Dict[str, float]]:
+        """
+        Value, industry percentile, z-score and peer count for each ranked metric.
+
+        Metrics the company has no data for are omitted.
+        """
+        i = self._position(ticker)
+        peers = int(self.industry_sizes[self.industry_codes[i]])
+        ranks = {}
+        for metric in RANKED_METRICS:
+            value = self.values[metric][i]
+            if np.isfinite(value):
+                ranks[metric] = {
+                    "value": float(value),
+                    "percentile": float(self.percentiles[metric][i]),
+                    "zscore": float(self.zscores[metric][i]),
+                    "peers": peers,
+                }
+        return ranks
+
+    def top(self, metric: str, fraction: float = 0.1,
+            industry: Optional[str] = None) -> List[str]:
+        """
+        Tickers in the top ``fraction`` of their industry for ``metric``.
+
+        Each industry contributes its best ``ceil(fraction * n)`` companies
+        (at least one, plus any tied with the last of them), where ``n``
+        counts the companies with data, so small industries are covered too.
+        """
+        if metric not in self.percentiles:
+            raise ValueError(f"Unknown metric. Must be one of: {list(RANKED_METRICS)}")
+        if not 0 < fraction <= 1:
+            raise ValueError("fraction must be in (0, 1]")
+        values = self.values[metric]
+        codes = (range(len(self.industry_names)) if industry is None
+                 else np.flatnonzero(self.industry_names == industry))
+        keep = np.zeros(len(self.tickers), dtype=bool)
+        for code in codes:
+            members = np.flatnonzero((self.industry_codes == code) & np.isfinite(values))
+            if not members.size:
+                continue
+            count = max(1, math.ceil(fraction * members.size - 1e-9))  # 0.7 * 10 is 7.000...1
+            cutoff = np.sort(values[members])[-count]
+            keep[members[values[members] >= cutoff]] = True
+        return [str(t) for t in self.tickers[keep]]
+
+    def _position(self, ticker: str) -> int:
+        try:
+            return self._index[ticker.upper()]
+        except KeyError:
+            raise ValueError(f"No financial data for {ticker}") from None
+
+    def _derive(self) -> None:
+        v = self.values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v["net_margin"] = v["net_income_fy2023"] / v["revenue_fy2023"]
+            v["earnings_yield"] = 1.0 / v["pe_ratio"]
+            v["price_to_sales"] = v["market_cap"] / v["revenue_fy2023"]
+            v["cash_to_market_cap"] = v["cash_reserves"] / v["market_cap"]
+            v["revenue_per_employee"] = v["revenue_fy2023"] / v["employees"]
+        for metric in ("net_margin", "earnings_yield", "price_to_sales",
+                       "cash_to_market_cap", "revenue_per_employee"):
+            v[metric][~np.isfinite(v[metric])] = np.nan
+
+
+def _financial_row(data: Dict, strict: bool = True) -> Tuple[str, List[float]]:
+    """
+    Industry and ``RAW_FIELDS`` values of one document (NaN when missing).
+
+    A non-numeric field ("N/A", "1.2bn") raises ValueError, or is read as
+    NaN when ``strict`` is False.
+    """
+    fin = data.get("financial_overview") or {}
+    profile = data.get("company_profile") or {}
+    if not isinstance(fin, Mapping) or not isinstance(profile, Mapping):
+        raise ValueError("malformed financial sections")
+    row = []
+    for field in RAW_FIELDS:
+        value = profile.get(field) if field == "employees" else fin.get(field)
+        if value is None:
+            row.append(np.nan)
+            continue
+        try:
+            if isinstance(value, bool):
+                raise TypeError
+            row.append(float(value))
+        except (TypeError, ValueError):
+            if strict:
+                raise ValueError(f"non-numeric {field}") from None
+            row.append(np.nan)
+    return str(profile.get("industry", "Unknown")), row
+
+
+def _industry_ranks(values: np.ndarray, codes: np.ndarray, n_groups: int):
+    """Mid-rank percentiles and z-scores within each group, ignoring NaNs."""
+    percentiles = np.full(values.shape, np.nan)
+    zscores = np.full(values.shape, np.nan)
+    ok = np.isfinite(values)
+    if not ok.any():
+        return percentiles, zscores
+    v, c = values[ok], codes[ok]
+    counts = np.bincount(c, minlength=n_groups)
+
+    # Sort by (industry, value); ties form runs that share a mid-rank.
+    order = np.lexsort((v, c))
+    vs, cs = v[order], c[order]
+    group_start = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    new_run = np.empty(vs.size, dtype=bool)
+    new_run[0] = True
+    new_run[1:] = (cs[1:] != cs[:-1]) | (vs[1:] != vs[:-1])
+    run_id = np.cumsum(new_run) - 1
+    run_start = np.flatnonzero(new_run)
+    run_len = np.diff(np.append(run_start, vs.size))
+    below = run_start[run_id] - group_start[cs]
+    ranked = np.empty_like(v)
+    ranked[order] = (below + 0.5 * run_len[run_id]) / counts[cs]
+    percentiles[ok] = ranked
+
+    safe_counts = np.maximum(counts, 1)
+    mean = np.bincount(c, weights=v, minlength=n_groups) / safe_counts
+    spread = v - mean[c]
+    std = np.sqrt(np.bincount(c, weights=spread * spread, minlength=n_groups) / safe_counts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zscores[ok] = np.where(std[c] > 0, spread / std[c], 0.0)
+    return percentiles, zscores
+
+
+# (scope, dataset version) -> metrics; only the newest version of each scope is kept
+_METRICS_CACHE = _SingleFlightCache(max_size=32)
+
+
+def get_metrics(loader: Optional[CompanyDataLoader] = None) -> FinancialMetrics:
+    """
+    Universe metrics for a loader's data, cached by dataset version.
+
+    Editing, adding or removing a company file changes the version, so the
+    next call recomputes (and drops the older snapshot); otherwise this is a
+    dictionary lookup. A tenant loader from ``OverlayStore.loader_for`` has
+    its own scope, so its ranks include the tenant's overrides.
+    """
+    loader = loader or CompanyDataLoader()
+    scope, version = loader._cache_scope(), loader.dataset_version()
+    metrics = _METRICS_CACHE.get((scope, version), lambda: FinancialMetrics.from_loader(loader))
+    _METRICS_CACHE.discard_where(lambda key: key[0] == scope and key[1] != version)
+    return metrics
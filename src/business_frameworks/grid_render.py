@@ -0,0 +1,261 @@
+"""
+Grid Renderer - SWOT and Ansoff Charts over a Cached Static Layer
+
+``SWOT.plot`` and ``AnsoffMatrix.plot`` rebuild the same scaffolding on every
+call: four quadrant rectangles, quadrant titles and axis labels. Only the item
+text changes between companies. GridRenderer draws that scaffolding once per
+(chart type, size, dpi), keeps the rendered pixels as a background and, for
+each chart, restores the background and draws just the variable text on top.
+
+The Agg canvas behind each cached layer is kept alive, so matplotlib's
+per-renderer text metrics cache stays warm: labels that repeat across charts
+(item bullets, risk badges, "CURRENT") are measured once.
+
+Pass a renderer to ``SWOT.plot`` or ``AnsoffMatrix.plot`` (``renderer=``) to
+use it for their PNG output. Output is a fixed-size PNG (no
+``bbox_inches='tight'`` cropping). A renderer is not thread-safe; use one per
+thread or process.
+"""
+
+import io
+import os
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from business_frameworks import ansoff_matrix, swot as swot_module
+from business_frameworks._plotting import tight_layout
+from business_frameworks.ansoff_matrix import QUADRANTS as ANSOFF_QUADRANTS
+from business_frameworks.ansoff_matrix import STRATEGY_COLORS, AnsoffMatrix
+from business_frameworks.swot import QUADRANTS as SWOT_QUADRANTS
+from business_frameworks.swot import SWOT
+from business_frameworks.text_layout import LINE_SPACING, box_points, fitted_lines
+
+
+class _Layer:
+    """A drawn static figure, its saved background and reusable text artists."""
+
+    __slots__ = ("fig", "canvas", "ax", "background", "title", "texts", "extras", "box")
+
+    def __init__(self, fig: Any, canvas: Any, ax: Any, title: Any):
+        self.fig = fig
+        self.canvas = canvas
+        self.ax = ax
+        self.title = title
+        self.background = None
+        self.texts: List[Any] = []
+        self.extras: Dict[str, Any] = {}
+        self.box = (0.0, 0.0)  # item box size in points, measured after layout
+
+    def lines(self, start: int, lines: List[str], x: float, top: float,
+              fontsize: float) -> List[Any]:
+        """Pooled text artists showing ``lines`` from ``(x, top)`` down, as ``draw_lines`` does."""
+        while len(self.texts) < start + len(lines):
+            self.texts.append(self.ax.annotate(
+                "", (0, 0), xytext=(0, 0), textcoords='offset points', ha='left', va='top',
+                parse_math=False, animated=True))
+        artists = self.texts[start:start + len(lines)]
+        for i, (text, line) in enumerate(zip(artists, lines)):
+            text.set_text(line)
+            text.set_fontsize(fontsize)
+            text.xy = (x, top)
+            text.set_position((0, -i * fontsize * LINE_SPACING))
+        return artists
+
+
+def _new_layer(figsize: Tuple[float, float], dpi: int, placeholder: str,
+               title_y: Optional[float] = None) -> _Layer:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_xlim(0, 2)
+    ax.set_ylim(0, 2)
+    ax.axis('off')
+    kwargs = {} if title_y is None else {"y": title_y}
+    # Placeholder shaped like the real title, so the layout leaves the same room
+    title = fig.suptitle(placeholder, fontsize=16, fontweight='bold', **kwargs)
+    return _Layer(fig, canvas, ax, title)
+
+
+def _freeze(layer: _Layer) -> None:
+    """Lay out, draw the static artists and keep their pixels."""
+    tight_layout(layer.fig)
+    layer.title.set_animated(True)
+    layer.canvas.draw()
+    layer.background = layer.canvas.copy_from_bbox(layer.fig.bbox)
+
+
+def _build_swot(figsize: Tuple[float, float], dpi: int) -> _Layer:
+    import matplotlib.patches as mpatches
+
+    layer = _new_layer(figsize, dpi, 'SWOT Analysis: Company')
+    for title, _, x, y, color in SWOT_QUADRANTS:
+        layer.ax.add_patch(mpatches.Rectangle((x, y), 1, 1, linewidth=2, edgecolor='black',
+                                              facecolor=color, alpha=0.2))
+        layer.ax.text(x + 0.5, y + 0.95, title, ha='center', va='top',
+                      fontsize=14, fontweight='bold')
+    _freeze(layer)
+    layer.box = box_points(layer.ax, swot_module.ITEM_WIDTH, swot_module.ITEM_HEIGHT)
+    return layer
+
+
+def _build_ansoff(figsize: Tuple[float, float], dpi: int) -> _Layer:
+    import matplotlib.patches as mpatches
+
+    layer = _new_layer(figsize, dpi, 'Ansoff Matrix: Growth Strategy Analysis\nCompany',
+                       title_y=0.98)
+    fig, ax = layer.fig, layer.ax
+    for strategy, x, y in ANSOFF_QUADRANTS:
+        ax.add_patch(mpatches.Rectangle((x, y), 1, 1, linewidth=3, edgecolor='black',
+                                        facecolor=STRATEGY_COLORS[strategy], alpha=0.3))
+        ax.text(x + 0.5, y + 0.92, strategy.upper(),
+                ha='center', va='top', fontsize=13, fontweight='bold')
+        # Per-company pieces, drawn over the background only when needed
+        layer.extras[f"risk:{strategy}"] = ax.text(
+            x + 0.5, y + 0.82, "", ha='center', va='top', fontsize=10, style='italic',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.7), animated=True)
+        layer.extras[f"box:{strategy}"] = ax.add_patch(mpatches.Rectangle(
+            (x, y), 1, 1, linewidth=5, edgecolor='blue', facecolor='none', animated=True))
+        layer.extras[f"current:{strategy}"] = ax.text(
+            x + 0.5, y + 0.05, "★ CURRENT", ha='center', va='bottom', fontsize=11,
+            fontweight='bold', color='blue', animated=True)
+
+    fig.text(0.5, 0.95, 'PRODUCTS', ha='center', fontsize=14, fontweight='bold')
+    fig.text(0.25, 0.93, 'EXISTING', ha='center', fontsize=11)
+    fig.text(0.75, 0.93, 'NEW', ha='center', fontsize=11)
+    fig.text(0.08, 0.5, 'MARKETS', va='center', rotation=90, fontsize=14, fontweight='bold')
+    fig.text(0.06, 0.75, 'EXISTING', va='center', rotation=90, fontsize=11)
+    fig.text(0.06, 0.25, 'NEW', va='center', rotation=90, fontsize=11)
+    _freeze(layer)
+    layer.box = box_points(layer.ax, ansoff_matrix.ITEM_WIDTH, ansoff_matrix.ITEM_HEIGHT)
+    return layer
+
+
+class GridRenderer:
+    """
+    Fast PNG renderer for SWOT and Ansoff charts.
+
+    Args:
+        figsize: Figure size (default matches the ``plot`` methods)
+        dpi: Output resolution
+
+    Example:
+        >>> renderer = GridRenderer(dpi=100)
+        >>> for ticker in loader.list_tickers():
+        ...     png = renderer.render(loader.get_swot(ticker))
+        >>> renderer.stats()
+        {'layers_built': 1, 'charts': 64}
+    """
+
+    _BUILDERS = {"swot": _build_swot, "ansoff": _build_ansoff}
+
+    def __init__(self, figsize: Tuple[float, float] = (12, 10), dpi: int = 100):
+        self.figsize = tuple(figsize)
+        self.dpi = dpi
+        self._layers: Dict[Tuple, _Layer] = {}
+        self._charts = 0
+
+    def _layer(self, kind: str) -> _Layer:
+        key = (kind, self.figsize, self.dpi)
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = self._layers[key] = self._BUILDERS[kind](self.figsize, self.dpi)
+        return layer
+
+    def render(self, analysis: Any) -> bytes:
+        """Render a SWOT or AnsoffMatrix to PNG bytes."""
+        if isinstance(analysis, SWOT):
+            layer = self._layer("swot")
+            artists = self._swot_artists(layer, analysis)
+        elif isinstance(analysis, AnsoffMatrix):
+            layer = self._layer("ansoff")
+            artists = self._ansoff_artists(layer, analysis)
+        else:
+            raise ValueError(f"GridRenderer cannot draw {type(analysis).__name__}")
+
+        layer.canvas.restore_region(layer.background)
+        for artist in artists:
+            layer.fig.draw_artist(artist)
+        self._charts += 1
+        return self._encode(layer)
+
+    def plot(self, analysis: Any, save_path: Optional[str] = None, show: Optional[bool] = None,
+             format: Optional[str] = None, return_bytes: bool = False,
+             buffer: Optional[BinaryIO] = None, figsize: Optional[Tuple[float, float]] = None,
+             dpi: Optional[float] = None) -> Optional[bytes]:
+        """
+        The outputs of ``analysis.plot(...)``, drawn on the cached layer.
+
+        Backs the ``renderer`` argument of ``SWOT.plot`` and
+        ``AnsoffMatrix.plot``. Only PNG is written, nothing is shown, and a
+        ``figsize`` or ``dpi`` other than the renderer's is rejected rather
+        than ignored.
+
+        Returns:
+            PNG bytes when ``return_bytes`` is set, else None
+        """
+        if show:
+            raise ValueError("A GridRenderer cannot show charts; plot without renderer=")
+        if figsize is not None and tuple(figsize) != self.figsize:
+            raise ValueError(f"figsize {tuple(figsize)} differs from the renderer's {self.figsize}")
+        if dpi is not None and dpi != self.dpi:
+            raise ValueError(f"dpi {dpi} differs from the renderer's {self.dpi}")
+        if format is None and save_path:
+            format = os.path.splitext(str(save_path))[1].lstrip(".") or "png"
+        if (format or "png").lower() != "png":
+            raise ValueError(f"A GridRenderer only writes PNG, not {format!r}")
+        data = self.render(analysis)
+        if save_path:
+            with open(save_path, "wb") as f:
+                f.write(data)
+        if buffer is not None:
+            buffer.write(data)
+        return data if return_bytes else None
+
+    def stats(self) -> Dict[str, int]:
+        """Layers built so far and charts rendered."""
+        return {"layers_built": len(self._layers), "charts": self._charts}
+
+    def clear(self) -> None:
+        """Drop the cached layers."""
+        self._layers.clear()
+
+    def _swot_artists(self, layer: _Layer, swot: SWOT) -> List[Any]:
+        layer.title.set_text(f'SWOT Analysis: {swot.company}')
+        artists = [layer.title]
+        pooled = 0
+        for _, attr, x, y, _ in SWOT_QUADRANTS:
+            fontsize, lines = fitted_lines([str(item) for item in getattr(swot, attr)], *layer.box,
+                                           note="+{n} more (see plot_pages)")
+            texts = layer.lines(pooled, lines, x + swot_module.ITEM_LEFT,
+                                y + swot_module.ITEM_TOP, fontsize)
+            artists += texts
+            pooled += len(texts)
+        return artists
+
+    def _ansoff_artists(self, layer: _Layer, ansoff: AnsoffMatrix) -> List[Any]:
+        layer.title.set_text(f'Ansoff Matrix: Growth Strategy Analysis\n{ansoff.company}')
+        artists = [layer.title]
+        pooled = 0
+        for strategy, x, y in ANSOFF_QUADRANTS:
+            risk = layer.extras[f"risk:{strategy}"]
+            risk.set_text(f"Risk: {ansoff.strategies[strategy]['risk']}")
+            artists.append(risk)
+            initiatives = ansoff.strategies[strategy]["initiatives"]
+            if initiatives:
+                fontsize, lines = fitted_lines(initiatives, *layer.box, min_fontsize=7)
+                texts = layer.lines(pooled, lines, x + ansoff_matrix.ITEM_LEFT,
+                                    y + ansoff_matrix.ITEM_TOP, fontsize)
+                artists += texts
+                pooled += len(texts)
+            if ansoff.current_strategy == strategy:
+                artists += [layer.extras[f"box:{strategy}"], layer.extras[f"current:{strategy}"]]
+        return artists
+
+    def _encode(self, layer: _Layer) -> bytes:
+        from matplotlib.image import imsave
+
+        buffer = io.BytesIO()
+        imsave(buffer, layer.canvas.buffer_rgba(), format='png', dpi=self.dpi)
+        return buffer.getvalue()
@@ -0,0 +1,358 @@
+"""
+Overlay Store - Copy-on-Write Customisation of Curated Company Data
+
+Analysts routinely override a handful of curated fields per company (a force
+rating, an extra threat). Instead of deep-copying the whole document for every
+request, an OverlayStore keeps ONE shared, read-only copy of each curated base
+document plus a small patch per tenant. Reads merge the two lazily: unpatched
+subtrees are shared by every tenant, and each lookup only consults the patch
+entries on its own path.
+"""
+
+import copy
+import itertools
+import threading
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+from collections.abc import Mapping as MappingABC, Sequence as SequenceABC
+
+from business_frameworks.company_data import CompanyDataLoader, _SingleFlightCache
+
+
+Path = Union[str, Sequence[Union[str, int]]]
+_STORE_IDS = itertools.count()  # distinguishes stores in derived-cache keys
+
+
+class _Set:
+    """Patch leaf: the value at this path is replaced wholesale."""
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class _Patch:
+    """Patch node: overrides for some children plus items appended to a list."""
+    __slots__ = ("children", "appended")
+
+    def __init__(self) -> None:
+        self.children: Dict[Union[str, int], Union["_Patch", _Set]] = {}
+        self.appended: List[Any] = []
+
+
+def _wrap(value: Any, patch: Optional[_Patch] = None) -> Any:
+    """Return a read-only view of ``value`` with ``patch`` applied on top."""
+    if isinstance(value, list) or (value is None and patch is not None and patch.appended):
+        return OverlayListView(value or [], patch)
+    if isinstance(value, dict) or (value is None and patch is not None):
+        return OverlayView(value or {}, patch)
+    return value
+
+
+class OverlayView(MappingABC):
+    """
+    Read-only mapping that merges a curated base dict with a tenant patch.
+
+    Behaves like the dict returned by ``CompanyDataLoader.load_company`` for
+    reading (``view['swot_analysis']['threats'][0]``, ``.get()``, ``in``,
+    iteration), but never copies the base and cannot be mutated.
+    """
+    __slots__ = ("_base", "_patch")
+
+    def __init__(self, base: Dict, patch: Optional[_Patch] = None):
+        self._base = base
+        self._patch = patch
+
+    def __getitem__(self, key: Hashable) -> Any:
+        patch = self._patch.children.get(key) if self._patch is not None else None
+        if isinstance(patch, _Set):
+            return _wrap(patch.value)
+        if patch is None:
+            return _wrap(self._base[key])
+        return _wrap(self._base.get(key), patch)
+
+    def __iter__(self) -> Iterator:
+        yield from self._base
+        if self._patch is not None:
+            for key in self._patch.children:
+                if key not in self._base:
+                    yield key
+
+    def __len__(self) -> int:
+        if self._patch is None:
+            return len(self._base)
+        extra = sum(1 for key in self._patch.children if key not in self._base)
+        return len(self._base) + extra
+
+    def __repr__(self) -> str:
+        return f"OverlayView({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict:
+        """Materialise the merged document as an independent plain dict."""
+        return {key: _materialise(self[key]) for key in self}
+
+
+class OverlayListView(SequenceABC):
+    """Read-only sequence that merges a curated base list with a tenant patch."""
+    __slots__ = ("_base", "_patch")
+
+    def __init__(self, base: List, patch: Optional[_Patch] = None):
+        self._base = base
+        self._patch = patch
+
+    def __len__(self) -> int:
+        appended = len(self._patch.appended) if self._patch is not None else 0
+        return len(self._base) + appended
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("overlay list index out of range")
+        if index >= len(self._base):
+            return _wrap(self._patch.appended[index - len(self._base)])
+        patch = self._patch.children.get(index) if self._patch is not None else None
+        if isinstance(patch, _Set):
+            return _wrap(patch.value)
+        return _wrap(self._base[index], patch)
+
+    def __repr__(self) -> str:
+        return f"OverlayListView({self.to_list()!r})"
+
+    def to_list(self) -> List:
+        """Materialise the merged list as an independent plain list."""
+        return [_materialise(item) for item in self]
+
+
+def _materialise(value: Any) -> Any:
+    if isinstance(value, OverlayView):
+        return value.to_dict()
+    if isinstance(value, OverlayListView):
+        return value.to_list()
+    return copy.deepcopy(value)
+
+
+def _parse_path(path: Path) -> Tuple[Union[str, int], ...]:
+    parts = tuple(path.split(".")) if isinstance(path, str) else tuple(path)
+    if not parts or any(part == "" for part in parts):
+        raise ValueError(f"Invalid overlay path: {path!r}")
+    return parts
+
+
+class OverlayStore:
+    """
+    Layered company data: immutable curated base + per-tenant patches.
+
+    Args:
+        loader: Loader used to read curated base documents (default: the
+            bundled knowledge base)
+
+    Example:
+        >>> store = OverlayStore()
+        >>> store.set('acme-research', 'AAPL',
+        ...           'porters_five_forces.supplier_power.rating', 4)
+        >>> store.append('acme-research', 'AAPL', 'swot_analysis.threats',
+        ...              {'factor': 'EU DMA fines', 'impact': '4', 'likelihood': '3'})
+        >>> data = store.get('acme-research', 'AAPL')
+        >>> data['porters_five_forces']['supplier_power']['rating']
+        4
+        >>> store.loader_for('acme-research').get_porters('AAPL').plot()
+    """
+
+    def __init__(self, loader: Optional[CompanyDataLoader] = None):
+        self.loader = loader or CompanyDataLoader()
+        self._bases = _SingleFlightCache()
+        self._patches: Dict[Tuple[Hashable, str], _Patch] = {}
+        self._write_lock = threading.RLock()
+        self._id = next(_STORE_IDS)
+        self.revision = 0  # bumped by every successful write, for derived caches
+
+    def base(self, ticker: str) -> OverlayView:
+        """Read-only view of the curated document, shared by all tenants."""
+        return OverlayView(self._base_doc(ticker))
+
+    def get(self, tenant: Hashable, ticker: str) -> OverlayView:
+        """Merged view of a company document as seen by ``tenant``."""
+        ticker = ticker.upper()
+        return OverlayView(self._base_doc(ticker), self._patches.get((tenant, ticker)))
+
+    def set(self, tenant: Hashable, ticker: str, path: Path, value: Any) -> None:
+        """
+        Override the value at ``path`` for one tenant.
+
+        Args:
+            tenant: Tenant or user identifier
+            ticker: Stock ticker
+            path: Dotted path (``'porters_five_forces.buyer_power.rating'``)
+                or a sequence of keys/list indices
+            value: New value (copied, so later changes by the caller don't leak)
+        """
+        *parents, leaf = _parse_path(path)
+        with self._write_lock:
+            self._write(self._set, tenant, ticker, parents, leaf, value)
+
+    def _write(self, op: Any, *args: Any) -> None:
+        """Run a write, removing the patch nodes it created if it fails."""
+        created: List[Tuple[Dict, Any]] = []
+        try:
+            op(created, *args)
+        except BaseException:
+            for container, key in reversed(created):
+                container.pop(key, None)
+            raise
+        self.revision += 1
+
+    def _set(self, created: List, tenant: Hashable, ticker: str, parents: List, leaf: Any,
+             value: Any) -> None:
+        node, base, detached = self._walk(tenant, ticker, parents, created)
+        if detached is not None:
+            detached[self._key(detached, leaf)] = copy.deepcopy(value)
+            return
+        if base is not None and not isinstance(base, (dict, list)):
+            raise ValueError(f"Cannot patch inside scalar at {tuple(parents)!r}")
+        leaf = self._key(base, leaf)
+        if isinstance(base, list) and not 0 <= leaf < len(base):
+            offset = leaf - len(base)
+            if not 0 <= offset < len(node.appended):
+                raise ValueError(f"No list item at {tuple(parents) + (leaf,)!r}")
+            node.appended[offset] = copy.deepcopy(value)
+            return
+        node.children[leaf] = _Set(copy.deepcopy(value))
+
+    def append(self, tenant: Hashable, ticker: str, path: Path, value: Any) -> None:
+        """Append ``value`` to the list at ``path`` for one tenant."""
+        with self._write_lock:
+            self._write(self._append, tenant, ticker, _parse_path(path), value)
+
+    def _append(self, created: List, tenant: Hashable, ticker: str, parts: Tuple,
+                value: Any) -> None:
+        node, base, detached = self._walk(tenant, ticker, parts, created)
+        if detached is not None:
+            if not isinstance(detached, list):
+                raise ValueError(f"Cannot append to non-list at {parts!r}")
+            detached.append(copy.deepcopy(value))
+            return
+        if base is not None and not isinstance(base, list):
+            raise ValueError(f"Cannot append to non-list at {parts!r}")
+        node.appended.append(copy.deepcopy(value))
+
+    def reset(self, tenant: Hashable, ticker: Optional[str] = None) -> None:
+        """Drop a tenant's overrides for one company, or for all companies."""
+        with self._write_lock:
+            self.revision += 1
+            if ticker is not None:
+                self._patches.pop((tenant, ticker.upper()), None)
+                return
+            for key in [key for key in self._patches if key[0] == tenant]:
+                del self._patches[key]
+
+    def overrides(self, tenant: Hashable, ticker: str) -> List[Tuple[Tuple, str, Any]]:
+        """List a tenant's overrides as ``(path, op, value)`` tuples ('set'/'append')."""
+        root = self._patches.get((tenant, ticker.upper()))
+        found: List[Tuple[Tuple, str, Any]] = []
+
+        def visit(node: _Patch, prefix: Tuple) -> None:
+            for key, child in node.children.items():
+                if isinstance(child, _Set):
+                    found.append((prefix + (key,), "set", child.value))
+                else:
+                    visit(child, prefix + (key,))
+            for item in node.appended:
+                found.append((prefix, "append", item))
+
+        if root is not None:
+            visit(root, ())
+        return found
+
+    def loader_for(self, tenant: Hashable) -> CompanyDataLoader:
+        """
+        A CompanyDataLoader whose documents include ``tenant``'s overrides.
+
+        ``get_porters``, ``get_swot`` and ``get_company_report`` on the
+        returned loader all see the merged data.
+        """
+        return _TenantLoader(self, tenant)
+
+    def _base_doc(self, ticker: str) -> Dict:
+        ticker = ticker.upper()
+        return self._bases.get(ticker, lambda: self.loader._document(ticker))
+
+    @staticmethod
+    def _key(container: Any, key: Union[str, int]) -> Union[str, int]:
+        if isinstance(container, list):
+            try:
+                return int(key)
+            except (TypeError, ValueError):
+                raise ValueError(f"List index expected, got {key!r}") from None
+        return key
+
+    def _walk(self, tenant: Hashable, ticker: str,
+              parts: Sequence[Union[str, int]],
+              created: List[Tuple[Dict, Any]]) -> Tuple[Optional[_Patch], Any, Any]:
+        """
+        Find (creating as needed) the patch node for ``parts``.
+
+        Every node it creates is recorded in ``created`` as ``(container, key)``
+        so ``_write`` can remove them again if the write is rejected.
+
+        Returns ``(node, base_value, detached)``. ``detached`` is set instead
+        of ``node`` when the path runs into a value the tenant already owns
+        (a replaced subtree or an appended item), which is edited in place.
+        """
+        ticker = ticker.upper()
+        base: Any = self._base_doc(ticker)
+        node = self._patches.get((tenant, ticker))
+        if node is None:
+            node = self._patches[(tenant, ticker)] = _Patch()
+            created.append((self._patches, (tenant, ticker)))
+
+        for i, part in enumerate(parts):
+            if base is not None and not isinstance(base, (dict, list)):
+                raise ValueError(f"Cannot patch inside scalar at {tuple(parts[:i])!r}")
+            key = self._key(base, part)
+            if isinstance(base, list) and not 0 <= key < len(base):
+                offset = key - len(base)
+                if not 0 <= offset < len(node.appended):
+                    raise ValueError(f"No list item at {tuple(parts[:i + 1])!r}")
+                return None, None, self._descend(node.appended[offset], parts[i + 1:])
+            child = node.children.get(key)
+            if isinstance(child, _Set):
+                return None, None, self._descend(child.value, parts[i + 1:])
+            if child is None:
+                child = node.children[key] = _Patch()
+                created.append((node.children, key))
+            base = base.get(key) if isinstance(base, dict) else (
+                base[key] if isinstance(base, list) else None)
+            node = child
+        return node, base, None
+
+    def _descend(self, value: Any, parts: Sequence[Union[str, int]]) -> Any:
+        for part in parts:
+            value = value[self._key(value, part)]
+        return value
+
+
+class _TenantLoader(CompanyDataLoader):
+    """CompanyDataLoader that reads through an OverlayStore for one tenant."""
+
+    def __init__(self, store: OverlayStore, tenant: Hashable):
+        super().__init__(data_dir=store.loader.data_dir, cache=False)
+        self._store = store
+        self._tenant = tenant
+
+    def load_company(self, ticker: str) -> OverlayView:
+        return self._store.get(self._tenant, ticker)
+
+    def _document(self, ticker: str) -> OverlayView:
+        return self._store.get(self._tenant, ticker)
+
+    def _read_document(self, ticker: str) -> OverlayView:
+        return self._store.get(self._tenant, ticker)
+
+    def dataset_version(self) -> str:
+        return f"{super().dataset_version()}+{self._store.revision}"
+
+    def _cache_scope(self) -> Hashable:
+        return (super()._cache_scope(), self._store._id, self._tenant)
@@ -1,8 +1,21 @@
 """PESTEL Analysis Framework"""
 
-from typing import List, Dict, Optional
-import matplotlib.pyplot as plt
-import pandas as pd
+from typing import Any, ContextManager, BinaryIO, List, Dict, Optional
+
+from business_frameworks._plotting import DEFAULT_DPI, figure_context, finish, new_figure, resolve_show
+from business_frameworks.labels import AROUND, annotate_points
+
+CATEGORY_COLORS = {'Political': '#FF6B6B', 'Economic': '#4ECDC4',
+                   'Social': '#45B7D1', 'Technological': '#96CEB4',
+                   'Environmental': '#FFEAA7', 'Legal': '#DFE6E9'}
+CATEGORIES = tuple(CATEGORY_COLORS)
+CATEGORY_ABBREVIATIONS = ('Pol', 'Eco', 'Soc', 'Tech', 'Env', 'Leg')
+MODES = ('auto', 'scatter', 'bubbles', 'heatmap')
+DENSITY_THRESHOLD = 60  # 'auto' aggregates per grid cell above this many factors
+
+
+def _short_label(text: str, width: int = 28) -> str:
+    return text if len(text) <= width else text[:width - 3] + "..."
 
 
 class PESTEL:
@@ -15,8 +28,7 @@ class PESTEL:
     def add_factor(self, category: str, description: str, 
                    impact: int, likelihood: int) -> None:
         """Add a PESTEL factor (impact & likelihood: 1-5)"""
-        if category not in ['Political', 'Economic', 'Social', 'Technological', 
-                           'Environmental', 'Legal']:
+        if category not in CATEGORIES:
             raise ValueError(f"Invalid category: {category}")
         if not (1 <= impact <= 5 and 1 <= likelihood <= 5):
             raise ValueError("Impact and likelihood must be 1-5")
@@ -33,8 +45,7 @@ class PESTEL:
         """Generate text report"""
         report = f"\n{'='*60}\nPESTEL ANALYSIS: {self.industry}\n{'='*60}\n\n"
         
-        for cat in ['Political', 'Economic', 'Social', 'Technological', 
-                    'Environmental', 'Legal']:
+        for cat in CATEGORIES:
             items = [f for f in self.factors if f['category'] == cat]
             if items:
                 report += f"\n{cat.upper()}\n" + "-"*60 + "\n"
@@ -45,36 +56,178 @@ class PESTEL:
         print(report)
         return report
     
+    def to_dict(self) -> Dict:
+        """Export analysis to dictionary format."""
+        return {
+            "industry": self.industry,
+            "factors": [dict(f) for f in self.factors],
+        }
+    
+    def _repr_svg_(self) -> str:
+        """Notebook display as SVG (no matplotlib needed)."""
+        from business_frameworks.svg import render_svg
+        return render_svg(self)
+    
+    def count_tensor(self) -> Any:
+        """
+        Factor counts per grid cell and category, in one ``bincount`` pass.
+        
+        Returns:
+            Integer NumPy array of shape (5, 5, 6) indexed
+            ``[likelihood - 1, impact - 1, category]``, categories in
+            ``CATEGORIES`` order
+        
+        Example:
+            >>> counts = pestel.count_tensor()
+            >>> counts[3, 4].sum()   # factors at likelihood 4, impact 5
+        """
+        import numpy as np
+        
+        n = len(self.factors)
+        index = {cat: i for i, cat in enumerate(CATEGORIES)}
+        likelihood = np.fromiter((f['likelihood'] for f in self.factors), np.intp, n)
+        impact = np.fromiter((f['impact'] for f in self.factors), np.intp, n)
+        category = np.fromiter((index[f['category']] for f in self.factors), np.intp, n)
+        cells = ((likelihood - 1) * 5 + impact - 1) * len(CATEGORIES) + category
+        return np.bincount(cells, minlength=5 * 5 * len(CATEGORIES)).reshape(5, 5, len(CATEGORIES))
+    
+    def figure(self, **plot_kw: Any) -> ContextManager[Any]:
+        """Headless ``plot_impact_matrix(**plot_kw)`` figure, closed when the ``with`` block ends."""
+        return figure_context(self.plot_impact_matrix, **plot_kw)
+    
     def plot_impact_matrix(self, figsize: tuple = (10, 8), 
-                          save_path: Optional[str] = None) -> None:
-        """Plot impact vs likelihood matrix"""
+                          save_path: Optional[str] = None,
+                          show: Optional[bool] = None, label_factors: bool = False,
+                          format: Optional[str] = None, dpi: float = DEFAULT_DPI,
+                          return_bytes: bool = False,
+                          buffer: Optional[BinaryIO] = None, mode: str = 'auto') -> Any:
+        """
+        Plot impact vs likelihood matrix.
+        
+        With ``label_factors`` each point is labelled with its description,
+        highest score first; labels on shared grid cells fan out around the
+        point and any that cannot fit are dropped and counted.
+        
+        Factors sit on a 5x5 integer grid, so with hundreds of them the
+        markers hide each other. The density modes aggregate with
+        ``count_tensor`` instead and draw at most one marker (or cell) per
+        grid position and category, whatever the factor count:
+        
+        - 'scatter': one marker per factor
+        - 'bubbles': per cell, one bubble per category sized by its count
+        - 'heatmap': cell shading by total count, with per-category counts
+        - 'auto': 'scatter' up to ``DENSITY_THRESHOLD`` factors, else 'bubbles'
+        
+        Args:
+            figsize: Figure size tuple
+            save_path: Optional path to save the figure
+            show: Display the chart; None (default) shows it only on an
+                interactive backend and when no bytes/buffer are requested
+            format: Image format for files, bytes and buffers
+                ('png', 'svg', 'pdf', 'webp', ...; files default to their extension)
+            dpi: Output resolution (lower it for thumbnails)
+            return_bytes: Return the encoded image instead of the figure
+            buffer: Writable binary file object to receive the image
+            label_factors: Label points with their descriptions ('scatter' only)
+            mode: 'auto', 'scatter', 'bubbles' or 'heatmap'
+        
+        Returns:
+            Image bytes when ``return_bytes`` is set; otherwise the matplotlib
+            Figure when it is not shown
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
         if not self.factors:
             print("No factors to plot")
-            return
+            return None
         
-        df = pd.DataFrame(self.factors)
-        fig, ax = plt.subplots(figsize=figsize)
+        show = resolve_show(show, return_bytes, buffer)
+        fig, ax = new_figure(figsize, show)
         
-        colors = {'Political': '#FF6B6B', 'Economic': '#4ECDC4', 
-                 'Social': '#45B7D1', 'Technological': '#96CEB4',
-                 'Environmental': '#FFEAA7', 'Legal': '#DFE6E9'}
+        self._draw(ax, label_factors, mode)
         
-        for cat in df['category'].unique():
-            cat_df = df[df['category'] == cat]
-            ax.scatter(cat_df['likelihood'], cat_df['impact'], 
-                      s=200, alpha=0.6, c=colors.get(cat, '#000'),
-                      label=cat, edgecolors='black', linewidth=1.5)
+        return finish(fig, save_path, show, format=format, dpi=dpi,
+                      return_bytes=return_bytes, buffer=buffer)
+    
+    def _draw(self, ax: Any, label_factors: bool = False, mode: str = 'auto') -> None:
+        """Draw the impact/likelihood matrix onto ``ax`` in the given mode."""
+        if mode == 'auto':
+            mode = 'scatter' if len(self.factors) <= DENSITY_THRESHOLD else 'bubbles'
+        if mode == 'scatter':
+            self._draw_scatter(ax)
+        elif mode == 'bubbles':
+            _draw_bubbles(ax, self.count_tensor())
+        else:
+            _draw_heatmap(ax, self.count_tensor())
         
         ax.set_xlabel('Likelihood', fontsize=12, fontweight='bold')
         ax.set_ylabel('Impact', fontsize=12, fontweight='bold')
         ax.set_title(f'PESTEL Impact Matrix\n{self.industry}', 
                     fontsize=14, fontweight='bold')
-        ax.set_xlim(0, 6)
-        ax.set_ylim(0, 6)
-        ax.grid(True, alpha=0.3)
-        ax.legend(loc='upper left')
-        
-        plt.tight_layout()
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        if mode == 'scatter':
+            ax.legend(loc='upper left')
+        elif mode == 'bubbles':  # every cell may be occupied, so keep the legend outside
+            ax.legend(loc='upper left', bbox_to_anchor=(1.01, 1), markerscale=0.6)
+        if mode != 'heatmap':
+            ax.set_xlim(0, 6)
+            ax.set_ylim(0, 6)
+            ax.grid(True, alpha=0.3)
+        
+        if label_factors and mode == 'scatter':
+            annotate_points(ax, [f['likelihood'] for f in self.factors],
+                            [f['impact'] for f in self.factors],
+                            [_short_label(f['description']) for f in self.factors],
+                            priority=[f['score'] for f in self.factors],
+                            candidates=AROUND, fontsize=8, marker_size=16)
+    
+    def _draw_scatter(self, ax: Any) -> None:
+        # Group points by category in one pass (order of first appearance)
+        points: Dict[str, tuple] = {}
+        for f in self.factors:
+            xs, ys = points.setdefault(f['category'], ([], []))
+            xs.append(f['likelihood'])
+            ys.append(f['impact'])
+        
+        for cat, (xs, ys) in points.items():
+            ax.scatter(xs, ys, 
+                      s=200, alpha=0.6, c=CATEGORY_COLORS.get(cat, '#000'),
+                      label=cat, edgecolors='black', linewidth=1.5)
+
+
+def _draw_bubbles(ax: Any, counts: Any) -> None:
+    """One bubble per (cell, category), placed round the cell centre by category."""
+    import numpy as np
+    
+    largest = counts.max()
+    for c, cat in enumerate(CATEGORIES):
+        likelihood, impact = np.nonzero(counts[:, :, c])
+        if not len(likelihood):
+            continue
+        n = counts[likelihood, impact, c]
+        angle = 2 * np.pi * c / len(CATEGORIES)
+        x = likelihood + 1 + 0.25 * np.cos(angle)
+        y = impact + 1 + 0.25 * np.sin(angle)
+        ax.scatter(x, y, s=40 + 560 * n / largest, alpha=0.7, c=CATEGORY_COLORS[cat],
+                   label=cat, edgecolors='black', linewidth=1)
+        for xi, yi, ni in zip(x, y, n):
+            if ni > 1:
+                ax.text(xi, yi, str(ni), ha='center', va='center', fontsize=7)
+
+
+def _draw_heatmap(ax: Any, counts: Any) -> None:
+    """Shade each cell by its total and list the categories present."""
+    total = counts.sum(axis=2)
+    image = ax.imshow(total.T, origin='lower', extent=(0.5, 5.5, 0.5, 5.5),
+                      cmap='Blues', aspect='auto', vmin=0)
+    ax.figure.colorbar(image, ax=ax, label='Factors')
+    ax.set_xticks(range(1, 6))
+    ax.set_yticks(range(1, 6))
+    threshold = total.max() / 2
+    for likelihood, impact in zip(*total.nonzero()):
+        parts = [f"{abbr} {n}" for abbr, n in zip(CATEGORY_ABBREVIATIONS, counts[likelihood, impact]) if n]
+        lines = [" ".join(parts[i:i + 3]) for i in range(0, len(parts), 3)]
+        color = 'white' if total[likelihood, impact] > threshold else 'black'
+        ax.text(likelihood + 1, impact + 1.15, str(total[likelihood, impact]), ha='center',
+                va='center', fontsize=11, fontweight='bold', color=color)
+        ax.text(likelihood + 1, impact + 0.85, "\n".join(lines), ha='center', va='center',
+                fontsize=6, color=color)
@@ -4,11 +4,18 @@ Porter's Five Forces Analysis Framework
 Analyzes the competitive intensity and attractiveness of an industry.
 """
 
-from typing import Optional, Dict, List
-import matplotlib.pyplot as plt
-import numpy as np
+import math
+from typing import Any, ContextManager, BinaryIO, Optional, Dict, List, Sequence, Tuple
 from dataclasses import dataclass
 
+from business_frameworks._plotting import DEFAULT_DPI, figure_context, finish, new_figure, resolve_show
+
+FORCE_NAMES = ("Competitive Rivalry", "Supplier Power", "Buyer Power",
+               "Threat of Substitutes", "Threat of New Entrants")
+COMPARE_MODES = ("auto", "overlay", "grid")
+OVERLAY_LIMIT = 6  # 'auto' overlays up to this many industries, then switches to a grid
+ROW_HEIGHT = 1.3  # grid mode: row pitch relative to column pitch, leaving room for labels
+
 
 @dataclass
 class Force:
@@ -123,14 +130,43 @@ class PortersFiveForces:
         print(report)
         return report
     
-    def plot(self, figsize: tuple = (10, 8), save_path: Optional[str] = None) -> None:
+    def figure(self, **plot_kw: Any) -> ContextManager[Any]:
+        """Headless ``plot(**plot_kw)`` figure, closed when the ``with`` block ends."""
+        return figure_context(self.plot, **plot_kw)
+    
+    def plot(self, figsize: tuple = (10, 8), save_path: Optional[str] = None,
+             show: Optional[bool] = None, format: Optional[str] = None, dpi: float = DEFAULT_DPI,
+             return_bytes: bool = False, buffer: Optional[BinaryIO] = None) -> Any:
         """
         Create a radar chart visualization of the five forces.
         
         Args:
             figsize: Figure size tuple (width, height)
             save_path: Optional path to save the figure
+            show: Display the chart; None (default) shows it only on an
+                interactive backend and when no bytes/buffer are requested
+            format: Image format for files, bytes and buffers
+                ('png', 'svg', 'pdf', 'webp', ...; files default to their extension)
+            dpi: Output resolution (lower it for thumbnails)
+            return_bytes: Return the encoded image instead of the figure
+            buffer: Writable binary file object to receive the image
+
+        Returns:
+            Image bytes when ``return_bytes`` is set; otherwise the matplotlib
+            Figure when it is not shown
         """
+        show = resolve_show(show, return_bytes, buffer)
+        fig, ax = new_figure(figsize, show, projection='polar')
+        
+        self._draw(ax)
+        
+        return finish(fig, save_path, show, format=format, dpi=dpi,
+                      return_bytes=return_bytes, buffer=buffer)
+    
+    def _draw(self, ax: Any) -> None:
+        """Draw the radar chart onto a polar ``ax``."""
+        import numpy as np
+        
         force_names = list(self.forces.keys())
         scores = [self.forces[name].score for name in force_names]
         
@@ -139,8 +175,6 @@ class PortersFiveForces:
         scores_plot = scores + [scores[0]]  # Complete the circle
         angles_plot = angles + [angles[0]]
         
-        fig, ax = plt.subplots(figsize=figsize, subplot_kw=dict(projection='polar'))
-        
         # Plot data
         ax.plot(angles_plot, scores_plot, 'o-', linewidth=2, color='#2E86AB', label='Current State')
         ax.fill(angles_plot, scores_plot, alpha=0.25, color='#2E86AB')
@@ -154,7 +188,7 @@ class PortersFiveForces:
         ax.grid(True, linestyle='--', alpha=0.7)
         
         # Add title
-        plt.title(
+        ax.set_title(
             f"Porter's Five Forces Analysis\n{self.industry}\n"
             f"Overall Score: {self.overall_attractiveness():.2f}/5.0",
             size=14,
@@ -164,13 +198,19 @@ class PortersFiveForces:
         
         # Add legend
         ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
+    
+    def compare(self, *others: "PortersFiveForces", **kwargs: Any) -> Any:
+        """
+        Plot this industry alongside others in one figure.
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        Args:
+            *others: Further PortersFiveForces analyses
+            **kwargs: Passed to ``plot_many`` (mode, figsize, save_path, ...)
         
-        plt.show()
+        Example:
+            >>> tech.compare(retail, airlines, mode="overlay")
+        """
+        return plot_many([self, *others], **kwargs)
     
     def to_dict(self) -> Dict:
         """Export analysis to dictionary format."""
@@ -186,3 +226,151 @@ class PortersFiveForces:
             "overall_attractiveness": self.overall_attractiveness(),
             "interpretation": self.get_interpretation()
         }
+    
+    def _repr_svg_(self) -> str:
+        """Notebook display as SVG (no matplotlib needed)."""
+        from business_frameworks.svg import render_svg
+        return render_svg(self)
+
+
+def score_matrix(analyses: Sequence[PortersFiveForces]) -> Any:
+    """
+    Force scores of many industries as one array.
+    
+    Returns:
+        Float NumPy array of shape (n_industries, 5), columns in
+        ``FORCE_NAMES`` order
+    """
+    import numpy as np
+    
+    return np.array([[a.forces[name].score for name in FORCE_NAMES] for a in analyses],
+                    dtype=float).reshape(len(analyses), len(FORCE_NAMES))
+
+
+def plot_many(analyses: Sequence[PortersFiveForces], mode: str = 'auto',
+              figsize: Optional[Tuple[float, float]] = None, cols: Optional[int] = None,
+              save_path: Optional[str] = None, show: Optional[bool] = None,
+              format: Optional[str] = None, dpi: float = DEFAULT_DPI,
+              return_bytes: bool = False, buffer: Optional[BinaryIO] = None) -> Any:
+    """
+    Compare several industries' Five Forces in a single figure.
+    
+    All polygons come from one ``score_matrix``. 'overlay' draws every
+    industry on one radar chart, which reads well for a handful.
+    'grid' draws small multiples: one radar per industry laid out on a
+    single equal-aspect axes, with all polygons, rings and spokes batched
+    into three collections, so a hundred industries cost about as much to
+    draw as one.
+    
+    Args:
+        analyses: PortersFiveForces objects to compare
+        mode: 'overlay', 'grid' or 'auto' (overlay up to ``OVERLAY_LIMIT``)
+        figsize: Figure size (default sized to the mode and grid)
+        cols: Radars per row in grid mode (default: near-square grid)
+        save_path: Optional path to save the figure
+        show: Display the chart; None (default) shows it only on an
+            interactive backend and when no bytes/buffer are requested
+        format: Image format for files, bytes and buffers
+        dpi: Output resolution
+        return_bytes: Return the encoded image instead of the figure
+        buffer: Writable binary file object to receive the image
+    
+    Returns:
+        Image bytes when ``return_bytes`` is set; otherwise the matplotlib
+        Figure when it is not shown
+    
+    Example:
+        >>> plot_many([loader.get_porters(t) for t in tickers], save_path="forces.png")
+    """
+    if mode not in COMPARE_MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(COMPARE_MODES)}")
+    analyses = list(analyses)
+    if not analyses:
+        raise ValueError("plot_many needs at least one analysis")
+    for analysis in analyses:
+        if not isinstance(analysis, PortersFiveForces):
+            raise ValueError(f"Expected PortersFiveForces, got {type(analysis).__name__}")
+    if mode == 'auto':
+        mode = 'overlay' if len(analyses) <= OVERLAY_LIMIT else 'grid'
+    
+    scores = score_matrix(analyses)
+    names = [a.industry for a in analyses]
+    show = resolve_show(show, return_bytes, buffer)
+    if mode == 'overlay':
+        fig, ax = new_figure(figsize or (10, 8), show, projection='polar')
+        _draw_overlay(ax, scores, names)
+    else:
+        cols = cols or math.ceil(math.sqrt(len(analyses)))
+        rows = math.ceil(len(analyses) / cols)
+        fig, ax = new_figure(figsize or (2.0 * cols + 1.5, 2.0 * ROW_HEIGHT * rows + 1.0), show)
+        _draw_grid(ax, scores, names, cols)
+    
+    return finish(fig, save_path, show, format=format, dpi=dpi,
+                  return_bytes=return_bytes, buffer=buffer)
+
+
+def _draw_overlay(ax: Any, scores: Any, names: List[str]) -> None:
+    """All industries on one polar radar, one closed polygon each."""
+    import numpy as np
+    
+    angles = np.linspace(0, 2 * np.pi, len(FORCE_NAMES), endpoint=False)
+    closed = np.append(angles, angles[0])
+    polygons = np.concatenate([scores, scores[:, :1]], axis=1)
+    for i, (name, row) in enumerate(zip(names, polygons)):
+        color = f"C{i % 10}"
+        ax.plot(closed, row, 'o-', linewidth=2, color=color, label=name)
+        ax.fill(closed, row, alpha=0.1, color=color)
+    
+    ax.set_xticks(angles)
+    ax.set_xticklabels(FORCE_NAMES, size=10)
+    ax.set_ylim(0, 5)
+    ax.set_yticks([1, 2, 3, 4, 5])
+    ax.set_yticklabels(['1', '2', '3', '4', '5'], size=8)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.set_title("Porter's Five Forces Comparison", size=14, weight='bold', pad=20)
+    ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
+
+
+def _draw_grid(ax: Any, scores: Any, names: List[str], cols: int) -> None:
+    """Small multiples: radar i sits in grid cell (i // cols, i % cols) of one axes."""
+    import numpy as np
+    from matplotlib.collections import LineCollection, PolyCollection
+    
+    n, k = scores.shape
+    rows = math.ceil(n / cols)
+    radius = 0.38  # of a unit cell, for a score of 5
+    angles = np.linspace(0, 2 * np.pi, k, endpoint=False)
+    unit = np.stack([np.cos(angles), np.sin(angles)], axis=1)        # (k, 2)
+    index = np.arange(n)
+    centers = np.stack([index % cols + 0.5, -(index // cols) * ROW_HEIGHT - 0.5], axis=1)  # (n, 2)
+    
+    # Industry polygons, coloured by overall score
+    verts = centers[:, None, :] + (scores / 5 * radius)[:, :, None] * unit
+    overall = scores.mean(axis=1)
+    polygons = PolyCollection(verts, array=overall, cmap='RdYlGn_r', clim=(1, 5),
+                              alpha=0.6, edgecolors='black', linewidths=0.8)
+    
+    # Score rings 1-5 and spokes, shared by every cell
+    levels = np.arange(1, 6) / 5 * radius
+    ring = np.concatenate([unit, unit[:1]])                           # closed (k + 1, 2)
+    rings = (centers[:, None, None, :] + levels[None, :, None, None] * ring).reshape(-1, k + 1, 2)
+    spoke_ends = centers[:, None, :] + radius * unit
+    spokes = np.stack([np.broadcast_to(centers[:, None, :], spoke_ends.shape), spoke_ends], axis=2)
+    ax.add_collection(LineCollection(rings, colors='#BBBBBB', linewidths=0.5, linestyles='--'))
+    ax.add_collection(LineCollection(spokes.reshape(-1, 2, 2), colors='#BBBBBB', linewidths=0.5))
+    ax.add_collection(polygons)
+    
+    fontsize = max(5, min(10, 60 / cols))
+    for (x, y), name, score in zip(centers, names, overall):
+        label = name if len(name) <= 28 else name[:25] + "..."
+        ax.text(x, y + radius + 0.04, f"{label}\n{score:.2f}/5.0", ha='center', va='bottom',
+                fontsize=fontsize)
+    
+    ax.set_xlim(0, cols)
+    ax.set_ylim(-(rows - 1) * ROW_HEIGHT - 1, 0.35)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_title("Porter's Five Forces Comparison", size=14, weight='bold')
+    ax.text(0.5, 0, "Spokes anticlockwise from the right: " + ", ".join(FORCE_NAMES),
+            transform=ax.transAxes, ha='center', va='top', fontsize=8, style='italic')
+    ax.figure.colorbar(polygons, ax=ax, shrink=0.6, label='Overall score (higher = harsher)')
@@ -0,0 +1,263 @@
+"""
+Warm Render Pool - Chart Workers That Skip matplotlib Start-Up
+
+Every fresh chart process pays for importing matplotlib, loading the font
+cache and initialising the backend before its first figure. WarmRenderPool
+does that set-up once in the parent and then forks its workers, so they start
+with everything already loaded (on platforms without ``fork`` each worker
+warms itself once instead). Workers are recycled after a fixed number of jobs
+to cap memory growth, and job latency is measured separately from warm-up.
+``render_many`` is the batch front-end: a directory of charts in one call.
+"""
+
+import multiprocessing
+import os
+from pathlib import Path
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+
+@dataclass
+class RenderResult:
+    """Outcome of one render job."""
+    path: Optional[str]
+    data: Optional[bytes]
+    seconds: float  # time spent rendering this job, excluding worker warm-up
+    worker_pid: int
+    worker_warmup_seconds: float  # one-off cost paid by this worker (~0 when forked warm)
+    error: Optional[str] = None  # set instead of raising, so one bad chart doesn't stop a batch
+
+
+_WORKER_WARMUP = 0.0
+
+
+def _preload() -> None:
+    """Import matplotlib and draw once with Agg, without touching pyplot state."""
+    import matplotlib.pyplot  # noqa: F401  (imported for its side effects only)
+    from matplotlib import font_manager
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    font_manager.findfont(font_manager.FontProperties())  # loads the font cache
+    # Draw once so glyph caches, the renderer and text layout are initialised
+    fig = Figure(figsize=(2, 2), dpi=50)
+    ax = fig.add_subplot()
+    ax.text(0.5, 0.5, "Warm-up", fontsize=12, fontweight="bold")
+    ax.scatter([0.2], [0.2])
+    FigureCanvasAgg(fig).draw()
+
+
+def warm_up(backend: str = "Agg") -> float:
+    """
+    Import matplotlib, load fonts and select ``backend`` in this process.
+
+    Returns:
+        Seconds spent (close to zero when the process is already warm)
+    """
+    start = time.perf_counter()
+    _preload()
+    import matplotlib
+    matplotlib.use(backend)
+    return time.perf_counter() - start
+
+
+def _init_worker(backend: str) -> None:
+    global _WORKER_WARMUP
+    _WORKER_WARMUP = warm_up(backend)
+
+
+def draw(obj: Any, **plot_kw: Any) -> Any:
+    """
+    Draw a framework's chart headless and return its Figure.
+
+    Uses ``plot(show=False)`` (``plot_impact_matrix`` for PESTEL), so pyplot
+    never sees the figure and nothing is shown. ``plot_kw`` are passed on
+    as drawing options (e.g. ``figsize``).
+    """
+    method = getattr(obj, "plot", None) or getattr(obj, "plot_impact_matrix", None)
+    if method is None:
+        raise ValueError(f"{type(obj).__name__} has no plot method")
+    fig = method(show=False, **plot_kw)
+    if fig is None:
+        raise ValueError(f"{type(obj).__name__} has nothing to plot")
+    return fig
+
+
+def render_figure(obj: Any, save_path: Optional[str] = None, format: str = "png",
+                  dpi: int = 100) -> Optional[bytes]:
+    """
+    Render a framework's chart without showing it.
+
+    Args:
+        obj: Any framework object with a ``plot()`` method
+        save_path: File to write; when omitted the encoded image is returned
+        format: Image format ('png', 'svg', 'pdf', ...)
+        dpi: Output resolution
+
+    Returns:
+        Encoded image bytes when ``save_path`` is None
+    """
+    from business_frameworks._plotting import close, encode
+
+    fig = draw(obj)
+    try:
+        if save_path is not None:
+            fig.savefig(save_path, format=format, dpi=dpi, bbox_inches="tight")
+            return None
+        return encode(fig, format, dpi)
+    finally:
+        close(fig)  # free artists and pixels now rather than at the next GC cycle
+
+
+def _render_job(job: Tuple[Any, Optional[str], str, int]) -> RenderResult:
+    obj, save_path, format, dpi = job
+    start = time.perf_counter()
+    data, error = None, None
+    try:
+        data = render_figure(obj, save_path, format, dpi)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return RenderResult(save_path, data, time.perf_counter() - start,
+                        os.getpid(), _WORKER_WARMUP, error)
+
+
+class WarmRenderPool:
+    """
+    Process pool for rendering framework charts with warm workers.
+
+    Args:
+        processes: Worker count (default: CPU count)
+        max_jobs_per_worker: Replace a worker after this many jobs (None = never)
+        backend: Non-interactive matplotlib backend to use
+        start_method: multiprocessing start method (default: 'fork' when available)
+
+    Example:
+        >>> with WarmRenderPool(processes=4, max_jobs_per_worker=200) as pool:
+        ...     print(f"warm-up: {pool.warmup_seconds:.2f}s")
+        ...     for result in pool.map([(swot, 'swot.png'), (bcg, 'bcg.png')]):
+        ...         print(result.path, f"{result.seconds * 1000:.0f} ms")
+    """
+
+    def __init__(self, processes: Optional[int] = None,
+                 max_jobs_per_worker: Optional[int] = 100, backend: str = "Agg",
+                 start_method: Optional[str] = None):
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "fork" if "fork" in methods else methods[0]
+        # Warm the parent first: forked workers inherit the loaded state. The
+        # parent's own pyplot backend is left alone.
+        self.warmup_seconds = 0.0
+        if start_method == "fork":
+            start = time.perf_counter()
+            _preload()
+            self.warmup_seconds = time.perf_counter() - start
+        context = multiprocessing.get_context(start_method)
+        self._pool = context.Pool(processes, initializer=_init_worker, initargs=(backend,),
+                                  maxtasksperchild=max_jobs_per_worker)
+        self._timings: List[float] = []
+
+    def submit(self, obj: Any, save_path: Optional[str] = None, format: str = "png",
+               dpi: int = 100) -> Any:
+        """Queue one chart; returns an AsyncResult yielding a RenderResult."""
+        return self._pool.apply_async(_render_job, ((obj, save_path, format, dpi),),
+                                      callback=self._record)
+
+    def render(self, obj: Any, save_path: Optional[str] = None, format: str = "png",
+               dpi: int = 100) -> RenderResult:
+        """Render one chart and wait for it."""
+        return self.submit(obj, save_path, format, dpi).get()
+
+    def map(self, jobs: Iterable[Tuple], format: str = "png",
+            dpi: int = 100) -> Iterator[RenderResult]:
+        """
+        Render ``(obj, save_path)`` pairs, yielding results in input order.
+
+        ``save_path`` may be None to get the image bytes back instead.
+        """
+        work = [(obj, path, format, dpi) for obj, path in jobs]
+        for result in self._pool.imap(_render_job, work):
+            self._record(result)
+            yield result
+
+    def stats(self) -> Dict[str, float]:
+        """Warm-up cost and per-job latency summary."""
+        timings = sorted(self._timings)
+        if not timings:
+            return {"warmup_seconds": self.warmup_seconds, "jobs": 0}
+        return {
+            "warmup_seconds": self.warmup_seconds,
+            "jobs": len(timings),
+            "mean_job_seconds": sum(timings) / len(timings),
+            "p95_job_seconds": timings[min(len(timings) - 1, int(0.95 * len(timings)))],
+            "max_job_seconds": timings[-1],
+        }
+
+    def close(self) -> None:
+        """Stop accepting jobs and wait for the workers to finish."""
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self) -> None:
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self) -> "WarmRenderPool":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def _record(self, result: RenderResult) -> None:
+        self._timings.append(result.seconds)
+
+
+def render_many(objects: Union[Mapping[str, Any], Iterable[Any]], out_dir: str,
+                format: str = "png", processes: Optional[int] = None, dpi: int = 100,
+                max_jobs_per_worker: Optional[int] = 100) -> List[RenderResult]:
+    """
+    Render many framework charts to files on the Agg backend.
+
+    Charts are drawn headless (``show()`` is never called), each figure is
+    released as soon as it is written, and the work is spread over a
+    ``WarmRenderPool``. A chart that fails is reported in its result's
+    ``error`` instead of stopping the batch.
+
+    Args:
+        objects: Framework objects, or a mapping of file stem -> object
+        out_dir: Directory for the images (created if missing)
+        format: Image format ('png', 'svg', 'pdf', ...)
+        processes: Worker processes (default: CPU count; 1 renders in-process)
+        dpi: Output resolution
+        max_jobs_per_worker: Recycle a worker after this many charts
+
+    Returns:
+        One RenderResult per chart, in input order, with per-chart timings
+
+    Example:
+        >>> loader = CompanyDataLoader()
+        >>> charts = {f"{t}_swot": loader.get_swot(t) for t in loader.list_tickers()}
+        >>> results = render_many(charts, "charts/", processes=8)
+        >>> slowest = max(results, key=lambda r: r.seconds)
+    """
+    if isinstance(objects, Mapping):
+        named = list(objects.items())
+    else:
+        named = [(f"{i:04d}_{type(obj).__name__.lower()}", obj)
+                 for i, obj in enumerate(objects)]
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(obj, str(Path(out_dir) / f"{stem}.{format}")) for stem, obj in named]
+    if not jobs:
+        return []
+
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+    if processes == 1:
+        # Figures are drawn on their own Agg canvas, so the caller's pyplot
+        # backend is left alone here
+        return [_render_job((obj, path, format, dpi)) for obj, path in jobs]
+
+    with WarmRenderPool(processes, max_jobs_per_worker=max_jobs_per_worker) as pool:
+        return list(pool.map(jobs, format=format, dpi=dpi))
@@ -0,0 +1,300 @@
+"""
+Sharded Processing - Spread Universe-Wide Jobs Across Worker Nodes
+
+Partitions the company universe into N shards by a stable hash of the ticker
+and hands the shards out to workers through a small coordinator that speaks
+``multiprocessing.connection`` over TCP. The coordinator tracks completion,
+re-queues shards whose worker failed or went silent, and gives up on a shard
+after ``max_attempts``. Several worker processes on one host can stand in for
+separate nodes.
+"""
+
+import os
+import socket
+import threading
+import time
+import traceback
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Listener
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+Address = Tuple[str, int]
+
+
+def shard_of(ticker: str, num_shards: int) -> int:
+    """
+    Stable shard number for a ticker.
+
+    Uses CRC-32 rather than ``hash()`` so every process and host agrees on
+    the assignment regardless of ``PYTHONHASHSEED``.
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards must be at least 1")
+    return zlib.crc32(ticker.upper().encode("utf-8")) % num_shards
+
+
+def partition(tickers: Iterable[str], num_shards: int) -> List[List[str]]:
+    """Split tickers into ``num_shards`` sorted lists (some may be empty)."""
+    shards: List[List[str]] = [[] for _ in range(num_shards)]
+    for ticker in sorted(set(t.upper() for t in tickers)):
+        shards[shard_of(ticker, num_shards)].append(ticker)
+    return shards
+
+
+@dataclass
+class ShardStatus:
+    """Book-keeping for one shard."""
+    shard_id: int
+    tickers: List[str]
+    state: str = "pending"  # pending | leased | done | failed
+    attempts: int = 0
+    worker: Optional[str] = None
+    leased_at: Optional[float] = None
+    error: Optional[str] = None
+    results: List[Any] = field(default_factory=list)
+
+
+class ShardCoordinator:
+    """
+    Hand out shards of the company universe to workers and track them.
+
+    Args:
+        tickers: Tickers to process (e.g. ``CompanyDataLoader().list_tickers()``)
+        num_shards: Number of shards to split them into
+        address: ``(host, port)`` to listen on; port 0 picks a free port
+        authkey: Shared secret workers must present (random if omitted)
+        max_attempts: Times a shard is handed out before it is marked failed
+        lease_timeout: Seconds after which an unfinished lease is assumed
+            dead and the shard is re-queued (None = never). Shards held by a
+            worker whose connection drops are re-queued straight away; the
+            timeout catches workers that hang while still connected.
+
+    Example:
+        >>> loader = CompanyDataLoader()
+        >>> with ShardCoordinator(loader.list_tickers(), num_shards=64) as coord:
+        ...     print(coord.address, coord.authkey.hex())  # give these to workers
+        ...     coord.wait()
+        >>> # on each node:
+        >>> run_worker(address, render_company, authkey=bytes.fromhex(key))
+    """
+
+    def __init__(self, tickers: Iterable[str], num_shards: int,
+                 address: Address = ("127.0.0.1", 0), authkey: Optional[bytes] = None,
+                 max_attempts: int = 3, lease_timeout: Optional[float] = None):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self.max_attempts = max_attempts
+        self.lease_timeout = lease_timeout
+        self.shards: Dict[int, ShardStatus] = {}
+        self._pending: Deque[int] = deque()
+        for shard_id, shard_tickers in enumerate(partition(tickers, num_shards)):
+            status = ShardStatus(shard_id, shard_tickers)
+            if shard_tickers:
+                self._pending.append(shard_id)
+            else:
+                status.state = "done"
+            self.shards[shard_id] = status
+
+        self._requested_address = address
+        self._listener: Optional[Listener] = None
+        self._changed = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def address(self) -> Address:
+        """Address workers should connect to (available after ``start()``)."""
+        if self._listener is None:
+            raise RuntimeError("Coordinator is not running; call start() first")
+        return self._listener.address
+
+    @property
+    def finished(self) -> bool:
+        """True once every shard is done or has permanently failed."""
+        with self._changed:
+            return all(s.state in ("done", "failed") for s in self.shards.values())
+
+    def start(self) -> Address:
+        """Start accepting workers in background threads."""
+        if self._listener is None:
+            self._listener = Listener(self._requested_address, authkey=self.authkey)
+            self._spawn(self._accept_loop)
+        return self.address
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until all shards finish. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while not all(s.state in ("done", "failed") for s in self.shards.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                # Wake up periodically so expired leases are noticed even
+                # when no worker is talking to us.
+                self._changed.wait(0.5 if remaining is None else min(remaining, 0.5))
+                self._expire_leases()
+        return True
+
+    def close(self) -> None:
+        """Stop accepting workers."""
+        if self._listener is not None:
+            self._listener.close()
+
+    def summary(self) -> Dict[str, int]:
+        """Count shards per state."""
+        with self._changed:
+            counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+            for status in self.shards.values():
+                counts[status.state] += 1
+            return counts
+
+    def __enter__(self) -> "ShardCoordinator":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _spawn(self, target: Callable, *args: Any) -> None:
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except OSError:  # listener closed
+                return
+            except Exception:  # failed handshake from a stray client
+                continue
+            self._spawn(self._serve, conn)
+
+    def _serve(self, conn: Any) -> None:
+        held: Dict[int, float] = {}  # shard id -> leased_at of leases on this connection
+        try:
+            with conn:
+                while True:
+                    message = conn.recv()
+                    conn.send(self._dispatch(message, held))
+        except Exception:  # worker gone (EOF, reset) or sent something unreadable
+            pass
+        finally:
+            self._release(held)
+
+    def _dispatch(self, message: Any, held: Optional[Dict[int, float]] = None) -> Tuple:
+        if not isinstance(message, tuple) or not message:
+            return ("error", f"malformed message {message!r}")
+        kind, args = message[0], message[1:]
+        with self._changed:
+            if kind == "lease" and len(args) == 1:
+                reply = self._lease(args[0])
+                if held is not None and reply[0] == "shard":
+                    held[reply[1]] = self.shards[reply[1]].leased_at
+                return reply
+            if kind in ("complete", "fail") and len(args) == 2:
+                shard_id, payload = args
+                status = self.shards.get(shard_id)
+                if status is None:
+                    return ("error", f"unknown shard {shard_id!r}")
+                if held is not None:
+                    held.pop(shard_id, None)
+                if kind == "complete" and status.state != "done":
+                    try:
+                        results = list(payload)
+                    except TypeError:
+                        return ("error", f"results for shard {shard_id} are not a list")
+                    status.state, status.results, status.error = "done", results, None
+                    self._changed.notify_all()
+                elif kind == "fail" and status.state == "leased":
+                    status.error = str(payload)
+                    self._requeue(status)
+                return ("ok",)
+        return ("error", f"unknown message {kind!r}")
+
+    def _release(self, held: Dict[int, float]) -> None:
+        """Re-queue shards still leased on a connection that has closed."""
+        with self._changed:
+            for shard_id, leased_at in held.items():
+                status = self.shards[shard_id]
+                # Skip leases that already expired and were handed to someone else
+                if status.state == "leased" and status.leased_at == leased_at:
+                    status.error = f"worker {status.worker} disconnected"
+                    self._requeue(status)
+
+    def _lease(self, worker: str) -> Tuple:
+        self._expire_leases()
+        while self._pending:
+            status = self.shards[self._pending.popleft()]
+            if status.state != "pending":  # finished late by an expired lease
+                continue
+            status.state, status.worker = "leased", worker
+            status.leased_at = time.monotonic()
+            status.attempts += 1
+            return ("shard", status.shard_id, list(status.tickers))
+        if any(s.state == "leased" for s in self.shards.values()):
+            return ("wait", 0.1)
+        return ("done",)
+
+    def _expire_leases(self) -> None:
+        if self.lease_timeout is None:
+            return
+        now = time.monotonic()
+        for status in self.shards.values():
+            if status.state == "leased" and now - status.leased_at > self.lease_timeout:
+                status.error = f"lease expired on worker {status.worker}"
+                self._requeue(status)
+
+    def _requeue(self, status: ShardStatus) -> None:
+        if status.attempts >= self.max_attempts:
+            status.state = "failed"
+        else:
+            status.state = "pending"
+            self._pending.append(status.shard_id)
+        status.worker = status.leased_at = None
+        self._changed.notify_all()
+
+
+def run_worker(address: Address, job: Callable[[str], Any], authkey: bytes,
+               worker_id: Optional[str] = None) -> int:
+    """
+    Process shards from a coordinator until none are left.
+
+    ``job(ticker)`` is called for every ticker in a leased shard; its return
+    values (keep them small, e.g. output paths) are reported back. If it
+    raises, the whole shard is reported as failed and re-queued.
+
+    Args:
+        address: Coordinator address
+        job: Callable run once per ticker
+        authkey: The coordinator's shared secret
+        worker_id: Name shown in coordinator status (default ``host:pid``)
+
+    Returns:
+        Number of shards this worker completed
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    completed = 0
+    with Client(address, authkey=authkey) as conn:
+        while True:
+            conn.send(("lease", worker_id))
+            reply = conn.recv()
+            if reply[0] == "done":
+                return completed
+            if reply[0] == "error":
+                raise RuntimeError(f"Coordinator rejected lease: {reply[1]}")
+            if reply[0] == "wait":
+                time.sleep(reply[1])
+                continue
+            _, shard_id, tickers = reply
+            try:
+                results = [job(ticker) for ticker in tickers]
+            except Exception:
+                conn.send(("fail", shard_id, traceback.format_exc()))
+            else:
+                conn.send(("complete", shard_id, results))
+                completed += 1
+            conn.recv()
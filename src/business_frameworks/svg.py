@@ -0,0 +1,508 @@
+"""
+SVG Charts - Vector Output for All Five Frameworks without matplotlib
+
+Writes SVG (and HTML pages of SVGs) straight from each framework's
+``to_dict()`` data. The layout follows the matplotlib charts (same figure
+sizes, colours, fonts and positions) but nothing is rasterised and no
+plotting library is imported, so a chart takes a fraction of a millisecond.
+Coordinates are in points (72 per inch), so font sizes match the ``plot``
+methods one for one. SWOT and Ansoff items are wrapped and fitted with
+``text_layout`` like the charts, using the bundled DejaVu Sans metrics.
+
+Example:
+    >>> from business_frameworks.svg import render_svg, render_html
+    >>> svg = render_svg(swot)                 # or swot_svg(swot.to_dict())
+    >>> html = render_html([swot, porters, bcg], title="Apple Inc.")
+
+In Jupyter the framework objects display through ``_repr_svg_``.
+"""
+
+import itertools
+import math
+from html import escape
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from business_frameworks import ansoff_matrix, swot
+from business_frameworks.ansoff_matrix import QUADRANTS as ANSOFF_QUADRANTS
+from business_frameworks.ansoff_matrix import STRATEGY_COLORS
+from business_frameworks.bcg_matrix import CATEGORY_COLORS
+from business_frameworks.pestel import CATEGORIES as PESTEL_CATEGORIES
+from business_frameworks.pestel import CATEGORY_ABBREVIATIONS, DENSITY_THRESHOLD, MODES
+from business_frameworks.pestel import CATEGORY_COLORS as PESTEL_COLORS
+from business_frameworks.swot import QUADRANTS as SWOT_QUADRANTS
+from business_frameworks.swot import SWOTItem
+from business_frameworks.text_layout import LINE_SPACING, fitted_lines
+
+FONT = "DejaVu Sans, Verdana, Arial, sans-serif"
+PT = 72  # SVG units per inch
+
+_CLIP_IDS = itertools.count()  # unique ids, so several charts can share an HTML page
+
+# SVG dominant-baseline for matplotlib's vertical alignments
+_BASELINE = {"top": "hanging", "center": "central", "bottom": None, "baseline": None}
+_ANCHOR = {"left": "start", "center": "middle", "right": "end"}
+
+
+# matplotlib's 'Blues' colormap, sampled at nine even steps
+_BLUES = ("#f7fbff", "#deebf7", "#c6dbef", "#9ecae1", "#6baed6", "#4292c6", "#2171b5",
+          "#08519c", "#08306b")
+
+
+def _n(value: float) -> str:
+    return f"{value:.1f}".rstrip("0").rstrip(".")
+
+
+class _Svg:
+    """Minimal SVG element writer."""
+
+    def __init__(self, width: float, height: float):
+        self.width = width
+        self.height = height
+        self.parts: List[str] = []
+
+    @staticmethod
+    def _attrs(attrs: Dict[str, Any]) -> str:
+        return "".join(f' {k.replace("_", "-")}="{_n(v) if isinstance(v, float) else v}"'
+                       for k, v in attrs.items() if v is not None)
+
+    def rect(self, x: float, y: float, w: float, h: float, **attrs: Any) -> None:
+        self.parts.append(f'<rect x="{_n(x)}" y="{_n(y)}" width="{_n(w)}" height="{_n(h)}"'
+                          f'{self._attrs(attrs)}/>')
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, **attrs: Any) -> None:
+        self.parts.append(f'<line x1="{_n(x1)}" y1="{_n(y1)}" x2="{_n(x2)}" y2="{_n(y2)}"'
+                          f'{self._attrs(attrs)}/>')
+
+    def circle(self, cx: float, cy: float, r: float, **attrs: Any) -> None:
+        self.parts.append(f'<circle cx="{_n(cx)}" cy="{_n(cy)}" r="{_n(r)}"{self._attrs(attrs)}/>')
+
+    def polygon(self, points: Iterable[Tuple[float, float]], **attrs: Any) -> None:
+        coords = " ".join(f"{_n(x)},{_n(y)}" for x, y in points)
+        self.parts.append(f'<polygon points="{coords}"{self._attrs(attrs)}/>')
+
+    def text(self, x: float, y: float, text: str, size: float, ha: str = "left",
+             va: str = "baseline", weight: Optional[str] = None, rotation: float = 0,
+             **attrs: Any) -> None:
+        lines = str(text).split("\n")
+        if len(lines) > 1 and va == "center":
+            y -= (len(lines) - 1) * 0.6 * size
+        elif len(lines) > 1 and va in ("bottom", "baseline"):
+            y -= (len(lines) - 1) * 1.2 * size
+        attrs.update(font_size=_n(size), text_anchor=_ANCHOR[ha],
+                     dominant_baseline=_BASELINE[va], font_weight=weight,
+                     transform=f"rotate({_n(-rotation)} {_n(x)} {_n(y)})" if rotation else None)
+        if len(lines) == 1:
+            body = escape(lines[0])
+        else:
+            body = "".join(f'<tspan x="{_n(x)}" dy="{0 if i == 0 else 1.2}em">{escape(line)}</tspan>'
+                           for i, line in enumerate(lines))
+        self.parts.append(f'<text x="{_n(x)}" y="{_n(y)}"{self._attrs(attrs)}>{body}</text>')
+
+    def render(self) -> str:
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{_n(self.width)}" '
+                f'height="{_n(self.height)}" viewBox="0 0 {_n(self.width)} {_n(self.height)}" '
+                f'font-family="{FONT}">'
+                f'<rect width="100%" height="100%" fill="white"/>'
+                + "".join(self.parts) + "</svg>")
+
+
+def _marker_radius(area: float) -> float:
+    """Radius of a matplotlib scatter marker of ``area`` points squared (its diameter is ``sqrt(s)``)."""
+    return math.sqrt(max(area, 0)) / 2
+
+
+def _blues(fraction: float) -> str:
+    """Colour at ``fraction`` (0..1) along ``_BLUES``, interpolated linearly."""
+    position = min(max(fraction, 0.0), 1.0) * (len(_BLUES) - 1)
+    i = min(int(position), len(_BLUES) - 2)
+    lo, hi = _BLUES[i], _BLUES[i + 1]
+    mix = position - i
+    channels = (round(int(lo[k:k + 2], 16) * (1 - mix) + int(hi[k:k + 2], 16) * mix)
+                for k in (1, 3, 5))
+    return "#" + "".join(f"{c:02x}" for c in channels)
+
+
+def _nice_ticks(lo: float, hi: float, most: int = 8) -> List[float]:
+    """Round tick values covering [lo, hi], like matplotlib's default locator."""
+    span = hi - lo
+    if span <= 0:
+        return [lo]
+    magnitude = 10 ** math.floor(math.log10(span / most))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if span / (m * magnitude) <= most)
+    first = math.ceil(lo / step - 1e-9)
+    return [round((first + i) * step, 10) for i in range(int((hi - lo) / step + 1e-9) + 1)
+            if (first + i) * step <= hi + 1e-9]
+
+
+class _Axes:
+    """Cartesian plot area mapping data coordinates to SVG points."""
+
+    def __init__(self, svg: _Svg, box: Tuple[float, float, float, float],
+                 xlim: Tuple[float, float], ylim: Tuple[float, float]):
+        self.svg = svg
+        self.x0, self.y0, self.x1, self.y1 = box
+        self.xlim, self.ylim = xlim, ylim
+
+    def x(self, value: float) -> float:
+        return self.x0 + (value - self.xlim[0]) / (self.xlim[1] - self.xlim[0]) * (self.x1 - self.x0)
+
+    def y(self, value: float) -> float:
+        return self.y1 - (value - self.ylim[0]) / (self.ylim[1] - self.ylim[0]) * (self.y1 - self.y0)
+
+    def frame(self, xlabel: str, ylabel: str, grid_alpha: float = 0.3) -> None:
+        svg = self.svg
+        for values, axis in ((_nice_ticks(*self.xlim), "x"), (_nice_ticks(*self.ylim), "y")):
+            decimals = 1 if any(v != int(v) for v in values) else 0
+            for value in values:
+                label = f"{value:.{decimals}f}"
+                if axis == "x":
+                    x = self.x(value)
+                    svg.line(x, self.y0, x, self.y1, stroke="#b0b0b0", stroke_opacity=grid_alpha)
+                    svg.line(x, self.y1, x, self.y1 + 3.5, stroke="black")
+                    svg.text(x, self.y1 + 6, label, 10, ha="center", va="top")
+                else:
+                    y = self.y(value)
+                    svg.line(self.x0, y, self.x1, y, stroke="#b0b0b0", stroke_opacity=grid_alpha)
+                    svg.line(self.x0 - 3.5, y, self.x0, y, stroke="black")
+                    svg.text(self.x0 - 6, y, label, 10, ha="right", va="center")
+        svg.rect(self.x0, self.y0, self.x1 - self.x0, self.y1 - self.y0,
+                 fill="none", stroke="black", stroke_width=0.8)
+        svg.text((self.x0 + self.x1) / 2, self.y1 + 24, xlabel, 12, ha="center", va="top",
+                 weight="bold")
+        svg.text(self.x0 - 32, (self.y0 + self.y1) / 2, ylabel, 12, ha="center",
+                 va="bottom", weight="bold", rotation=90)
+
+    def clip(self, name: str) -> str:
+        """Define a clip path for the plot area and return its reference."""
+        self.svg.parts.append(f'<clipPath id="{name}"><rect x="{_n(self.x0)}" y="{_n(self.y0)}" '
+                              f'width="{_n(self.x1 - self.x0)}" height="{_n(self.y1 - self.y0)}"/>'
+                              f'</clipPath>')
+        return f"url(#{name})"
+
+
+def _legend(svg: _Svg, entries: Sequence[Tuple[str, str]], x: float, y: float,
+            anchor: str = "left", marker: str = "circle", size: float = 10) -> None:
+    """Framed legend with coloured markers; (x, y) is its top-left or top-right corner."""
+    if not entries:
+        return
+    width = 34 + 0.6 * size * max(len(label) for label, _ in entries)
+    height = 8 + 1.4 * size * len(entries)
+    left = x if anchor == "left" else x - width
+    svg.rect(left, y, width, height, fill="white", fill_opacity=0.8, stroke="#cccccc", rx=3)
+    for i, (label, color) in enumerate(entries):
+        cy = y + 4 + 1.4 * size * (i + 0.5)
+        if marker == "circle":
+            svg.circle(left + 14, cy, 0.55 * size, fill=color, fill_opacity=0.6,
+                       stroke="black", stroke_opacity=0.6, stroke_width=1.5)
+        else:
+            svg.line(left + 6, cy, left + 22, cy, stroke=color, stroke_width=2)
+            svg.circle(left + 14, cy, 3, fill=color)
+        svg.text(left + 28, cy, label, size, va="center")
+
+
+def _draw_fitted(axes: "_Axes", items: Sequence[str], x: float, top: float, width: float,
+                 height: float, note: str = "+{n} more", **fit_kw: Any) -> None:
+    """Fit ``items`` into a box of ``axes`` (data units) and write them, like ``draw_fitted``."""
+    fontsize, lines = fitted_lines(items, axes.x(width) - axes.x(0), axes.y(0) - axes.y(height),
+                                   note=note, **fit_kw)
+    for i, line in enumerate(lines):
+        # pre keeps the hanging indent of wrapped lines
+        axes.svg.text(axes.x(x), axes.y(top) + i * fontsize * LINE_SPACING, line, fontsize,
+                      va="top", style="white-space:pre")
+
+
+def _item_text(item: Any) -> str:
+    if isinstance(item, dict):
+        item = SWOTItem(**item)
+    return str(item)
+
+
+def swot_svg(data: Dict) -> str:
+    """SWOT grid from ``SWOT.to_dict()`` data."""
+    svg = _Svg(12 * PT, 10 * PT)
+    svg.text(svg.width / 2, 16, f"SWOT Analysis: {data['company']}", 16, ha="center",
+             va="top", weight="bold")
+    axes = _Axes(svg, (11.5, 46, svg.width - 11.5, svg.height - 11.5), (0, 2), (0, 2))
+    for title, section, x, y, color in SWOT_QUADRANTS:
+        svg.rect(axes.x(x), axes.y(y + 1), axes.x(1) - axes.x(0), axes.y(0) - axes.y(1),
+                 fill=color, stroke="black", stroke_width=2, opacity=0.2)
+        svg.text(axes.x(x + 0.5), axes.y(y + 0.95), title, 14, ha="center", va="top",
+                 weight="bold")
+        _draw_fitted(axes, [_item_text(item) for item in data.get(section, [])],
+                     x + swot.ITEM_LEFT, y + swot.ITEM_TOP, swot.ITEM_WIDTH, swot.ITEM_HEIGHT,
+                     note="+{n} more (see plot_pages)")
+    return svg.render()
+
+
+def ansoff_svg(data: Dict) -> str:
+    """Ansoff quadrants from ``AnsoffMatrix.to_dict()`` data."""
+    svg = _Svg(12 * PT, 10 * PT)
+    width, height = svg.width, svg.height
+    axes = _Axes(svg, (11.5, 60, width - 11.5, height - 11.5), (0, 2), (0, 2))
+    for strategy, x, y in ANSOFF_QUADRANTS:
+        details = data["strategies"][strategy]
+        left, top = axes.x(x), axes.y(y + 1)
+        side_x, side_y = axes.x(1) - axes.x(0), axes.y(0) - axes.y(1)
+        svg.rect(left, top, side_x, side_y, fill=STRATEGY_COLORS[strategy],
+                 stroke="black", stroke_width=3, opacity=0.3)
+        svg.text(axes.x(x + 0.5), axes.y(y + 0.92), strategy.upper(), 13, ha="center",
+                 va="top", weight="bold")
+        risk = f"Risk: {details['risk']}"
+        badge = 0.6 * 10 * len(risk) + 8
+        svg.rect(axes.x(x + 0.5) - badge / 2, axes.y(y + 0.82) - 3, badge, 17, rx=4,
+                 fill="white", fill_opacity=0.7, stroke="black", stroke_opacity=0.7)
+        svg.text(axes.x(x + 0.5), axes.y(y + 0.82), risk, 10, ha="center", va="top",
+                 font_style="italic")
+        if details["initiatives"]:
+            _draw_fitted(axes, details["initiatives"], x + ansoff_matrix.ITEM_LEFT,
+                         y + ansoff_matrix.ITEM_TOP, ansoff_matrix.ITEM_WIDTH,
+                         ansoff_matrix.ITEM_HEIGHT, min_fontsize=7)
+        if data.get("current_strategy") == strategy:
+            svg.rect(left, top, side_x, side_y, fill="none", stroke="blue", stroke_width=5)
+            svg.text(axes.x(x + 0.5), axes.y(y + 0.05), "★ CURRENT", 11, ha="center",
+                     va="bottom", weight="bold", fill="blue")
+
+    def fig_text(fx: float, fy: float, text: str, size: float, **kw: Any) -> None:
+        svg.text(fx * width, (1 - fy) * height, text, size, **kw)
+
+    fig_text(0.5, 0.95, 'PRODUCTS', 14, ha="center", weight="bold")
+    fig_text(0.25, 0.93, 'EXISTING', 11, ha="center")
+    fig_text(0.75, 0.93, 'NEW', 11, ha="center")
+    fig_text(0.08, 0.5, 'MARKETS', 14, va="center", weight="bold", rotation=90)
+    fig_text(0.06, 0.75, 'EXISTING', 11, va="center", rotation=90)
+    fig_text(0.06, 0.25, 'NEW', 11, va="center", rotation=90)
+    fig_text(0.5, 0.98, f"Ansoff Matrix: Growth Strategy Analysis\n{data['company']}", 16,
+             ha="center", va="top", weight="bold")
+    return svg.render()
+
+
+def porters_svg(data: Dict) -> str:
+    """Five-forces radar from ``PortersFiveForces.to_dict()`` data."""
+    svg = _Svg(10 * PT, 8 * PT)
+    names = list(data["forces"])
+    scores = [data["forces"][name]["score"] for name in names]
+    cx, cy, radius = 0.47 * svg.width, 0.57 * svg.height, 0.3 * svg.height
+    angles = [2 * math.pi * i / len(names) for i in range(len(names))]
+
+    def point(angle: float, value: float) -> Tuple[float, float]:
+        return cx + radius * value / 5 * math.cos(angle), cy - radius * value / 5 * math.sin(angle)
+
+    svg.circle(cx, cy, radius, fill="none", stroke="black", stroke_width=0.8)
+    for level in range(1, 6):
+        svg.circle(cx, cy, radius * level / 5, fill="none", stroke="#b0b0b0",
+                   stroke_dasharray="4,2", stroke_opacity=0.7)
+        x, y = point(math.radians(22.5), level)
+        svg.text(x + 2, y, str(level), 8, va="bottom")
+    for angle, name in zip(angles, names):
+        svg.line(cx, cy, *point(angle, 5), stroke="#b0b0b0", stroke_dasharray="4,2",
+                 stroke_opacity=0.7)
+        x, y = point(angle, 5.6)
+        ha = "center" if abs(math.cos(angle)) < 0.3 else ("left" if math.cos(angle) > 0 else "right")
+        svg.text(x, y, name, 10, ha=ha, va="center")
+
+    outline = [point(a, s) for a, s in zip(angles, scores)]
+    svg.polygon(outline, fill="#2E86AB", fill_opacity=0.25, stroke="#2E86AB", stroke_width=2)
+    for x, y in outline:
+        svg.circle(x, y, 3, fill="#2E86AB")
+
+    svg.text(cx, 14, f"Porter's Five Forces Analysis\n{data['industry']}\n"
+             f"Overall Score: {data['overall_attractiveness']:.2f}/5.0", 14, ha="center",
+             va="top", weight="bold")
+    _legend(svg, [("Current State", "#2E86AB")], cx + 1.3 * radius, cy - 1.1 * radius - 12,
+            anchor="right", marker="line")
+    return svg.render()
+
+
+def bcg_svg(data: Dict, max_labels: Optional[int] = 30) -> str:
+    """Growth-share bubble chart from ``BCGMatrix.to_dict()`` data."""
+    svg = _Svg(12 * PT, 10 * PT)
+    units = data["business_units"]
+    share = [u["market_share"] for u in units]
+    growth = [u["market_growth"] for u in units]
+    xlim = (0, max(max(share, default=0) * 1.2, 2.5))
+    ylim = (0, max(max(growth, default=0) * 1.2, 30))
+    axes = _Axes(svg, (62, 58, svg.width - 8, svg.height - 44), xlim, ylim)
+    axes.frame('Relative Market Share (vs. largest competitor)', 'Market Growth Rate (%)')
+    clip = axes.clip(f"bcg-area-{next(_CLIP_IDS)}")
+
+    for x, y, text in ((0.3, 25, 'QUESTION MARKS\n?'), (2.0, 25, 'STARS\n⭐'),
+                       (0.3, 3, 'DOGS\n🐕'), (2.0, 3, 'CASH COWS\n💰')):
+        svg.text(axes.x(x), axes.y(y), text, 14, ha="center", va="center", weight="bold",
+                 opacity=0.3)
+    for unit in units:
+        svg.circle(axes.x(unit["market_share"]), axes.y(unit["market_growth"]),
+                   _marker_radius(unit["revenue"] * 5),
+                   fill=CATEGORY_COLORS[unit["category"]], stroke="black", stroke_width=2,
+                   opacity=0.6, clip_path=clip)
+    svg.line(axes.x0, axes.y(10), axes.x1, axes.y(10), stroke="black", stroke_width=2,
+             stroke_dasharray="7,3", opacity=0.7)
+    svg.line(axes.x(1.0), axes.y0, axes.x(1.0), axes.y1, stroke="black", stroke_width=2,
+             stroke_dasharray="7,3", opacity=0.7)
+
+    ranked = sorted(range(len(units)), key=lambda i: -units[i]["revenue"])
+    for i in ranked if max_labels is None else ranked[:max_labels]:
+        svg.text(axes.x(share[i]), axes.y(growth[i]), units[i]["name"], 9, ha="center",
+                 va="center", weight="bold", clip_path=clip)
+
+    categories = list(dict.fromkeys(u["category"] for u in units))
+    _legend(svg, [(c, CATEGORY_COLORS[c]) for c in categories], axes.x1 - 6, axes.y0 + 6,
+            anchor="right")
+    svg.text(svg.width / 2, 12, f"BCG Matrix (Growth-Share Matrix)\n{data['company']}", 14,
+             ha="center", va="top", weight="bold")
+    return svg.render()
+
+
+def pestel_svg(data: Dict, mode: str = "auto") -> str:
+    """
+    Impact/likelihood matrix from ``PESTEL.to_dict()`` data.
+
+    ``mode`` works as in ``PESTEL.plot_impact_matrix``: 'scatter' draws one
+    marker per factor, 'bubbles' and 'heatmap' aggregate per grid cell and
+    'auto' switches to 'bubbles' above ``DENSITY_THRESHOLD`` factors.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+    factors = data["factors"]
+    if mode == "auto":
+        mode = "scatter" if len(factors) <= DENSITY_THRESHOLD else "bubbles"
+
+    svg = _Svg(10 * PT, 8 * PT)
+    right = {"scatter": 8, "bubbles": 124, "heatmap": 76}[mode]  # room for legend / colour bar
+    if mode == "heatmap":
+        axes = _Axes(svg, (40, 46, svg.width - right, svg.height - 44), (0.5, 5.5), (0.5, 5.5))
+        _pestel_heatmap(axes, _pestel_counts(factors))
+        axes.frame('Likelihood', 'Impact', grid_alpha=0)
+    else:
+        axes = _Axes(svg, (40, 46, svg.width - right, svg.height - 44), (0, 6), (0, 6))
+        axes.frame('Likelihood', 'Impact')
+    if mode == "scatter":
+        categories: List[str] = []
+        for factor in factors:
+            if factor["category"] not in categories:
+                categories.append(factor["category"])
+        radius = _marker_radius(200)
+        for category in categories:  # drawn per category, like the matplotlib scatter
+            for factor in factors:
+                if factor["category"] == category:
+                    svg.circle(axes.x(factor["likelihood"]), axes.y(factor["impact"]), radius,
+                               fill=PESTEL_COLORS.get(category, "#000"), stroke="black",
+                               stroke_width=1.5, opacity=0.6)
+        _legend(svg, [(c, PESTEL_COLORS.get(c, "#000")) for c in categories],
+                axes.x0 + 6, axes.y0 + 6)
+    elif mode == "bubbles":
+        categories = _pestel_bubbles(axes, _pestel_counts(factors))
+        _legend(svg, [(c, PESTEL_COLORS[c]) for c in categories], axes.x1 + 6, axes.y0)
+    svg.text(svg.width / 2, 8, f"PESTEL Impact Matrix\n{data['industry']}", 14,
+             ha="center", va="top", weight="bold")
+    return svg.render()
+
+
+def _pestel_counts(factors: Sequence[Dict]) -> Dict[Tuple[int, int], List[int]]:
+    """Factor counts per category for each occupied (likelihood, impact) cell, like ``count_tensor``."""
+    index = {category: i for i, category in enumerate(PESTEL_CATEGORIES)}
+    counts: Dict[Tuple[int, int], List[int]] = {}
+    for factor in factors:
+        cell = counts.setdefault((factor["likelihood"], factor["impact"]),
+                                 [0] * len(PESTEL_CATEGORIES))
+        cell[index[factor["category"]]] += 1
+    return counts
+
+
+def _pestel_bubbles(axes: _Axes, counts: Dict[Tuple[int, int], List[int]]) -> List[str]:
+    """One bubble per (cell, category) round the cell centre; returns the categories drawn."""
+    largest = max((n for cell in counts.values() for n in cell), default=1)
+    drawn = []
+    for c, category in enumerate(PESTEL_CATEGORIES):
+        cells = [(cell, n[c]) for cell, n in sorted(counts.items()) if n[c]]
+        if not cells:
+            continue
+        drawn.append(category)
+        angle = 2 * math.pi * c / len(PESTEL_CATEGORIES)
+        for (likelihood, impact), n in cells:
+            x = axes.x(likelihood + 0.25 * math.cos(angle))
+            y = axes.y(impact + 0.25 * math.sin(angle))
+            axes.svg.circle(x, y, _marker_radius(40 + 560 * n / largest),
+                            fill=PESTEL_COLORS[category], stroke="black", stroke_width=1,
+                            opacity=0.7)
+            if n > 1:
+                axes.svg.text(x, y, str(n), 7, ha="center", va="center")
+    return drawn
+
+
+def _pestel_heatmap(axes: _Axes, counts: Dict[Tuple[int, int], List[int]]) -> None:
+    """Shade each cell by its total, list the categories present and add a colour bar."""
+    svg = axes.svg
+    totals = {cell: sum(n) for cell, n in counts.items()}
+    largest = max(totals.values(), default=0)
+    for likelihood in range(1, 6):
+        for impact in range(1, 6):
+            total = totals.get((likelihood, impact), 0)
+            left, top = axes.x(likelihood - 0.5), axes.y(impact + 0.5)
+            svg.rect(left, top, axes.x(likelihood + 0.5) - left, axes.y(impact - 0.5) - top,
+                     fill=_blues(total / largest if largest else 0))
+    for (likelihood, impact), total in sorted(totals.items()):
+        parts = [f"{abbr} {n}" for abbr, n in zip(CATEGORY_ABBREVIATIONS, counts[likelihood, impact]) if n]
+        lines = [" ".join(parts[i:i + 3]) for i in range(0, len(parts), 3)]
+        color = "white" if total > largest / 2 else "black"
+        svg.text(axes.x(likelihood), axes.y(impact + 0.15), str(total), 11, ha="center",
+                 va="center", weight="bold", fill=color)
+        svg.text(axes.x(likelihood), axes.y(impact - 0.15), "\n".join(lines), 6, ha="center",
+                 va="center", fill=color)
+
+    bar_x, steps = axes.x1 + 14, len(_BLUES) * 4
+    step = (axes.y1 - axes.y0) / steps
+    for i in range(steps):
+        svg.rect(bar_x, axes.y1 - (i + 1) * step, 12, step + 0.5,
+                 fill=_blues((i + 0.5) / steps))
+    svg.rect(bar_x, axes.y0, 12, axes.y1 - axes.y0, fill="none", stroke="black",
+             stroke_width=0.8)
+    for value in _nice_ticks(0, largest or 1, most=5):
+        y = axes.y1 - value / (largest or 1) * (axes.y1 - axes.y0)
+        svg.text(bar_x + 16, y, f"{value:g}", 10, va="center")
+    svg.text(bar_x + 44, (axes.y0 + axes.y1) / 2, "Factors", 10, ha="center", va="bottom",
+             rotation=90)
+
+
+def _renderers() -> Dict[type, Callable[[Dict], str]]:
+    from business_frameworks.ansoff_matrix import AnsoffMatrix
+    from business_frameworks.bcg_matrix import BCGMatrix
+    from business_frameworks.pestel import PESTEL
+    from business_frameworks.porters_five_forces import PortersFiveForces
+    from business_frameworks.swot import SWOT
+
+    return {SWOT: swot_svg, AnsoffMatrix: ansoff_svg, PortersFiveForces: porters_svg,
+            BCGMatrix: bcg_svg, PESTEL: pestel_svg}
+
+
+def render_svg(analysis: Any) -> str:
+    """
+    Render any framework object as an SVG string.
+
+    Args:
+        analysis: SWOT, AnsoffMatrix, PortersFiveForces, BCGMatrix or PESTEL
+
+    Returns:
+        Standalone SVG document
+    """
+    for cls, renderer in _renderers().items():
+        if isinstance(analysis, cls):
+            return renderer(analysis.to_dict())
+    raise ValueError(f"No SVG renderer for {type(analysis).__name__}")
+
+
+def render_html(analyses: Iterable[Any], title: str = "Strategy Charts") -> str:
+    """
+    Render several framework objects into one self-contained HTML page.
+
+    Args:
+        analyses: Framework objects, shown in order
+        title: Page title
+
+    Returns:
+        HTML document with the SVGs inline
+    """
+    figures = "".join(f"<figure>{render_svg(a)}</figure>" for a in analyses)
+    return (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{escape(title)}</title>"
+            f"<style>body{{font-family:{FONT};margin:24px}}figure{{margin:0 0 24px}}"
+            f"svg{{max-width:100%;height:auto}}</style></head>"
+            f"<body><h1>{escape(title)}</h1>{figures}</body></html>")
@@ -1,34 +1,153 @@
 """SWOT Analysis Framework"""
 
-from typing import List, Optional
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import os
+from typing import Any, ContextManager, BinaryIO, Dict, List, Optional, Union
+
+from business_frameworks._plotting import (DEFAULT_DPI, figure_context, finish, new_figure,
+                                          resolve_show, tight_layout)
+from business_frameworks.text_layout import box_points, draw_fitted, draw_lines, paginate
+
+# Item text area inside each unit quadrant (data units)
+ITEM_LEFT, ITEM_TOP, ITEM_WIDTH, ITEM_HEIGHT = 0.05, 0.85, 0.92, 0.82
+
+# (title, attribute, x, y, colour) of each unit quadrant in the 2x2 grid
+QUADRANTS = [
+    ('STRENGTHS', 'strengths', 1, 1, '#4CAF50'),
+    ('WEAKNESSES', 'weaknesses', 0, 1, '#FF9800'),
+    ('OPPORTUNITIES', 'opportunities', 1, 0, '#2196F3'),
+    ('THREATS', 'threats', 0, 0, '#F44336'),
+]
+
+
+class SWOTItem:
+    """
+    One structured SWOT entry (factor plus optional supporting fields).
+    
+    Items keep their fields separately and are only turned into display text
+    by ``str()``, when a report or chart needs it:
+    
+    - threats (with impact/likelihood): ``"factor (Impact: 5/5, Likelihood: 4/5)"``
+    - opportunities (with potential): ``"factor - potential"``
+    - otherwise: ``"factor (evidence)"`` or just ``"factor"``
+    """
+    __slots__ = ('factor', 'evidence', 'source', 'impact', 'likelihood',
+                 'potential', 'timeframe')
+    
+    def __init__(self, factor: str, evidence: Optional[str] = None,
+                 source: Optional[str] = None, impact: Optional[int] = None,
+                 likelihood: Optional[int] = None, potential: Optional[str] = None,
+                 timeframe: Optional[str] = None):
+        self.factor = factor
+        self.evidence = evidence
+        self.source = source
+        self.impact = impact
+        self.likelihood = likelihood
+        self.potential = potential
+        self.timeframe = timeframe
+    
+    @property
+    def score(self) -> int:
+        """Impact x likelihood (0 when either is missing)."""
+        if self.impact is None or self.likelihood is None:
+            return 0
+        return self.impact * self.likelihood
+    
+    def __str__(self) -> str:
+        scores = [f"{name}: {value}/5" for name, value in
+                  (("Impact", self.impact), ("Likelihood", self.likelihood)) if value is not None]
+        if scores:
+            return f"{self.factor} ({', '.join(scores)})"
+        if self.potential:
+            return f"{self.factor} - {self.potential}"
+        if self.evidence:
+            return f"{self.factor} ({self.evidence})"
+        return self.factor
+    
+    def __repr__(self) -> str:
+        return f"SWOTItem({self.to_dict()!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SWOTItem):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+    
+    def to_dict(self) -> Dict:
+        """Fields that are set, as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__
+                if getattr(self, name) is not None}
+
+
+Item = Union[str, SWOTItem]
+
+
+def _score(item: Item) -> int:
+    return item.score if isinstance(item, SWOTItem) else 0
 
 
 class SWOT:
-    """SWOT Analysis: Strengths, Weaknesses, Opportunities, Threats"""
+    """
+    SWOT Analysis: Strengths, Weaknesses, Opportunities, Threats
+    
+    Entries may be plain strings or structured ``SWOTItem`` objects; both
+    can be mixed in one analysis.
+    """
     
-    def __init__(self, company: str, strengths: Optional[List[str]] = None,
-                 weaknesses: Optional[List[str]] = None, opportunities: Optional[List[str]] = None,
-                 threats: Optional[List[str]] = None):
+    def __init__(self, company: str, strengths: Optional[List[Item]] = None,
+                 weaknesses: Optional[List[Item]] = None, opportunities: Optional[List[Item]] = None,
+                 threats: Optional[List[Item]] = None):
         self.company = company
         self.strengths = strengths or []
         self.weaknesses = weaknesses or []
         self.opportunities = opportunities or []
         self.threats = threats or []
     
-    def add_strength(self, strength: str) -> None:
+    def add_strength(self, strength: Item) -> None:
         self.strengths.append(strength)
     
-    def add_weakness(self, weakness: str) -> None:
+    def add_weakness(self, weakness: Item) -> None:
         self.weaknesses.append(weakness)
     
-    def add_opportunity(self, opportunity: str) -> None:
+    def add_opportunity(self, opportunity: Item) -> None:
         self.opportunities.append(opportunity)
     
-    def add_threat(self, threat: str) -> None:
+    def add_threat(self, threat: Item) -> None:
         self.threats.append(threat)
     
+    def top_threats(self, k: int = 3) -> List[Item]:
+        """The ``k`` threats with the highest impact x likelihood."""
+        return sorted(self.threats, key=_score, reverse=True)[:k]
+    
+    def threats_where(self, min_impact: Optional[int] = None,
+                      min_likelihood: Optional[int] = None) -> List[SWOTItem]:
+        """Structured threats with at least the given impact/likelihood ratings."""
+        return [
+            t for t in self.threats
+            if isinstance(t, SWOTItem)
+            and (min_impact is None or (t.impact or 0) >= min_impact)
+            and (min_likelihood is None or (t.likelihood or 0) >= min_likelihood)
+        ]
+    
+    def to_dict(self) -> Dict:
+        """Export analysis to dictionary format."""
+        def export(items: List[Item]) -> List:
+            return [i.to_dict() if isinstance(i, SWOTItem) else i for i in items]
+        
+        return {
+            "company": self.company,
+            "strengths": export(self.strengths),
+            "weaknesses": export(self.weaknesses),
+            "opportunities": export(self.opportunities),
+            "threats": export(self.threats),
+        }
+    
+    def _repr_svg_(self) -> str:
+        """Notebook display as SVG (no matplotlib needed)."""
+        from business_frameworks.svg import render_svg
+        return render_svg(self)
+    
     def generate_report(self) -> str:
         """Generate text report"""
         report = f"\n{'='*60}\nSWOT ANALYSIS: {self.company}\n{'='*60}\n\n"
@@ -39,35 +158,139 @@ class SWOT:
         print(report)
         return report
     
-    def plot(self, figsize: tuple = (12, 10), save_path: Optional[str] = None) -> None:
-        """Create SWOT matrix visualization"""
-        fig, ax = plt.subplots(figsize=figsize)
+    def figure(self, **plot_kw: Any) -> ContextManager[Any]:
+        """Headless ``plot(**plot_kw)`` figure, closed when the ``with`` block ends."""
+        return figure_context(self.plot, **plot_kw)
+    
+    def plot(self, figsize: Optional[tuple] = None, save_path: Optional[str] = None,
+             show: Optional[bool] = None, format: Optional[str] = None,
+             dpi: Optional[float] = None, return_bytes: bool = False,
+             buffer: Optional[BinaryIO] = None, renderer: Optional[Any] = None) -> Any:
+        """
+        Create SWOT matrix visualization.
+        
+        Items are wrapped to the quadrant width and each quadrant gets the
+        largest font (9pt down to 6pt) at which its list fits. Items that do
+        not fit even at 6pt are summarised as "+N more"; use ``plot_pages``
+        to show every item.
+        
+        Args:
+            figsize: Figure size tuple (default (12, 10), or the renderer's)
+            save_path: Optional path to save the figure
+            show: Display the chart; None (default) shows it only on an
+                interactive backend and when no bytes/buffer are requested
+            format: Image format for files, bytes and buffers
+                ('png', 'svg', 'pdf', 'webp', ...; files default to their extension)
+            dpi: Output resolution (default ``DEFAULT_DPI``, or the renderer's;
+                lower it for thumbnails)
+            return_bytes: Return the encoded image instead of the figure
+            buffer: Writable binary file object to receive the image
+            renderer: ``grid_render.GridRenderer`` to draw on instead of a new
+                figure; it reuses its cached static layer across calls, for
+                batches of PNGs at the renderer's size and dpi (ValueError if
+                ``figsize`` or ``dpi`` asks for others)
+        
+        Returns:
+            Image bytes when ``return_bytes`` is set; otherwise the matplotlib
+            Figure when it is not shown (None when drawn with a ``renderer``)
+        """
+        if renderer is not None:
+            return renderer.plot(self, save_path, show, format, return_bytes, buffer,
+                                 figsize=figsize, dpi=dpi)
+        show = resolve_show(show, return_bytes, buffer)
+        fig, ax = new_figure(figsize or (12, 10), show)
+        self._draw(ax)
+        
+        fig.suptitle(f'SWOT Analysis: {self.company}', fontsize=16, fontweight='bold')
+        return finish(fig, save_path, show, format=format,
+                      dpi=DEFAULT_DPI if dpi is None else dpi,
+                      return_bytes=return_bytes, buffer=buffer)
+    
+    def plot_pages(self, figsize: tuple = (12, 10), fontsize: float = 8,
+                   save_path: Optional[str] = None, show: Optional[bool] = None,
+                   format: Optional[str] = None, dpi: float = DEFAULT_DPI,
+                   return_bytes: bool = False) -> List[Any]:
+        """
+        Draw every item, continuing over as many figures as needed.
+        
+        Items are wrapped and split into pages at ``fontsize``, so lists
+        merged from many analysts stay readable instead of shrinking.
+        
+        Args:
+            figsize: Figure size tuple (per page)
+            fontsize: Item font size
+            save_path: Optional path; page n is saved as ``<stem>-<n><ext>``
+            show: Display the pages; None (default) shows them only on an
+                interactive backend and when no bytes are requested
+            format: Image format for files and bytes
+            dpi: Output resolution
+            return_bytes: Return encoded images instead of figures
+        
+        Returns:
+            One figure (or image bytes) per page
+        
+        Example:
+            >>> pages = merged.plot_pages(save_path="swot.png")  # swot-1.png, swot-2.png, ...
+        """
+        show = resolve_show(show, return_bytes)
+        pages: List[Any] = []
+        count = 1
+        while len(pages) < count:
+            fig, ax = new_figure(figsize, show)
+            n = len(pages)
+            title = fig.suptitle(f'SWOT Analysis: {self.company} ({n + 1}/{count})',
+                                 fontsize=16, fontweight='bold')
+            if not pages:
+                # Measure the item boxes where finish() will lay them out
+                self._frame(ax)
+                tight_layout(fig)
+                width, height = box_points(ax, ITEM_WIDTH, ITEM_HEIGHT)
+                columns = [paginate([str(item) for item in items], width, height, fontsize)
+                           for _, items, _, _, _ in self._quadrants()]
+                count = max(len(column) for column in columns)
+                title.set_text(f'SWOT Analysis: {self.company} (1/{count})')
+            self._draw(ax, [column[n] if n < len(column) else [] for column in columns], fontsize)
+            path = None
+            if save_path:
+                stem, ext = os.path.splitext(save_path)
+                path = f"{stem}-{n + 1}{ext}"
+            # Pages keep the full figure size so a page set lines up
+            pages.append(finish(fig, path, show, format=format, dpi=dpi,
+                                return_bytes=return_bytes, bbox_inches=None))
+        return pages
+    
+    def _quadrants(self) -> List[tuple]:
+        return [(title, getattr(self, attr), x, y, color)
+                for title, attr, x, y, color in QUADRANTS]
+    
+    def _frame(self, ax: Any) -> None:
+        """Set up ``ax`` for the 2x2 grid."""
         ax.set_xlim(0, 2)
         ax.set_ylim(0, 2)
         ax.axis('off')
+    
+    def _draw(self, ax: Any, page: Optional[List[List[str]]] = None,
+              fontsize: float = 8) -> None:
+        """
+        Draw the four quadrants and their items onto ``ax``.
         
-        colors = {'s': '#4CAF50', 'w': '#FF9800', 'o': '#2196F3', 't': '#F44336'}
-        quadrants = [
-            ('STRENGTHS', self.strengths, 1, 1, colors['s']),
-            ('WEAKNESSES', self.weaknesses, 0, 1, colors['w']),
-            ('OPPORTUNITIES', self.opportunities, 1, 0, colors['o']),
-            ('THREATS', self.threats, 0, 0, colors['t']),
-        ]
+        ``page`` gives pre-wrapped lines per quadrant (from ``plot_pages``);
+        without it each quadrant's items are fitted to its box once the
+        figure is laid out.
+        """
+        import matplotlib.patches as mpatches
+        
+        self._frame(ax)
         
-        for title, items, x, y, color in quadrants:
+        for i, (title, items, x, y, color) in enumerate(self._quadrants()):
             rect = mpatches.Rectangle((x, y), 1, 1, linewidth=2, edgecolor='black',
                                      facecolor=color, alpha=0.2)
             ax.add_patch(rect)
             ax.text(x + 0.5, y + 0.95, title, ha='center', va='top',
                    fontsize=14, fontweight='bold')
             
-            y_pos = y + 0.85
-            for item in items:
-                ax.text(x + 0.05, y_pos, f"• {item[:50]}", ha='left', va='top', fontsize=9)
-                y_pos -= 0.08
-        
-        fig.suptitle(f'SWOT Analysis: {self.company}', fontsize=16, fontweight='bold')
-        plt.tight_layout()
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+            if page is not None:
+                draw_lines(ax, page[i], x + ITEM_LEFT, y + ITEM_TOP, fontsize)
+                continue
+            draw_fitted(ax, [str(item) for item in items], x + ITEM_LEFT, y + ITEM_TOP,
+                        ITEM_WIDTH, ITEM_HEIGHT, note="+{n} more (see plot_pages)")
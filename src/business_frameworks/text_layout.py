@@ -0,0 +1,305 @@
+"""
+Text Layout - Wrapping, Fitting and Paginating Item Lists
+
+Quadrant charts (SWOT, Ansoff) list free-text items inside fixed boxes. This
+module decides how those items are laid out before any text is drawn. It
+wraps each item to the box width, picks the largest font size at which the
+list still fits, and splits a list that cannot fit even at the smallest size
+into pages.
+
+All widths come from the cached per-character advance table in
+``business_frameworks.labels``. Nothing is measured with a renderer, so
+laying out hundreds of items costs a few milliseconds. Sizes are in points.
+On charts, ``draw_fitted`` measures its box only once the figure is laid
+out, since layout can still resize the axes.
+
+Example:
+    >>> fit(["Strong brand", "Loyal customers"], width=300, height=200)
+    Fit(fontsize=9.0, items=2 of 2, lines=2)
+"""
+
+from typing import Any, List, Sequence, Tuple
+
+from business_frameworks.labels import text_size
+
+LINE_SPACING = 1.25  # line pitch as a multiple of the font size
+BULLET = "• "
+
+
+def measure(text: str, fontsize: float = 9, fontweight: str = "normal") -> float:
+    """Width of single-line ``text`` in points."""
+    return text_size(text, fontsize, fontweight, dpi=72)[0]
+
+
+def _words(text: str, fontweight: str) -> List[Tuple[str, float]]:
+    """Words of ``text`` with their widths at 1pt."""
+    return [(word, measure(word, 1, fontweight)) for word in text.split()]
+
+
+def _wrap_words(words: List[Tuple[str, float]], width: float, space: float,
+                indent: float, fontweight: str) -> List[str]:
+    """Greedy wrap of pre-measured words, every line starting ``indent`` in."""
+    lines: List[str] = []
+    line: List[str] = []
+    used = indent
+    for word, w in words:
+        if line and used + space + w > width:
+            lines.append(" ".join(line))
+            line, used = [], indent
+        if not line and used + w > width:
+            # A word wider than the whole line is split by characters
+            part = ""
+            for ch in word:
+                cw = measure(ch, 1, fontweight)
+                if part and used + cw > width:
+                    lines.append(part)
+                    part, used = "", indent
+                part += ch
+                used += cw
+            line = [part]
+            continue
+        used += (space if line else 0) + w
+        line.append(word)
+    if line or not lines:
+        lines.append(" ".join(line))
+    return lines
+
+
+def wrap(text: str, width: float, fontsize: float = 9, fontweight: str = "normal",
+         prefix: str = "") -> List[str]:
+    """
+    Wrap ``text`` into lines no wider than ``width`` points.
+
+    Args:
+        text: Text to wrap (whitespace is collapsed)
+        width: Line width in points
+        fontsize, fontweight: Font the text will be drawn with
+        prefix: Marker for the first line (e.g. a bullet); continuation lines
+            get a hanging indent of the same width
+
+    Example:
+        >>> wrap("Premium pricing limits addressable market", 120, prefix="• ")
+        ['• Premium pricing limits', '   addressable market']
+    """
+    return _Items([text], fontweight, prefix).lines(0, width, fontsize)
+
+
+def _hanging(prefix: str, fontweight: str) -> str:
+    """Spaces about as wide as ``prefix``, for continuation lines."""
+    if not prefix:
+        return ""
+    return " " * max(1, round(measure(prefix, 1, fontweight) / measure(" ", 1, fontweight)))
+
+
+class Fit:
+    """
+    Result of ``fit``.
+
+    Attributes:
+        fontsize: Chosen font size in points
+        lines: Wrapped lines of the items that fit, in order
+        items: How many leading items fit
+        total: How many items were given
+    """
+
+    __slots__ = ("fontsize", "lines", "items", "total")
+
+    def __init__(self, fontsize: float, lines: List[str], items: int, total: int):
+        self.fontsize = fontsize
+        self.lines = lines
+        self.items = items
+        self.total = total
+
+    @property
+    def overflow(self) -> int:
+        """Items that did not fit."""
+        return self.total - self.items
+
+    @property
+    def pitch(self) -> float:
+        """Distance between line tops in points."""
+        return self.fontsize * LINE_SPACING
+
+    def __repr__(self) -> str:
+        return f"Fit(fontsize={self.fontsize}, items={self.items} of {self.total}, lines={len(self.lines)})"
+
+
+class _Items:
+    """Items measured once at 1pt, re-wrapped cheaply at any font size."""
+
+    def __init__(self, items: Sequence[str], fontweight: str, prefix: str):
+        self.words = [_words(str(item), fontweight) for item in items]
+        self.space = measure(" ", 1, fontweight)
+        self.lead = measure(prefix, 1, fontweight)
+        self.prefix = prefix
+        self.pad = _hanging(prefix, fontweight)
+        self.fontweight = fontweight
+
+    def lines(self, i: int, width: float, fontsize: float) -> List[str]:
+        wrapped = _wrap_words(self.words[i], width / fontsize, self.space, self.lead,
+                              self.fontweight)
+        return [self.prefix + wrapped[0]] + [self.pad + line for line in wrapped[1:]]
+
+    def take(self, start: int, width: float, height: float, fontsize: float,
+             cut: bool = True) -> Tuple[List[str], int]:
+        """
+        Lines of the items from ``start`` that fit in ``height``, and the end index.
+
+        With ``cut``, a first item taller than the whole box is cut short
+        rather than left out.
+        """
+        capacity = int(height // (fontsize * LINE_SPACING))
+        lines: List[str] = []
+        end = start
+        while end < len(self.words):
+            item = self.lines(end, width, fontsize)
+            if len(lines) + len(item) > capacity:
+                if cut and not lines and capacity:
+                    lines, end = item[:capacity], end + 1
+                break
+            lines += item
+            end += 1
+        return lines, end
+
+
+def fit(items: Sequence[str], width: float, height: float, max_fontsize: float = 9,
+        min_fontsize: float = 6, step: float = 0.5, fontweight: str = "normal",
+        prefix: str = BULLET, reserve_note: bool = True) -> Fit:
+    """
+    Lay out ``items`` in a ``width`` x ``height`` point box at the largest font that fits.
+
+    Font sizes from ``max_fontsize`` down to ``min_fontsize`` in ``step``
+    increments are binary-searched. If even the smallest does not fit, as
+    many leading items as possible are kept at ``min_fontsize``. With
+    ``reserve_note``, one line is also left free for a "+N more" note.
+
+    Args:
+        items: Texts to list, in order
+        width, height: Box size in points
+        max_fontsize, min_fontsize, step: Font sizes to consider
+        fontweight: Font weight of the items
+        prefix: Bullet put before each item
+        reserve_note: Keep a line free for an overflow note
+
+    Returns:
+        Fit with the chosen font size and wrapped lines
+    """
+    measured = _Items(items, fontweight, prefix)
+    total = len(items)
+    sizes = [max_fontsize - i * step for i in range(int((max_fontsize - min_fontsize) / step) + 1)]
+
+    lo, hi = 0, len(sizes) - 1  # find the first (largest) size at which everything fits
+    best = None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        lines, end = measured.take(0, width, height, sizes[mid], cut=False)
+        if end == total:
+            best, hi = (sizes[mid], lines), mid - 1
+        else:
+            lo = mid + 1
+    if best is not None:
+        return Fit(best[0], best[1], total, total)
+
+    fontsize = sizes[-1]
+    room = height - fontsize * LINE_SPACING if reserve_note else height
+    lines, end = measured.take(0, width, room, fontsize)
+    return Fit(fontsize, lines, end, total)
+
+
+def paginate(items: Sequence[str], width: float, height: float, fontsize: float = 8,
+             fontweight: str = "normal", prefix: str = BULLET) -> List[List[str]]:
+    """
+    Split ``items`` into pages of wrapped lines, each fitting the box at ``fontsize``.
+
+    Items are kept whole unless a single item is taller than a page.
+
+    Returns:
+        One list of lines per page (a single empty page for no items)
+    """
+    measured = _Items(items, fontweight, prefix)
+    pages: List[List[str]] = []
+    start = 0
+    while start < len(items):
+        lines, end = measured.take(start, width, height, fontsize)
+        if end == start:  # box shorter than one line
+            raise ValueError("Box is too small to hold a single line at this font size")
+        pages.append(lines)
+        start = end
+    return pages or [[]]
+
+
+def _points_per_unit(ax: Any) -> Tuple[float, float]:
+    """Points per data unit along x and y, from the axes' current position."""
+    position = ax.get_position()
+    width, height = ax.figure.get_size_inches()
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    return position.width * width * 72 / (x1 - x0), position.height * height * 72 / (y1 - y0)
+
+
+def box_points(ax: Any, width: float, height: float) -> Tuple[float, float]:
+    """
+    Size in points of a ``width`` x ``height`` (data units) box on ``ax``.
+
+    Uses the axes' current position, so measure after the figure is laid
+    out: layout can shrink an axes to make room for titles and other panels.
+    ``draw_fitted`` waits for it.
+    """
+    x_scale, y_scale = _points_per_unit(ax)
+    return width * x_scale, height * y_scale
+
+
+def draw_lines(ax: Any, lines: Sequence[str], x: float, top: float, fontsize: float,
+               **text_kw: Any) -> None:
+    """
+    Draw ``lines`` one text each, ``LINE_SPACING`` apart, from data point ``(x, top)`` down.
+
+    Lines are offset from that point in points, so their spacing does not
+    change when layout resizes the axes. Mathtext is off: items are free
+    text (often with "$" amounts) and were measured as plain characters.
+    """
+    pitch = fontsize * LINE_SPACING
+    for i, line in enumerate(lines):
+        ax.annotate(line, (x, top), xytext=(0, -i * pitch), textcoords='offset points',
+                    ha='left', va='top', fontsize=fontsize, parse_math=False, **text_kw)
+
+
+def fitted_lines(items: Sequence[str], width: float, height: float, note: str = "+{n} more",
+                 **fit_kw: Any) -> Tuple[float, List[str]]:
+    """
+    Font size and lines of ``fit(items, width, height)``, plus an overflow note.
+
+    ``note`` is formatted with the number of items left out (``n``) and
+    added as the last line when some do not fit.
+    """
+    layout = fit(items, width, height, **fit_kw)
+    lines = list(layout.lines)
+    if layout.overflow:
+        lines.append(note.format(n=layout.overflow))
+    return layout.fontsize, lines
+
+
+def draw_fitted(ax: Any, items: Sequence[str], x: float, top: float, width: float,
+                height: float, note: str = "+{n} more", **fit_kw: Any) -> None:
+    """
+    Fit ``items`` into a box of ``ax`` and draw them, once the figure is laid out.
+
+    The box is ``width`` x ``height`` data units with its top-left corner at
+    ``(x, top)``. It is measured after ``_plotting.finish`` has laid out the
+    figure, so the text stays inside it however the final layout sizes the
+    axes.
+
+    Args:
+        ax: Axes to draw on
+        items: Texts to list, in order
+        x, top: Top-left corner of the box (data units)
+        width, height: Box size (data units)
+        note: Last line when items are left out, formatted with ``n``
+        **fit_kw: Options for ``fit`` (e.g. ``min_fontsize``)
+    """
+    from business_frameworks._plotting import after_layout
+
+    def place() -> None:
+        fontsize, lines = fitted_lines(items, *box_points(ax, width, height), note=note, **fit_kw)
+        draw_lines(ax, lines, x, top, fontsize)
+
+    after_layout(ax.figure, place)
@@ -0,0 +1,155 @@
+"""
+Thumbnails - Print, Preview and Thumbnail Sizes from One Render
+
+A UI that needs a chart at several sizes would otherwise call ``plot`` once
+per size, paying for the whole layout and rasterization each time.
+``render_pyramid`` draws the chart once, rasterizes it at the largest
+requested resolution and derives every smaller variant by downsampling those
+pixels with Pillow.
+
+All variants share one content key (``chart_key`` over the analysis, the
+sizes, the format and the drawing options) and are written as
+``<stem>-<name>.<ext>``. The stem defaults to that key, which makes the
+files content-addressed: when every variant for a key already exists the
+chart is not drawn again.
+
+Example:
+    >>> pyramid = render_pyramid(loader.get_swot("AAPL"), "static/charts")
+    >>> pyramid.paths["thumb"].name
+    '3f9c...e1-thumb.png'
+    >>> pyramid.pixels
+    {'print': (3600, 3000), 'preview': (1200, 1000), 'thumb': (300, 250)}
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from business_frameworks._plotting import close
+from business_frameworks.chart_cache import chart_key
+
+# Variant name -> resolution in dots per inch of the figure size
+SIZES: Dict[str, float] = {"print": 300, "preview": 100, "thumb": 25}
+# Output format -> Pillow writer and its options
+FORMATS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "png": ("PNG", {}),
+    "webp": ("WEBP", {"quality": 90}),
+    "jpg": ("JPEG", {"quality": 90}),
+    "jpeg": ("JPEG", {"quality": 90}),
+}
+
+
+@dataclass
+class Pyramid:
+    """Files written (or found) by ``render_pyramid``."""
+    key: str  # content key shared by every variant
+    paths: Dict[str, Path]
+    pixels: Dict[str, Tuple[int, int]]  # (width, height) per variant
+    rendered: bool  # False when every variant was already on disk
+    seconds: float
+
+
+def pyramid_key(analysis: Any, sizes: Mapping[str, float] = SIZES, format: str = "png",
+                **plot_kw: Any) -> str:
+    """Content key shared by all variants of a chart (see ``chart_key``)."""
+    return chart_key(analysis, engine="matplotlib", format=format,
+                     sizes=sorted(sizes.items()), plot=plot_kw)
+
+
+def render_pyramid(analysis: Any, out_dir: Union[str, Path],
+                   sizes: Optional[Mapping[str, float]] = None, format: str = "png",
+                   stem: Optional[str] = None, **plot_kw: Any) -> Pyramid:
+    """
+    Draw a chart once and write it at several resolutions.
+
+    The largest size is rasterized directly; the others are downsampled from
+    its pixels (Lanczos after a fast integer reduction). Images cover the
+    whole laid-out figure rather than being cropped to content like
+    ``plot(save_path=...)``, so every variant has the same aspect ratio.
+
+    Args:
+        analysis: Any framework object with a ``plot()`` method and ``to_dict()``
+        out_dir: Directory for the images (created if missing)
+        sizes: Variant name -> dpi (default ``SIZES``: print, preview, thumb)
+        format: 'png', 'webp' or 'jpg'
+        stem: File name prefix; defaults to the content key. With a custom
+            stem the chart is always redrawn, since the names no longer
+            identify the content.
+        **plot_kw: Drawing options for the plot method (e.g. ``figsize``)
+
+    Returns:
+        Pyramid with the shared key and the path and pixel size of each variant
+    """
+    start = time.perf_counter()
+    sizes = dict(SIZES if sizes is None else sizes)
+    format = format.lower()
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported thumbnail format {format!r}; expected one of {', '.join(FORMATS)}")
+    if not sizes:
+        raise ValueError("No sizes given")
+    for name, dpi in sizes.items():
+        if not name or os.sep in name or (os.altsep and os.altsep in name):
+            raise ValueError(f"Size name {name!r} cannot be used in a file name")
+        if dpi <= 0:
+            raise ValueError(f"Size {name!r} needs a positive dpi, got {dpi}")
+
+    key = pyramid_key(analysis, sizes, format, **plot_kw)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    paths = {name: out / f"{stem or key}-{name}.{format}" for name in sizes}
+
+    if stem is None and all(path.exists() for path in paths.values()):
+        from PIL import Image
+
+        pixels = {}
+        for name, path in paths.items():
+            with Image.open(path) as image:  # reads the header only
+                pixels[name] = image.size
+        return Pyramid(key, paths, pixels, False, time.perf_counter() - start)
+
+    top = max(sizes.values())
+    master = _rasterize(analysis, top, plot_kw)
+    writer, options = FORMATS[format]
+    pixels = {}
+    for name, dpi in sizes.items():
+        image = master
+        if dpi != top:
+            size = (max(1, round(master.width * dpi / top)), max(1, round(master.height * dpi / top)))
+            image = master.resize(size, _lanczos(), reducing_gap=3.0)
+        _save(image, paths[name], writer, dict(options, dpi=(dpi, dpi)))
+        pixels[name] = image.size
+    return Pyramid(key, paths, pixels, True, time.perf_counter() - start)
+
+
+def _rasterize(analysis: Any, dpi: float, plot_kw: Dict[str, Any]) -> Any:
+    """Draw ``analysis`` once at ``dpi`` and return its pixels as an RGB image."""
+    import numpy as np
+    from PIL import Image
+
+    from business_frameworks.render_pool import draw
+
+    fig = draw(analysis, **plot_kw)
+    try:
+        fig.set_dpi(dpi)
+        fig.canvas.draw()
+        # The charts are drawn on an opaque white background, so alpha carries nothing
+        master = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert("RGB")
+    finally:
+        close(fig)
+    return master
+
+
+def _lanczos() -> Any:
+    from PIL import Image
+
+    return getattr(Image, "Resampling", Image).LANCZOS  # Pillow < 9.1 has no Resampling
+
+
+def _save(image: Any, path: Path, writer: str, options: Dict[str, Any]) -> None:
+    """Write ``image`` atomically, so a concurrent reader never sees a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    image.save(tmp, format=writer, **options)
+    os.replace(tmp, path)
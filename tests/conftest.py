@@ -0,0 +1,36 @@
+"""Shared fixtures: a synthetic company universe built from the curated AAPL document"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from business_frameworks.company_data import CompanyDataLoader
+
+_AAPL = Path(__file__).resolve().parents[1] / "src" / "business_frameworks" / "data" / "companies" / "AAPL.json"
+_INDUSTRIES = ["Technology", "Retail", "Healthcare"]
+
+
+def make_universe(directory: Path, count: int) -> CompanyDataLoader:
+    """Write ``count`` company documents (T000, T001, ...) into ``directory``."""
+    base = json.loads(_AAPL.read_text())
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        ticker = f"T{i:03d}"
+        doc = copy.deepcopy(base)
+        doc["meta"]["ticker"] = ticker
+        doc["meta"]["company_name"] = f"Company {i}"
+        doc["company_profile"]["industry"] = _INDUSTRIES[i % len(_INDUSTRIES)]
+        doc["financial_overview"]["revenue_fy2023"] = 1e9 * (i + 1)
+        doc["financial_overview"]["net_income_fy2023"] = 1e8 * (i + 1) * (1 + i % 4)
+        doc["financial_overview"]["profit_margin"] = 0.1 * (1 + i % 4)
+        doc["porters_five_forces"]["buyer_power"]["rating"] = 1 + i % 5
+        (directory / f"{ticker}.json").write_text(json.dumps(doc))
+    return CompanyDataLoader(data_dir=directory)
+
+
+@pytest.fixture
+def universe(tmp_path):
+    """Loader over a 12-company synthetic universe."""
+    return make_universe(tmp_path / "companies", 12)
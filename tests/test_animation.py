@@ -0,0 +1,84 @@
+"""Tests for blitted BCG and Porter animations"""
+
+import shutil
+
+import pytest
+from business_frameworks import BCGMatrix, PortersFiveForces
+from business_frameworks.animation import _GifWriter, animate
+
+
+def _portfolios():
+    snapshots = []
+    for q in range(3):
+        bcg = BCGMatrix("Co")
+        bcg.add_business_unit("Cloud", market_share=0.5 + q * 0.5, market_growth=20 - q * 5, revenue=100)
+        if q < 2:  # retired in the last quarter: shrinks away in place
+            bcg.add_business_unit("Legacy", market_share=2.0, market_growth=3, revenue=80)
+        snapshots.append(bcg)
+    return snapshots
+
+
+def test_gif_frames_are_blitted_over_one_static_draw(tmp_path, monkeypatch):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from PIL import Image
+
+    draws = []
+    original = FigureCanvasAgg.draw
+    monkeypatch.setattr(FigureCanvasAgg, "draw", lambda self: draws.append(1) or original(self))
+    result = animate(_portfolios(), tmp_path / "bcg.gif", steps=4, dpi=30, labels=["Q1", "Q2", "Q3"])
+    assert result["frames"] == 9 and len(draws) == 1
+
+    with Image.open(result["path"]) as gif:
+        assert gif.n_frames == 9 and gif.size == (360, 300)
+        gif.seek(0)
+        first = gif.convert("RGB").tobytes()
+        gif.seek(8)
+        assert gif.convert("RGB").tobytes() != first
+
+
+def test_porter_history(tmp_path):
+    history = [PortersFiveForces("Tech", 5, 3, 4, 2, 2), PortersFiveForces("Tech", 3, 3, 2, 4, 1)]
+    result = animate(history, tmp_path / "forces.gif", steps=5, dpi=20)
+    assert result["frames"] == 6 and (tmp_path / "forces.gif").stat().st_size > 0
+
+
+def test_gif_frames_are_written_as_they_arrive(tmp_path):
+    import numpy as np
+    from PIL import Image
+
+    writer = _GifWriter(str(tmp_path / "stream.gif"), fps=10)
+    frame = np.full((20, 30, 4), 255, dtype=np.uint8)
+    writer.write(frame)
+    size = writer.file.tell()
+    writer.write(frame)
+    assert writer.file.tell() > size > 0  # encoded on arrival, not kept until close
+    writer.close()
+    with Image.open(tmp_path / "stream.gif") as gif:
+        assert gif.n_frames == 2 and gif.info["duration"] == 100
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+def test_video_with_ffmpeg(tmp_path):
+    result = animate(_portfolios(), tmp_path / "bcg.mp4", steps=3, dpi=20)
+    assert result["frames"] == 7
+    assert (tmp_path / "bcg.mp4").read_bytes()[4:8] == b"ftyp"
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is not None, reason="ffmpeg is installed")
+def test_video_needs_ffmpeg(tmp_path, monkeypatch):
+    from business_frameworks import animation
+
+    closed = []
+    monkeypatch.setattr(animation, "close", closed.append)
+    with pytest.raises(RuntimeError, match="ffmpeg"):
+        animate(_portfolios(), tmp_path / "bcg.mp4", dpi=20)
+    assert len(closed) == 1
+
+
+def test_bad_input(tmp_path):
+    with pytest.raises(ValueError):
+        animate(_portfolios(), tmp_path / "bcg.bmp")
+    with pytest.raises(ValueError):
+        animate(_portfolios(), tmp_path / "bcg.gif", labels=["Q1"])
+    with pytest.raises(ValueError):
+        animate([_portfolios()[0], PortersFiveForces("Tech", 3, 3, 3, 3, 3)], tmp_path / "x.gif")
@@ -28,3 +28,13 @@ def test_invalid_strategy():
 def test_current_strategy():
     ansoff = AnsoffMatrix("TestCorp", current_strategy="Market Penetration")
     assert ansoff.current_strategy == "Market Penetration"
+
+
+def test_plot_wraps_initiatives_instead_of_truncating():
+    ansoff = AnsoffMatrix("TestCorp")
+    ansoff.add_strategy("Diversification", initiatives=[
+        f"Initiative {i} expanding into adjacent consumer health markets" for i in range(40)])
+    texts = [t.get_text() for t in ansoff.plot(show=False).axes[0].texts]
+    assert sum(t.startswith("• Initiative ") for t in texts) > 3
+    assert any(t.startswith("+") and t.endswith(" more") for t in texts)
+    assert not any(t.endswith("...") for t in texts)
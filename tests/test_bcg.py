@@ -38,3 +38,24 @@ def test_portfolio_summary():
     assert len(summary["Star"]) == 1
     assert len(summary["Dog"]) == 1
     assert "Star1" in summary["Star"]
+
+
+def test_to_arrays_matches_get_category():
+    bcg = BCGMatrix("Test")
+    for i, (share, growth) in enumerate([(1.5, 20), (0.5, 20), (2.0, 5), (0.3, 2), (1.0, 10)]):
+        bcg.add_business_unit(f"U{i}", share, growth, 100)
+    arrays = bcg.to_arrays()
+    assert list(arrays["category"]) == [bu.get_category() for bu in bcg.business_units]
+
+
+def test_plot_one_scatter_per_category_and_label_cap():
+    bcg = BCGMatrix("Test")
+    for i in range(200):
+        bcg.add_business_unit(f"U{i}", 0.1 + (i % 30) / 10, i % 35, revenue=i + 1)
+    fig = bcg.plot(show=False, max_labels=10)
+    ax = fig.axes[0]
+    assert len(ax.collections) == 4
+    labels = [t.get_text() for t in ax.texts if t.get_text().startswith("U")]
+    assert sorted(labels) == sorted(f"U{i}" for i in range(190, 200))
+    first_seen = list(dict.fromkeys(bu.get_category() for bu in bcg.business_units))
+    assert [t.get_text() for t in ax.get_legend().get_texts()] == first_seen
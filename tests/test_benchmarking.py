@@ -0,0 +1,62 @@
+"""Tests for peer benchmarking"""
+
+import json
+
+import pytest
+from business_frameworks.benchmarking import compare_companies
+
+
+def test_compare_builds_side_by_side_table(universe):
+    comparison = compare_companies(["T000", "t001", "T003"], loader=universe)
+    table = comparison.table()
+    assert table["ticker"] == ["T000", "T001", "T003"]
+    assert table["Buyer Power"] == [1.0, 2.0, 4.0]
+    assert table["profit_margin"] == [0.1, 0.2, 0.4]
+    assert table["profit_margin_peer_percentile"] == pytest.approx([1 / 6, 0.5, 5 / 6])
+    assert table["threats"] == [5, 5, 5]
+
+
+def test_each_document_loaded_once(universe):
+    compare_companies(["T000", "T001"], loader=universe)
+    compare_companies(["T001", "T002"], loader=universe)
+    assert universe.cache_stats()["misses"] == 3
+
+
+def test_overlapping_competitors_and_report(universe):
+    comparison = compare_companies(["T000", "T001"], loader=universe)
+    assert comparison.shared_competitors["Samsung"] == ["T000", "T001"]
+    report = comparison.generate_report()
+    assert "PEER BENCHMARK: Company 0, Company 1" in report
+    assert "Samsung: T000, T001" in report
+
+
+def test_missing_porter_rating_shows_as_na(universe):
+    path = universe.data_dir / "T001.json"
+    doc = json.loads(path.read_text())
+    del doc["porters_five_forces"]["buyer_power"]["rating"]
+    path.write_text(json.dumps(doc))
+
+    comparison = compare_companies(["T000", "T001"], loader=universe)
+    assert comparison.table()["Buyer Power"] == [1.0, None]
+    report = comparison.generate_report()
+    assert "n/a" in next(line for line in report.splitlines() if line.startswith("Buyer Power"))
+
+
+def test_non_numeric_financials_and_repeated_tickers(universe):
+    path = universe.data_dir / "T001.json"
+    doc = json.loads(path.read_text())
+    doc["financial_overview"]["profit_margin"] = "N/A"
+    doc["financial_overview"]["revenue_fy2023"] = "1.2bn"
+    path.write_text(json.dumps(doc))
+
+    comparison = compare_companies(["T000", "T001", "t000", "T002"], loader=universe)
+    table = comparison.table()
+    assert table["ticker"] == ["T000", "T001", "T002"]
+    assert table["profit_margin"] == [0.1, None, pytest.approx(0.3)]
+    assert table["revenue_fy2023"][1] is None
+    assert "PEER BENCHMARK" in comparison.generate_report()
+
+
+def test_compare_requires_tickers():
+    with pytest.raises(ValueError):
+        compare_companies([])
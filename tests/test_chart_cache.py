@@ -0,0 +1,63 @@
+"""Tests for the content-addressed chart cache"""
+
+import pytest
+import business_frameworks
+from business_frameworks import SWOT
+from business_frameworks.chart_cache import ChartCache, chart_key
+
+
+def test_hits_misses_and_hit_rate():
+    cache = ChartCache()
+    swot = SWOT("Co", strengths=["Brand"])
+    first = cache.render(swot, engine="svg", format="svg")
+    assert cache.render(SWOT("Co", strengths=["Brand"]), engine="svg", format="svg") is first
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    png = cache.render(swot, dpi=20)
+    assert png.startswith(b"\x89PNG") and cache.render(swot, dpi=20) is png
+
+
+def test_key_tracks_content_options_and_version(monkeypatch):
+    swot = SWOT("Co", strengths=["Brand"])
+    key = chart_key(swot, format="png", dpi=100)
+    assert key == chart_key(SWOT("Co", strengths=["Brand"]), dpi=100, format="png")
+    assert key != chart_key(SWOT("Co", strengths=["Scale"]), format="png", dpi=100)
+    assert key != chart_key(swot, format="png", dpi=200)
+    monkeypatch.setattr(business_frameworks, "__version__", "99.0")
+    assert key != chart_key(swot, format="png", dpi=100)
+    with pytest.raises(ValueError):
+        chart_key(object())
+
+
+def test_lru_eviction_is_bounded_by_bytes():
+    cache = ChartCache(max_bytes=250)
+    for key in "abc":
+        cache.put(key, b"x" * 100)
+    assert cache.get("a") is None and cache.get("c") is not None
+    cache.get("b")  # b is now most recent, so d evicts c
+    cache.put("d", b"x" * 100)
+    assert cache.get("c") is None and cache.get("b") is not None
+    stats = cache.stats()
+    assert stats["bytes"] <= 250 and stats["evictions"] == 2
+
+
+def test_disk_tier_survives_restart_and_is_bounded(tmp_path):
+    ChartCache(disk_dir=tmp_path).put("k1", b"chart")
+    reopened = ChartCache(disk_dir=tmp_path)
+    assert reopened.get("k1") == b"chart" and reopened.stats()["disk_hits"] == 1
+    assert reopened.get("k1") == b"chart" and reopened.stats()["hits"] == 1
+
+    small = ChartCache(disk_dir=tmp_path / "small", max_disk_bytes=10)
+    small.put("a", b"12345")
+    small.put("b", b"123456")
+    small.clear()
+    assert small.get("a") is None and small.get("b") == b"123456"
+    assert small.stats()["disk_bytes"] == 6 and small.stats()["disk_evictions"] == 1
+
+
+def test_bad_options():
+    with pytest.raises(ValueError):
+        ChartCache().render(SWOT("Co"), engine="svg", format="png")
+    with pytest.raises(ValueError):
+        ChartCache(max_bytes=-1)
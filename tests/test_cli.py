@@ -0,0 +1,67 @@
+"""Tests for the strategykit command line"""
+
+import json
+
+from business_frameworks.cli import main, resolve_tickers
+
+
+def _records(text):
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def test_resolve_tickers_globs_and_lists():
+    available = ["AAPL", "AMZN", "MSFT"]
+    assert resolve_tickers([], available) == available
+    assert resolve_tickers(["a*", "msft", "AAPL"], available) == ["AAPL", "AMZN", "MSFT"]
+    assert resolve_tickers(["NOPE"], available) == ["NOPE"]
+
+
+def test_report_to_stdout_jsonl(universe, capsys):
+    code = main(["report", "T00[12]", "--data-dir", str(universe.data_dir)])
+    records = _records(capsys.readouterr().out)
+    assert code == 0
+    assert [r["ticker"] for r in records] == ["T001", "T002"]
+    assert "COMPREHENSIVE STRATEGIC ANALYSIS: Company 1" in records[0]["report"]
+
+
+def test_export_in_parallel_to_out_dir(universe, tmp_path):
+    out = tmp_path / "out"
+    code = main(["export", "-j", "2", "-o", str(out), "--data-dir", str(universe.data_dir)])
+    records = _records((out / "export.jsonl").read_text())
+    assert code == 0
+    assert [r["ticker"] for r in records] == universe.list_tickers()
+    exported = json.loads((out / "T005.json").read_text())
+    assert exported["porters"]["forces"]["Buyer Power"]["score"] == 1
+
+
+def test_validate_flags_bad_documents(universe, capsys):
+    path = universe.data_dir / "T004.json"
+    doc = json.loads(path.read_text())
+    doc["porters_five_forces"]["buyer_power"]["rating"] = 9
+    path.write_text(json.dumps(doc))
+
+    code = main(["validate", "--data-dir", str(universe.data_dir)])
+    records = {r["ticker"]: r for r in _records(capsys.readouterr().out)}
+    assert code == 1
+    assert records["T003"]["valid"]
+    assert "rating must be 1-5" in records["T004"]["problems"][0]
+
+
+def test_index_build_and_shards(universe, capsys):
+    main(["index", "build", "--shard", "0/2", "--data-dir", str(universe.data_dir)])
+    first = _records(capsys.readouterr().out)
+    main(["index", "build", "--shard", "1/2", "--data-dir", str(universe.data_dir)])
+    second = _records(capsys.readouterr().out)
+    assert sorted(r["ticker"] for r in first + second) == universe.list_tickers()
+    assert first[0]["threats"][0]["max_percent"] == 20.0
+    assert "profit_margin" in first[0]["metrics"]
+
+
+def test_unknown_ticker_is_reported_not_raised(capsys):
+    assert main(["bench", "NOPE", "--repeat", "1"]) == 1
+    assert "No data for NOPE" in _records(capsys.readouterr().out)[0]["error"]
+
+
+def test_render_writes_charts(tmp_path):
+    assert main(["render", "AAPL", "--frameworks", "porters", "-o", str(tmp_path)]) == 0
+    assert (tmp_path / "AAPL_porters.png").stat().st_size > 0
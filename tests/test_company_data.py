@@ -0,0 +1,110 @@
+"""Tests for the curated company data loader"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from business_frameworks.company_data import CompanyDataLoader
+
+
+def test_list_tickers_does_not_parse(universe):
+    (universe.data_dir / "ZZZ.json").write_text("not json")
+    assert universe.list_tickers()[:2] == ["T000", "T001"]
+    assert universe.list_tickers()[-1] == "ZZZ"
+
+
+def test_unknown_ticker():
+    with pytest.raises(ValueError, match="AAPL"):
+        CompanyDataLoader().load_company("NOPE")
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_iter_companies_order_filter_sections(universe, prefetch):
+    rows = list(universe.iter_companies(
+        filter=lambda t: t.endswith(("1", "2")),
+        sections=["meta", "financial_overview"],
+        prefetch=prefetch,
+    ))
+    assert [t for t, _ in rows] == ["T001", "T002", "T011"]
+    assert all(set(d) == {"meta", "financial_overview"} for _, d in rows)
+
+
+def test_iter_companies_early_close(universe):
+    stream = universe.iter_companies(prefetch=1)
+    ticker, _ = next(stream)
+    stream.close()
+    assert ticker == "T000"
+
+
+def test_iter_companies_propagates_errors(universe):
+    (universe.data_dir / "T005.json").write_text("{broken")
+    stream = universe.iter_companies(prefetch=2)
+    with pytest.raises(ValueError):
+        for _ in stream:
+            pass
+
+
+def test_documents_are_cached_but_returned_as_copies(universe):
+    first = universe.load_company("t001")
+    first["meta"]["company_name"] = "Changed by one caller"
+    assert universe.load_company("T001")["meta"]["company_name"] == "Company 1"
+    stats = universe.cache_stats()
+    assert stats["misses"] == 1 and stats["hits"] == 1
+
+
+def test_document_cache_is_bounded_and_follows_file_edits(universe):
+    loader = CompanyDataLoader(data_dir=universe.data_dir, max_documents=2)
+    for ticker in loader.list_tickers():
+        loader.load_company(ticker)
+    assert loader.cache_stats()["size"] == 2 and loader.cache_stats()["evictions"] == 10
+
+    path = loader.data_dir / "T004.json"
+    path.write_text(path.read_text().replace('"Company 4"', '"Renamed Co"'))
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+    assert loader.load_company("T004")["meta"]["company_name"] == "Renamed Co"
+
+
+def test_iter_companies_does_not_fill_cache(universe):
+    list(universe.iter_companies())
+    assert universe.cache_stats()["size"] == 0
+
+
+@pytest.mark.parametrize("sections", [None, ["meta"]])
+def test_streamed_documents_do_not_share_the_cache(universe, sections):
+    universe.load_company("T001")  # cached, so the stream reuses it
+    for ticker, data in universe.iter_companies(sections=sections):
+        data["meta"]["company_name"] = "Changed while streaming"
+    assert universe.load_company("T001")["meta"]["company_name"] == "Company 1"
+    assert universe.get_swot("T001").company == "Company 1"
+
+
+def test_concurrent_misses_are_coalesced(universe):
+    reads = []
+    gate = threading.Event()
+    original = universe._read_document
+
+    def slow_read(ticker):
+        reads.append(ticker)
+        gate.wait(5)
+        return original(ticker)
+
+    universe._read_document = slow_read
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [pool.submit(universe.load_company, "T003") for _ in range(16)]
+        while universe.cache_stats()["coalesced"] + len(reads) < 16:
+            time.sleep(0.01)
+        gate.set()
+        docs = [f.result() for f in futures]
+
+    assert reads == ["T003"]
+    assert all(doc == docs[0] for doc in docs)
+    assert universe.cache_stats()["coalesced"] == 15
+
+
+def test_failed_load_is_shared_and_not_cached(universe):
+    with pytest.raises(ValueError):
+        universe.load_company("NOPE")
+    assert universe.cache_stats()["errors"] == 1
+    assert universe.cache_stats()["size"] == 0
@@ -0,0 +1,57 @@
+"""Tests for the single-figure company dashboard"""
+
+import pytest
+from business_frameworks import PESTEL, SWOT, AnsoffMatrix, BCGMatrix, PortersFiveForces
+from business_frameworks.dashboard import auto_layout, render_dashboard
+from business_frameworks.render_pool import render_figure
+
+
+def _frameworks():
+    bcg = BCGMatrix("Co")
+    for i in range(6):
+        bcg.add_business_unit(f"Unit {i}", market_share=0.4 * i + 0.2, market_growth=4 * i, revenue=50 + i)
+    pestel = PESTEL("Retail")
+    pestel.add_factor("Economic", "Inflation", impact=4, likelihood=4)
+    return [SWOT("Co", strengths=["Brand"], threats=["Rivals"]), PortersFiveForces("Tech", 4, 3, 3, 2, 3),
+            pestel, bcg, AnsoffMatrix("Co", current_strategy="Market Penetration")]
+
+
+def test_ticker_dashboard_is_one_artifact(tmp_path):
+    path = tmp_path / "aapl.pdf"
+    fig = render_dashboard("aapl", save_path=str(path), dpi=20, show=False)
+    assert path.read_bytes().startswith(b"%PDF")
+    assert len(fig.axes) == 2 and fig.axes[1].name == "polar"
+    assert fig.texts[0].get_text() == "AAPL"
+
+
+def test_objects_share_one_figure():
+    fig = render_dashboard({"swot": SWOT("Co"), "empty": BCGMatrix("Co")}, layout=(2, 1), show=False)
+    assert [ax.get_subplotspec().rowspan.start for ax in fig.axes] == [0, 1]
+    assert fig.axes[1].texts[0].get_text() == "No business units"
+    assert render_dashboard(_frameworks(), dpi=20, return_bytes=True).startswith(b"\x89PNG")
+
+
+def test_drawn_once_instead_of_once_per_chart(monkeypatch):
+    from matplotlib.figure import Figure
+
+    frameworks = _frameworks()
+    draws = []
+    draw = Figure.draw
+    monkeypatch.setattr(Figure, "draw", lambda fig, renderer: draws.append(fig) or draw(fig, renderer))
+
+    render_dashboard(frameworks, dpi=60, return_bytes=True)
+    assert len(draws) == 1
+    draws.clear()
+    for framework in frameworks:
+        render_figure(framework, dpi=60)
+    assert len(set(map(id, draws))) == len(frameworks)
+
+
+def test_layout_validation():
+    assert auto_layout(1) == (1, 1) and auto_layout(4) == (2, 2) and auto_layout(5) == (2, 3)
+    with pytest.raises(ValueError):
+        render_dashboard(_frameworks(), layout=(2, 2))
+    with pytest.raises(ValueError):
+        render_dashboard([object()])
+    with pytest.raises(ValueError):
+        render_dashboard([])
@@ -0,0 +1,61 @@
+"""Tests for ingest-time evidence fact extraction"""
+
+from business_frameworks.company_data import CompanyDataLoader
+from business_frameworks.evidence import extract_facts, find_swot_items, max_fact
+from business_frameworks.overlay import OverlayStore
+
+
+def test_extract_currency_percent_year_quantity():
+    facts = extract_facts("$166B cash, 30-40% premium, 1.5B devices (FY2023)")
+    assert [(f["kind"], f["value"]) for f in facts] == [
+        ("currency", 166e9), ("percent", 40.0), ("quantity", 1.5e9), ("year", 2023.0)
+    ]
+    assert facts[1]["low"] == 30.0
+
+
+def test_extract_bn_suffix():
+    assert [f["value"] for f in extract_facts("$1.2bn fine, 3 bn users")] == [1.2e9, 3e9]
+
+
+def test_extract_ignores_plain_text():
+    assert extract_facts("Extremely intense competition") == []
+    assert extract_facts("") == []
+
+
+def test_documents_are_annotated_at_load():
+    data = CompanyDataLoader().load_company("AAPL")
+    threat = data["swot_analysis"]["threats"][0]
+    assert threat["impact_score"] == 5 and threat["likelihood_score"] == 4
+    assert max_fact(threat, "percent") == 20.0
+    assert threat["facts"][0]["field"] == "evidence"
+    assert "facts" in data["porters_five_forces"]["supplier_power"]
+
+
+def test_find_threats_by_likelihood_and_exposure():
+    hits = list(find_swot_items(CompanyDataLoader(), "threats",
+                                min_likelihood=4, min_percent=20))
+    assert [(t, item["factor"]) for t, item in hits] == [("AAPL", "US-China trade tensions")]
+    assert list(find_swot_items(CompanyDataLoader(), "threats", min_percent=21)) == []
+
+
+def test_find_opportunities_by_amount(universe):
+    hits = list(find_swot_items(universe, "opportunities", min_amount=1e12))
+    assert len(hits) == 12
+    assert all("$7T" in item["potential"] for _, item in hits)
+
+
+def test_find_sees_tenant_overrides(universe):
+    store = OverlayStore(universe)
+    store.set("acme", "T001", "swot_analysis.threats.0.likelihood", "1")
+    store.append("acme", "T001", "swot_analysis.threats",
+                 {"factor": "New tariff", "impact": "3", "likelihood": "5",
+                  "evidence": "$1.2bn in duties"})
+    loader = store.loader_for("acme")
+    hits = [(t, item["factor"]) for t, item in find_swot_items(loader, min_likelihood=4)
+            if t == "T001"]
+    assert ("T001", "US-China trade tensions") not in hits
+    assert ("T001", "New tariff") in hits
+    swot = loader.get_swot("T001")
+    assert [t.factor for t in swot.threats if t.likelihood >= 4] == [factor for _, factor in hits]
+    [(_, added)] = find_swot_items(loader, min_amount=1e9, where=lambda i: i["factor"] == "New tariff")
+    assert added["likelihood_score"] == 5 and max_fact(added, "currency") == 1.2e9
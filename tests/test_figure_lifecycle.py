@@ -0,0 +1,84 @@
+"""Tests that plot methods leave no figures or pixel buffers behind"""
+
+import os
+import warnings
+
+import pytest
+from business_frameworks import PESTEL, SWOT, AnsoffMatrix, BCGMatrix, PortersFiveForces
+
+def _frameworks():
+    bcg = BCGMatrix("Co")
+    bcg.add_business_unit("Unit", market_share=1.5, market_growth=12, revenue=100)
+    pestel = PESTEL("Retail")
+    pestel.add_factor("Economic", "Inflation", impact=4, likelihood=4)
+    return [SWOT("Co", strengths=["Brand"], threats=["Regulation"]),
+            PortersFiveForces("Tech", 4, 3, 3, 2, 3), bcg, pestel, AnsoffMatrix("Co")]
+
+
+def _plot(obj):
+    return getattr(obj, "plot", None) or obj.plot_impact_matrix
+
+
+def _rss_mb():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("VmRSS not reported")
+
+
+def test_figure_context_closes_the_figure():
+    import matplotlib.pyplot as plt
+
+    for obj in _frameworks():
+        with obj.figure(figsize=(6, 5)) as fig:
+            assert fig.axes and fig.canvas.buffer_rgba
+        assert not fig.axes and not hasattr(fig.canvas, "buffer_rgba")
+    with pytest.raises(KeyError):
+        with SWOT("Co").figure() as fig:
+            raise KeyError("boom")
+    assert not fig.axes and not plt.get_fignums()
+
+
+def test_show_on_headless_backend_leaves_nothing_open():
+    import matplotlib.pyplot as plt
+
+    plt.switch_backend("Agg")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # "FigureCanvasAgg is non-interactive"
+        for obj in _frameworks() * 5:
+            _plot(obj)(show=True)
+    assert not plt.get_fignums()
+
+
+def _rss_samples(charts, samples, dpi):
+    """RSS after each of ``samples`` equal batches of SWOT charts, in MB."""
+    swot = _frameworks()[0]
+    for _ in range(5):  # warm font, glyph and text caches
+        swot.plot(figsize=(6, 5), dpi=dpi, return_bytes=True)
+    rss = [_rss_mb()]
+    for _ in range(samples):
+        for _ in range(charts // samples):
+            swot.plot(figsize=(6, 5), dpi=dpi, return_bytes=True)
+        rss.append(_rss_mb())
+    return rss
+
+
+needs_proc = pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs /proc RSS")
+
+
+@needs_proc
+def test_rss_stays_flat_over_many_charts():
+    rss = _rss_samples(charts=40, samples=2, dpi=200)
+    # Each leaked canvas would hold a 4.8 MB pixel buffer
+    assert rss[-1] - rss[1] < 20
+
+
+@needs_proc
+@pytest.mark.slow
+def test_rss_soak_10k_charts():
+    rss = _rss_samples(charts=10_000, samples=10, dpi=100)
+    # A leak of one 1.2 MB canvas per chart would add 1.2 GB between samples;
+    # allocator noise should settle after the first batch and stay there
+    assert max(rss) - rss[1] < 30, rss
+    assert rss[-1] - rss[len(rss) // 2] < 10, rss
@@ -0,0 +1,116 @@
+"""Tests for universe-wide financial metrics"""
+
+import json
+import os
+import time
+
+import numpy as np
+import pytest
+from business_frameworks.financial_metrics import FinancialMetrics, get_metrics
+
+
+def _metrics():
+    return FinancialMetrics(
+        tickers=["A", "B", "C", "D", "E"],
+        industries=["Tech", "Tech", "Tech", "Tech", "Retail"],
+        columns={
+            "profit_margin": [0.10, 0.20, 0.20, 0.40, 0.05],
+            "revenue_fy2023": [100.0, 200.0, 300.0, 400.0, np.nan],
+            "net_income_fy2023": [10.0, 40.0, 60.0, 160.0, 5.0],
+        },
+    )
+
+
+def test_industry_percentiles_use_mid_ranks():
+    m = _metrics()
+    np.testing.assert_allclose(m.percentiles["profit_margin"], [0.125, 0.5, 0.5, 0.875, 0.5])
+    assert m.top("profit_margin", fraction=0.2, industry="Tech") == ["D"]
+
+
+def test_top_selects_by_rank_in_small_industries():
+    m = _metrics()
+    # Mid-rank percentiles never reach 0.9 with fewer than five peers
+    assert m.top("profit_margin") == ["D", "E"]
+    assert m.top("profit_margin", fraction=0.5, industry="Tech") == ["B", "C", "D"]  # tie at 2nd
+    assert m.top("revenue_fy2023", industry="Retail") == []  # no data
+    with pytest.raises(ValueError):
+        m.top("profit_margin", fraction=0)
+
+
+def test_zscores_and_derived_ratios():
+    m = _metrics()
+    tech = np.array([0.10, 0.20, 0.20, 0.40])
+    expected = (tech - tech.mean()) / tech.std()
+    np.testing.assert_allclose(m.zscores["profit_margin"][:4], expected)
+    np.testing.assert_allclose(m.values["net_margin"][:4], [0.1, 0.2, 0.2, 0.4])
+    assert np.isnan(m.percentiles["net_margin"][4])
+    assert "net_margin" not in m.rank("E")
+    assert m.rank("d")["profit_margin"]["peers"] == 4
+
+
+def test_ranking_10k_companies_is_fast():
+    rng = np.random.default_rng(0)
+    n = 10_000
+    columns = {field: rng.lognormal(size=n) for field in
+               ("revenue_fy2023", "net_income_fy2023", "market_cap", "pe_ratio",
+                "profit_margin", "roe", "debt_to_equity", "cash_reserves", "employees")}
+    industries = rng.integers(0, 50, size=n).astype(str)
+    start = time.perf_counter()
+    m = FinancialMetrics([f"T{i}" for i in range(n)], industries, columns)
+    assert time.perf_counter() - start < 0.5
+    assert np.nanmax(m.percentiles["roe"]) < 1.0
+
+
+def test_get_metrics_cached_by_dataset_version(universe):
+    first = get_metrics(universe)
+    assert get_metrics(universe) is first
+    assert len(first) == 12
+
+    path = universe.data_dir / "T000.json"
+    path.write_text(path.read_text())
+    os.utime(path, ns=(0, 0))
+    assert get_metrics(universe) is not first
+
+
+def test_report_shows_industry_rank(universe):
+    report = universe.get_company_report("T011")
+    assert "Industry Rank (Healthcare, 4 companies)" in report
+    assert "Profit Margin: 88th percentile" in report
+
+
+def test_only_the_latest_version_of_a_data_dir_is_cached(universe):
+    from business_frameworks.financial_metrics import _METRICS_CACHE
+
+    scope = universe._cache_scope()
+    get_metrics(universe)
+    path = universe.data_dir / "T000.json"
+    os.utime(path, ns=(0, 0))
+    get_metrics(universe)
+    assert [key[1] for key in _METRICS_CACHE._values if key[0] == scope] == [universe.dataset_version()]
+
+
+def test_bad_documents_are_skipped_and_reported(universe):
+    (universe.data_dir / "ZZZ.json").write_text("{not json")
+    path = universe.data_dir / "T003.json"
+    doc = json.loads(path.read_text())
+    doc["financial_overview"]["roe"] = "high"
+    path.write_text(json.dumps(doc))
+
+    metrics = get_metrics(universe)
+    assert len(metrics) == 11
+    assert set(metrics.skipped) == {"ZZZ", "T003"}
+    assert "non-numeric roe" in metrics.skipped["T003"]
+    assert "Industry Rank (Healthcare" in universe.get_company_report("T011")
+    assert "Industry Rank: n/a (non-numeric roe)" in universe.get_company_report("T003")
+
+
+def test_tenant_reports_rank_on_the_tenant_view(universe):
+    from business_frameworks.overlay import OverlayStore
+
+    store = OverlayStore(universe)
+    tenant = store.loader_for("acme")
+    assert "Profit Margin: 88th percentile" in tenant.get_company_report("T011")
+
+    store.set("acme", "T011", "financial_overview.profit_margin", -1.0)
+    assert "Profit Margin: 12th percentile" in tenant.get_company_report("T011")
+    assert "Profit Margin: 88th percentile" in universe.get_company_report("T011")
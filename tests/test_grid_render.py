@@ -0,0 +1,59 @@
+"""Tests for the cached-layer SWOT/Ansoff renderer"""
+
+import pytest
+from business_frameworks import SWOT, AnsoffMatrix
+from business_frameworks.grid_render import GridRenderer
+
+
+def test_layer_is_built_once_and_reused():
+    renderer = GridRenderer(figsize=(6, 5), dpi=40)
+    first = renderer.render(SWOT("A", strengths=["Brand"]))
+    second = renderer.render(SWOT("B", strengths=["Scale"]))
+    assert first.startswith(b"\x89PNG") and first != second
+    assert renderer.stats() == {"layers_built": 1, "charts": 2}
+
+
+def test_no_residue_from_previous_chart():
+    busy = SWOT("A", strengths=[f"Strength {i}" for i in range(8)], threats=["Rivals"])
+    quiet = SWOT("A", strengths=["Brand"])
+
+    reused = GridRenderer(figsize=(6, 5), dpi=40)
+    reused.render(busy)
+    assert reused.render(quiet) == GridRenderer(figsize=(6, 5), dpi=40).render(quiet)
+
+
+def test_ansoff_current_strategy_and_unknown_type():
+    renderer = GridRenderer(figsize=(6, 5), dpi=40)
+    plain = AnsoffMatrix("Co")
+    current = AnsoffMatrix("Co", current_strategy="Diversification")
+    assert renderer.render(plain) != renderer.render(current)
+    assert renderer.render(plain) == renderer.render(AnsoffMatrix("Co"))
+    with pytest.raises(ValueError):
+        renderer.render(object())
+
+
+def test_plot_methods_draw_through_a_renderer(tmp_path):
+    renderer = GridRenderer(figsize=(6, 5), dpi=40)
+    swot = SWOT("A", strengths=["Brand"])
+    assert swot.plot(renderer=renderer, return_bytes=True) == renderer.render(swot)
+    assert AnsoffMatrix("Co").plot(renderer=renderer, save_path=str(tmp_path / "a.png")) is None
+    assert (tmp_path / "a.png").read_bytes().startswith(b"\x89PNG")
+    assert renderer.stats() == {"layers_built": 2, "charts": 3}
+    with pytest.raises(ValueError):
+        swot.plot(renderer=renderer, save_path=str(tmp_path / "a.svg"))
+    with pytest.raises(ValueError):
+        swot.plot(renderer=renderer, show=True)
+    assert swot.plot(renderer=renderer, figsize=(6, 5), dpi=40, return_bytes=True)
+    for mismatch in ({"figsize": (12, 10)}, {"dpi": 300}):
+        with pytest.raises(ValueError, match="renderer's"):
+            AnsoffMatrix("Co").plot(renderer=renderer, return_bytes=True, **mismatch)
+    # Laid out once, without leaving a layout engine that would run on every draw
+    assert all(layer.fig.get_layout_engine() is None for layer in renderer._layers.values())
+
+
+def test_long_lists_are_fitted_like_plot():
+    renderer = GridRenderer(figsize=(6, 5), dpi=40)
+    renderer.render(SWOT("A", strengths=[f"Strength {i} with a longer description" for i in range(80)]))
+    drawn = [t.get_text() for t in renderer._layer("swot").texts]
+    assert any(t.startswith("+") and t.endswith("more (see plot_pages)") for t in drawn)
+    assert not any(t.endswith("...") for t in drawn)
@@ -0,0 +1,61 @@
+"""Tests for cold-start import cost"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous enough for slow CI machines, far below the cost of matplotlib + pandas
+IMPORT_BUDGET_SECONDS = 0.25
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import business_frameworks
+from business_frameworks import (SWOT, PortersFiveForces, PESTEL, BCGMatrix,
+                                 AnsoffMatrix, CompanyDataLoader, templates)
+elapsed = time.perf_counter() - start
+heavy = [m for m in ("matplotlib", "numpy", "pandas") if m in sys.modules]
+{extra}
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def _probe(extra=""):
+    env = dict(os.environ, MPLBACKEND="Agg")
+    out = subprocess.run([sys.executable, "-c", _PROBE.format(extra=extra)],
+                         capture_output=True, text=True, check=True, env=env)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_import_is_cheap_and_skips_plotting_libraries():
+    result = _probe()
+    assert result["heavy"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_pestel_plot_does_not_need_pandas():
+    result = _probe(
+        "p = PESTEL('Tech'); p.add_factor('Legal', 'Rules', 3, 4); "
+        "p.plot_impact_matrix(); heavy = [m for m in ('pandas',) if m in sys.modules]"
+    )
+    assert result["heavy"] == []
+
+
+def test_unknown_attribute():
+    import business_frameworks
+    with pytest.raises(AttributeError, match="NotAFramework"):
+        business_frameworks.NotAFramework
+
+
+def test_svg_rendering_skips_plotting_libraries():
+    result = _probe(
+        "from business_frameworks.svg import render_html; "
+        "b = BCGMatrix('Co'); b.add_business_unit('A', 1.2, 15, 100); "
+        "p = PESTEL('Tech'); p.add_factor('Legal', 'Rules', 3, 4); "
+        "render_html([SWOT('Co', strengths=['Brand']), PortersFiveForces('Tech', 3, 3, 3, 3, 3), b, p, "
+        "AnsoffMatrix('Co')]); heavy = [m for m in ('matplotlib', 'numpy') if m in sys.modules]"
+    )
+    assert result["heavy"] == []
@@ -0,0 +1,101 @@
+"""Tests for spatial-index label placement"""
+
+import random
+import time
+
+import pytest
+from business_frameworks import PESTEL
+from business_frameworks._plotting import close, finish, new_figure
+from business_frameworks.labels import AROUND, annotate_points, place_labels, text_size
+
+
+def _overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def test_coincident_points_fan_out_without_overlap():
+    anchors, sizes = [(100.0, 100.0)] * 12, [(40.0, 10.0)] * 12
+    placement = place_labels(anchors, sizes, bounds=(0, 0, 400, 400))
+
+    boxes = [(100 + dx - 20, 100 + dy - 5, 100 + dx + 20, 100 + dy + 5)
+             for dx, dy in placement.offsets.values()]
+    assert len(boxes) + len(placement.dropped) == 12
+    assert not any(_overlaps(a, b) for i, a in enumerate(boxes) for b in boxes[i + 1:])
+    assert placement.offsets[0] == (0.0, 0.0)
+    assert placement.leaders and placement.dropped
+
+
+def test_priority_and_bounds():
+    placement = place_labels([(10, 10), (10, 10)], [(30, 10), (30, 10)], priority=[1, 5],
+                             bounds=(0, 0, 100, 100), candidates=AROUND)
+    assert placement.offsets[1][0] > 0  # placed first, to the right
+    assert all(dx > 0 or dy > 0 for dx, dy in placement.offsets.values())
+    with pytest.raises(ValueError):
+        place_labels([(0, 0)], [])
+
+
+def test_thousands_of_labels_place_quickly():
+    rng = random.Random(0)
+    anchors = [(rng.uniform(0, 1000), rng.uniform(0, 800)) for _ in range(5000)]
+    start = time.perf_counter()
+    placement = place_labels(anchors, [(60.0, 12.0)] * 5000, bounds=(0, 0, 1000, 800))
+    assert time.perf_counter() - start < 2.0
+    assert len(placement.offsets) + len(placement.dropped) == 5000
+
+
+def test_text_size_scales_with_font():
+    width, height = text_size("Competitive Rivalry", fontsize=9)
+    assert 0 < width < text_size("Competitive Rivalry", fontsize=18)[0]
+    assert text_size("", fontsize=9)[0] == 0 and height > 0
+
+
+def test_pestel_labels_factors():
+    pestel = PESTEL("Retail")
+    for i in range(8):
+        pestel.add_factor("Economic", f"Factor {i}", impact=3, likelihood=3)
+    ax = pestel.plot_impact_matrix(show=False, label_factors=True).axes[0]
+    labels = [t.get_text() for t in ax.texts if t.get_text().startswith("Factor")]
+    hidden = [t.get_text() for t in ax.texts if "hidden" in t.get_text()]
+    assert labels and len(labels) + (int(hidden[0].split()[0][1:]) if hidden else 0) == 8
+
+
+def test_labels_are_placed_for_the_laid_out_axes():
+    from matplotlib.text import Text
+
+    rng = random.Random(1)
+    xs, ys = [rng.uniform(0, 10) for _ in range(40)], [rng.uniform(0, 10) for _ in range(40)]
+    fig, ax = new_figure((6, 4), show=False)
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 10)
+    placement = annotate_points(ax, xs, ys, [f"Unit {i}" for i in range(40)])
+    assert not ax.texts and not placement.offsets  # waits for the final layout
+    # Laying out into a quarter of the figure shrinks the axes the labels were placed in
+    fig = finish(fig, None, show=False, layout_rect=(0, 0, 0.5, 0.5))
+    fig.canvas.draw()  # annotations are positioned at draw time
+    renderer = fig.canvas.get_renderer()
+    frame = ax.get_window_extent()
+    # Text's own extent: an annotation's would include its leader line
+    boxes = [Text.get_window_extent(t, renderer) for t in ax.texts
+             if t.get_text().startswith("Unit")]
+    assert len(boxes) == len(placement.offsets) and placement.dropped
+    assert all(frame.x0 - 1 <= b.x0 and b.x1 <= frame.x1 + 1 and frame.y0 - 1 <= b.y0
+               and b.y1 <= frame.y1 + 1 for b in boxes)
+    assert not any(a.overlaps(b) for i, a in enumerate(boxes) for b in boxes[i + 1:])
+    close(fig)
+
+
+def test_labels_are_placed_once(monkeypatch):
+    import business_frameworks.labels as labels
+
+    calls = []
+    monkeypatch.setattr(labels, "place_labels",
+                        lambda *a, **k: calls.append(1) or place_labels(*a, **k))
+    fig, ax = new_figure((4, 3), show=False)
+    annotate_points(ax, [1, 2], [1, 2], ["a", "b"])
+    finish(fig, None, show=False)
+    assert len(calls) == 1 and len(ax.texts) == 2
+
+    # A figure finish() will not lay out is labelled straight away
+    placement = annotate_points(ax, [1], [1], ["c"])
+    assert len(calls) == 2 and placement.offsets and len(ax.texts) == 3
+    close(fig)
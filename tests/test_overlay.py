@@ -0,0 +1,95 @@
+"""Tests for the copy-on-write overlay store"""
+
+import pytest
+from business_frameworks.overlay import OverlayStore
+
+
+def test_override_is_per_tenant():
+    store = OverlayStore()
+    store.set("acme", "AAPL", "porters_five_forces.supplier_power.rating", 5)
+
+    acme = store.get("acme", "AAPL")
+    other = store.get("globex", "AAPL")
+    assert acme["porters_five_forces"]["supplier_power"]["rating"] == 5
+    assert other["porters_five_forces"]["supplier_power"]["rating"] == 3
+    assert store.base("AAPL")["porters_five_forces"]["supplier_power"]["rating"] == 3
+
+
+def test_base_is_shared_not_copied():
+    store = OverlayStore()
+    store.set("acme", "AAPL", "meta.review_status", "Draft")
+    store.set("globex", "AAPL", "meta.review_status", "Pending")
+
+    acme = store.get("acme", "AAPL")
+    globex = store.get("globex", "AAPL")
+    assert acme._base is globex._base
+    assert acme["meta"]["company_name"] == "Apple Inc."
+
+
+def test_append_threat():
+    store = OverlayStore()
+    base_count = len(store.base("AAPL")["swot_analysis"]["threats"])
+    store.append("acme", "AAPL", "swot_analysis.threats",
+                 {"factor": "EU DMA fines", "impact": "4", "likelihood": "3"})
+
+    threats = store.get("acme", "AAPL")["swot_analysis"]["threats"]
+    assert len(threats) == base_count + 1
+    assert threats[-1]["factor"] == "EU DMA fines"
+    assert len(store.base("AAPL")["swot_analysis"]["threats"]) == base_count
+
+
+def test_views_are_read_only():
+    view = OverlayStore().get("acme", "AAPL")
+    with pytest.raises(TypeError):
+        view["meta"] = {}
+    with pytest.raises(TypeError):
+        view["swot_analysis"]["threats"][0] = {}
+
+
+def test_loader_for_tenant_uses_overrides():
+    store = OverlayStore()
+    store.set("acme", "AAPL", "porters_five_forces.buyer_power.rating", 2)
+    store.append("acme", "AAPL", "swot_analysis.threats",
+                 {"factor": "EU DMA fines", "impact": "4", "likelihood": "3"})
+
+    loader = store.loader_for("acme")
+    assert loader.get_porters("AAPL").forces["Buyer Power"].score == 2
+    assert any(t.factor == "EU DMA fines" for t in loader.get_swot("AAPL").threats)
+    assert all(t.factor != "EU DMA fines" for t in store.loader.get_swot("AAPL").threats)
+
+
+def test_overrides_and_reset():
+    store = OverlayStore()
+    store.set("acme", "AAPL", ("swot_analysis", "threats", 0, "impact"), "3")
+    assert store.overrides("acme", "AAPL") == [
+        (("swot_analysis", "threats", 0, "impact"), "set", "3")
+    ]
+    assert store.get("acme", "AAPL")["swot_analysis"]["threats"][0]["impact"] == "3"
+
+    store.reset("acme")
+    assert store.overrides("acme", "AAPL") == []
+    assert store.get("acme", "AAPL")["swot_analysis"]["threats"][0]["impact"] == "5"
+
+
+def test_invalid_paths():
+    store = OverlayStore()
+    with pytest.raises(ValueError):
+        store.set("acme", "AAPL", "", 1)
+    with pytest.raises(ValueError):
+        store.set("acme", "AAPL", "swot_analysis.threats.99.impact", "1")
+    with pytest.raises(ValueError):
+        store.append("acme", "AAPL", "meta", {})
+    with pytest.raises(ValueError):
+        store.set("acme", "AAPL", "meta.ticker.symbol", "X")
+    assert store._patches == {}  # rejected writes leave no empty patch nodes behind
+
+    store.set("acme", "AAPL", "meta.note", "kept")
+    with pytest.raises(ValueError):
+        store.set("acme", "AAPL", "swot_analysis.threats.99.impact", "1")
+    assert list(store._patches[("acme", "AAPL")].children) == ["meta"]
+
+
+def test_overridden_rating_reaches_structured_swot():
+    store = OverlayStore()
+    store.set("acme", "AAPL", "swot_analysis.threats.0.impact", "2")
+    assert store.loader_for("acme").get_swot("AAPL").threats[0].impact == 2
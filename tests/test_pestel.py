@@ -27,3 +27,27 @@ def test_invalid_scores():
     pestel = PESTEL("Tech")
     with pytest.raises(ValueError):
         pestel.add_factor("Political", "Test", 6, 3)
+
+
+def test_count_tensor():
+    pestel = PESTEL("Tech")
+    pestel.add_factor("Political", "A", 4, 3)
+    pestel.add_factor("Political", "B", 4, 3)
+    pestel.add_factor("Legal", "C", 1, 5)
+    counts = pestel.count_tensor()
+    assert counts.shape == (5, 5, 6) and counts.sum() == 3
+    assert counts[2, 3, 0] == 2 and counts[4, 0, 5] == 1
+    assert PESTEL("Empty").count_tensor().sum() == 0
+
+
+def test_density_modes_draw_per_cell_not_per_factor():
+    pestel = PESTEL("Tech")
+    for i in range(300):
+        pestel.add_factor(["Economic", "Social"][i % 2], f"Factor {i}", 1 + i % 5, 1 + i % 3)
+    ax = pestel.plot_impact_matrix(mode="auto", show=False).axes[0]
+    assert len(ax.collections) == 2  # 'auto' switches to bubbles: one scatter per category
+    assert sum(len(c.get_offsets()) for c in ax.collections) == 30  # 15 cells x 2 categories
+    heat = pestel.plot_impact_matrix(mode="heatmap", show=False).axes[0]
+    assert len(heat.images) == 1 and not heat.collections
+    with pytest.raises(ValueError):
+        pestel.plot_impact_matrix(mode="hexbin")
@@ -0,0 +1,56 @@
+"""Tests for in-memory chart output from the plot methods"""
+
+import io
+
+import pytest
+from business_frameworks import PESTEL, SWOT, AnsoffMatrix, BCGMatrix, PortersFiveForces
+
+MAGIC = {"png": b"\x89PNG", "pdf": b"%PDF", "svg": b"<?xml", "webp": b"RIFF"}
+
+
+def _plots():
+    bcg = BCGMatrix("Co")
+    bcg.add_business_unit("Unit", market_share=1.5, market_growth=12, revenue=100)
+    pestel = PESTEL("Retail")
+    pestel.add_factor("Economic", "Inflation", impact=4, likelihood=4)
+    return [SWOT("Co", strengths=["Brand"]).plot, PortersFiveForces("Tech", 4, 3, 3, 2, 3).plot,
+            bcg.plot, pestel.plot_impact_matrix, AnsoffMatrix("Co").plot]
+
+
+@pytest.mark.parametrize("format", sorted(MAGIC))
+def test_every_plot_returns_bytes(format):
+    for plot in _plots():
+        data = plot(format=format, dpi=20, return_bytes=True)
+        assert data.startswith(MAGIC[format]), (plot, format)
+
+
+def test_buffer_output_and_lower_dpi_is_smaller():
+    swot_plot = _plots()[0]
+    buffer = io.BytesIO()
+    fig = swot_plot(buffer=buffer, dpi=20)
+    assert buffer.getvalue().startswith(MAGIC["png"]) and fig.axes
+    assert len(swot_plot(return_bytes=True, dpi=20)) < len(swot_plot(return_bytes=True, dpi=80))
+
+
+def test_headless_backend_returns_figure_without_pyplot():
+    import matplotlib.pyplot as plt
+
+    plt.switch_backend("Agg")
+    before = plt.get_fignums()
+    for plot in _plots():
+        assert plot().axes  # non-interactive: nothing is shown, the figure comes back
+    assert plt.get_fignums() == before
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        _plots()[0](format="bmpx", return_bytes=True)
+
+
+def test_layout_without_layout_engines(monkeypatch):
+    import matplotlib.figure  # noqa: F401 - binds the engine before it is hidden
+    import matplotlib.layout_engine
+
+    monkeypatch.delattr(matplotlib.layout_engine, "TightLayoutEngine")  # matplotlib < 3.6
+    fig = SWOT("Co", strengths=["Brand"]).plot(show=False)
+    assert 0 < fig.axes[0].get_position().x0 < 0.1
@@ -19,3 +19,25 @@ def test_add_factor():
     pf = PortersFiveForces("Tech", 5, 3, 4, 2, 2)
     pf.add_factor("Competitive Rivalry", "High competition")
     assert len(pf.forces["Competitive Rivalry"].factors) == 1
+
+
+def test_score_matrix_and_overlay():
+    from business_frameworks.porters_five_forces import plot_many, score_matrix
+
+    tech, retail = PortersFiveForces("Tech", 5, 3, 4, 2, 2), PortersFiveForces("Retail", 4, 2, 5, 3, 4)
+    assert score_matrix([tech, retail]).tolist() == [[5, 3, 4, 2, 2], [4, 2, 5, 3, 4]]
+    ax = tech.compare(retail, show=False).axes[0]
+    assert ax.name == "polar" and [t.get_text() for t in ax.get_legend().get_texts()] == ["Tech", "Retail"]
+    with pytest.raises(ValueError):
+        plot_many([])
+
+
+def test_grid_mode_batches_polygons_into_one_axes():
+    from business_frameworks.porters_five_forces import plot_many
+
+    industries = [PortersFiveForces(f"Industry {i}", 1 + i % 5, 2, 3, 4, 1 + i % 3) for i in range(100)]
+    fig = plot_many(industries, show=False)  # 'auto' picks the grid above a handful
+    grid = fig.axes[0]
+    assert len(fig.axes) == 2  # the grid and its colorbar
+    assert len(grid.collections) == 3 and len(grid.collections[2].get_paths()) == 100
+    assert plot_many(industries[:8], mode="grid", cols=4, dpi=20, return_bytes=True).startswith(b"\x89PNG")
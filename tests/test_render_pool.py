@@ -0,0 +1,58 @@
+"""Tests for the warm render pool"""
+
+from business_frameworks import PESTEL, SWOT, BCGMatrix
+from business_frameworks.render_pool import WarmRenderPool, render_figure, render_many
+
+PNG = b"\x89PNG"
+
+
+def _swot(i):
+    return SWOT(f"Co {i}", strengths=["Brand"], threats=["Competition"])
+
+
+def test_render_figure_returns_bytes_and_closes():
+    import matplotlib.pyplot as plt
+
+    before = plt.get_fignums()
+    data = render_figure(_swot(0), dpi=30)
+    assert data.startswith(PNG)
+    assert plt.get_fignums() == before
+
+
+def test_pool_renders_in_order_and_recycles_workers(tmp_path):
+    bcg = BCGMatrix("Co")
+    bcg.add_business_unit("Unit", market_share=1.5, market_growth=12, revenue=100)
+    jobs = [(_swot(i), None) for i in range(5)] + [(bcg, str(tmp_path / "bcg.png"))]
+
+    with WarmRenderPool(processes=2, max_jobs_per_worker=2) as pool:
+        results = list(pool.map(jobs, dpi=30))
+        stats = pool.stats()
+
+    assert all(r.data.startswith(PNG) for r in results[:5])
+    assert results[5].data is None and (tmp_path / "bcg.png").exists()
+    assert len({r.worker_pid for r in results}) >= 3  # workers were replaced
+    assert stats["jobs"] == 6 and stats["mean_job_seconds"] > 0
+
+
+def test_pool_submit_single_job():
+    with WarmRenderPool(processes=1) as pool:
+        result = pool.render(_swot(1), format="svg", dpi=30)
+    assert b"<svg" in result.data
+
+
+def test_headless_plot_returns_untracked_figure():
+    import matplotlib.pyplot as plt
+
+    before = plt.get_fignums()
+    fig = _swot(2).plot(show=False)
+    assert fig.axes and plt.get_fignums() == before
+
+
+def test_render_many_reports_timings_and_errors(tmp_path):
+    charts = {"a_swot": _swot(3), "b_swot": _swot(4), "empty": PESTEL("Nothing")}
+    for processes in (1, 2):
+        out = tmp_path / str(processes)
+        results = render_many(charts, str(out), processes=processes, dpi=30)
+        assert [r.path for r in results][:2] == [str(out / "a_swot.png"), str(out / "b_swot.png")]
+        assert (out / "a_swot.png").exists() and results[0].seconds > 0
+        assert results[2].error and not (out / "empty.png").exists()
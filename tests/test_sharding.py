@@ -0,0 +1,109 @@
+"""Tests for sharded universe processing"""
+
+import functools
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+from business_frameworks.sharding import ShardCoordinator, partition, run_worker, shard_of
+
+TICKERS = [f"T{i:03d}" for i in range(40)]
+
+
+def _record(out_dir, ticker):
+    """Job used by worker processes: fail once for T007, then write a marker."""
+    out = Path(out_dir)
+    flag = out / "T007.failed-once"
+    if ticker == "T007" and not flag.exists():
+        flag.write_text("")
+        raise RuntimeError("transient failure")
+    (out / f"{ticker}.done").write_text(str(os.getpid()))
+    return ticker
+
+
+def _crash_on_first_lease(out_dir, ticker):
+    flag = Path(out_dir) / "crashed"
+    if not flag.exists():
+        flag.write_text("")
+        os._exit(1)
+    return ticker
+
+
+def _start_workers(coord, job, count):
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(coord.address, job, coord.authkey))
+        for _ in range(count)
+    ]
+    for w in workers:
+        w.start()
+    return workers
+
+
+def test_shard_of_is_stable_and_in_range():
+    assert shard_of("aapl", 8) == shard_of("AAPL", 8)
+    assert all(0 <= shard_of(t, 8) < 8 for t in TICKERS)
+    with pytest.raises(ValueError):
+        shard_of("AAPL", 0)
+
+
+def test_partition_covers_every_ticker_once():
+    shards = partition(TICKERS, 5)
+    assert len(shards) == 5
+    assert sorted(t for shard in shards for t in shard) == TICKERS
+
+
+def test_workers_process_all_shards_and_requeue_failures(tmp_path):
+    with ShardCoordinator(TICKERS, num_shards=6) as coord:
+        workers = _start_workers(coord, functools.partial(_record, str(tmp_path)), 3)
+        assert coord.wait(timeout=60)
+        for w in workers:
+            w.join(timeout=10)
+
+    assert coord.summary()["done"] == 6
+    assert sorted(p.stem for p in tmp_path.glob("*.done")) == TICKERS
+    retried = coord.shards[shard_of("T007", 6)]
+    assert retried.attempts == 2
+    assert sorted(r for s in coord.shards.values() for r in s.results) == TICKERS
+
+
+def test_dead_worker_lease_expires(tmp_path):
+    job = functools.partial(_crash_on_first_lease, str(tmp_path))
+    with ShardCoordinator(TICKERS[:4], num_shards=1, lease_timeout=0.5) as coord:
+        crashed = _start_workers(coord, job, 1)[0]
+        crashed.join(timeout=10)
+        assert crashed.exitcode == 1
+        survivor = _start_workers(coord, job, 1)[0]
+        assert coord.wait(timeout=30)
+        survivor.join(timeout=10)
+
+    assert coord.shards[0].state == "done"
+    assert coord.shards[0].attempts == 2
+
+
+def test_disconnected_worker_shard_is_requeued_without_timeout(tmp_path):
+    job = functools.partial(_crash_on_first_lease, str(tmp_path))
+    with ShardCoordinator(TICKERS[:4], num_shards=1) as coord:
+        crashed = _start_workers(coord, job, 1)[0]
+        crashed.join(timeout=10)
+        survivor = _start_workers(coord, job, 1)[0]
+        assert coord.wait(timeout=30)
+        survivor.join(timeout=10)
+
+    assert coord.shards[0].state == "done" and coord.shards[0].attempts == 2
+
+
+def test_malformed_messages_get_an_error_reply():
+    coord = ShardCoordinator(["AAPL"], num_shards=1)
+    for message in ("lease", (), ("complete", 99, []), ("fail",), ("complete", 0, 5), ("nope", 1)):
+        assert coord._dispatch(message)[0] == "error"
+    assert coord.summary()["pending"] == 1
+
+
+def test_shard_fails_after_max_attempts():
+    coord = ShardCoordinator(["AAPL"], num_shards=1, max_attempts=1)
+    assert coord._dispatch(("lease", "w1"))[0] == "shard"
+    coord._dispatch(("fail", 0, "boom"))
+    assert coord.shards[0].state == "failed"
+    assert coord.finished
+    assert coord._dispatch(("lease", "w1")) == ("done",)
@@ -0,0 +1,115 @@
+"""Tests for the dependency-free SVG renderer"""
+
+import time
+import xml.etree.ElementTree as ET
+
+import pytest
+from business_frameworks import PESTEL, SWOT, AnsoffMatrix, BCGMatrix, PortersFiveForces
+from business_frameworks.svg import bcg_svg, pestel_svg, render_html, render_svg, swot_svg
+
+NS = "{http://www.w3.org/2000/svg}"
+
+
+def _frameworks():
+    bcg = BCGMatrix("TechCorp")
+    bcg.add_business_unit("Cloud", market_share=1.5, market_growth=25, revenue=500)
+    bcg.add_business_unit("Legacy", market_share=2.0, market_growth=2, revenue=300)
+    pestel = PESTEL("Retail")
+    pestel.add_factor("Economic", "Inflation", impact=4, likelihood=4)
+    ansoff = AnsoffMatrix("Co", current_strategy="Diversification")
+    ansoff.add_strategy("Market Penetration", ["Loyalty program"])
+    return [SWOT("Co", strengths=["Brand <& trust>"]), PortersFiveForces("Tech", 4, 3, 3, 2, 3),
+            bcg, pestel, ansoff]
+
+
+def _texts(svg):
+    return ["".join(t.itertext()) for t in ET.fromstring(svg).iter(f"{NS}text")]
+
+
+def test_all_frameworks_render_valid_svg():
+    for analysis in _frameworks():
+        svg = render_svg(analysis)
+        root = ET.fromstring(svg)
+        assert root.tag == f"{NS}svg" and float(root.get("width")) > 0
+        assert analysis._repr_svg_().startswith("<svg")
+
+
+def test_content_matches_the_data():
+    swot, porters, bcg, pestel, ansoff = _frameworks()
+    assert "• Brand <& trust>" in _texts(render_svg(swot))
+    assert {"Cloud", "Legacy"} <= set(_texts(render_svg(bcg)))
+    assert "★ CURRENT" in _texts(render_svg(ansoff))
+    assert any("Overall Score: 3.00/5.0" in t for t in _texts(render_svg(porters)))
+    assert len(ET.fromstring(render_svg(pestel)).findall(f"{NS}circle")) == 2  # point + legend
+
+
+def test_renders_from_dict_and_html_page():
+    swot = SWOT("Co", threats=["Rivals"])
+    assert swot_svg(swot.to_dict()) == render_svg(swot)
+    html = render_html(_frameworks(), title="Co & Partners")
+    assert html.count("<svg") == 5 and "Co &amp; Partners" in html
+    with pytest.raises(ValueError):
+        render_svg(object())
+
+
+def test_rendering_is_fast():
+    frameworks = _frameworks()
+    start = time.perf_counter()
+    for _ in range(50):
+        for analysis in frameworks:
+            render_svg(analysis)
+    assert (time.perf_counter() - start) / 250 < 0.005  # typically well under 1 ms
+
+
+def test_new_to_dict_exports():
+    pestel, ansoff = _frameworks()[3:]
+    assert pestel.to_dict()["factors"][0]["score"] == 16
+    exported = ansoff.to_dict()
+    assert exported["current_strategy"] == "Diversification"
+    exported["strategies"]["Market Penetration"]["initiatives"].append("x")
+    assert ansoff.strategies["Market Penetration"]["initiatives"] == ["Loyalty program"]
+
+
+def test_long_lists_are_wrapped_and_summarised():
+    long_item = "Item with a long description from one of many analysts, " * 3 + "and then some"
+    svg = render_svg(SWOT("Co", strengths=[long_item] * 80))
+    texts = _texts(svg)
+    assert any(t.startswith("+") and t.endswith("more (see plot_pages)") for t in texts)
+    assert any(t.startswith("   ") and t.endswith("and then some") for t in texts)  # wrapped, not cut
+
+    ansoff = AnsoffMatrix("Co")
+    ansoff.add_strategy("Diversification", [f"Initiative {i}" for i in range(6)])
+    assert sum(t.startswith("• Initiative ") for t in _texts(render_svg(ansoff))) == 6
+
+
+def test_bubble_radius_matches_matplotlib_marker_size():
+    bcg = _frameworks()[2]
+    radii = [float(c.get("r")) for c in ET.fromstring(bcg_svg(bcg.to_dict())).iter(f"{NS}circle")]
+    assert radii[:2] == [25.0, 19.4]  # sqrt(revenue * 5) / 2, as scatter(s=revenue * 5) draws
+    pestel = _frameworks()[3]
+    assert float(ET.fromstring(render_svg(pestel)).find(f"{NS}circle").get("r")) == 7.1
+
+
+def test_pestel_density_modes():
+    pestel = PESTEL("Retail")
+    for i in range(90):
+        pestel.add_factor(["Economic", "Social", "Legal"][i % 3], f"Factor {i}",
+                          impact=1 + i % 5, likelihood=1 + i // 5 % 5)
+    data = pestel.to_dict()
+    counts = pestel.count_tensor()
+    cells = {(l + 1, i + 1) for l, i, _ in zip(*counts.nonzero())}
+
+    bubbles = ET.fromstring(pestel_svg(data))  # 'auto' above DENSITY_THRESHOLD
+    assert len(bubbles.findall(f"{NS}circle")) == (counts > 0).sum() + 3  # + legend
+    labels = [t.text for t in ET.fromstring(pestel_svg(data, mode="bubbles")).iter(f"{NS}text")
+              if t.get("font-size") == "7"]
+    assert labels == ["2"] * (counts == 2).sum()  # counts above one are labelled
+
+    heatmap = pestel_svg(data, mode="heatmap")
+    texts = _texts(heatmap)
+    for likelihood, impact in cells:
+        assert str(counts[likelihood - 1, impact - 1].sum()) in texts
+    assert "Eco 2 Soc 1 Leg 1" in texts
+    assert not ET.fromstring(heatmap).findall(f"{NS}circle")
+    with pytest.raises(ValueError):
+        pestel_svg(data, mode="hexbin")
@@ -1,6 +1,8 @@
 """Tests for SWOT Analysis"""
 
 from business_frameworks import SWOT
+from business_frameworks.company_data import CompanyDataLoader
+from business_frameworks.swot import SWOTItem
 
 
 def test_swot_creation():
@@ -21,3 +23,64 @@ def test_add_methods():
     assert len(swot.weaknesses) == 1
     assert len(swot.opportunities) == 1
     assert len(swot.threats) == 1
+
+
+def test_structured_items_format_lazily():
+    threat = SWOTItem("Trade tensions", impact=5, likelihood=4)
+    swot = SWOT("TestCo", strengths=[SWOTItem("Brand", evidence="$502B value"), "Plain text"],
+                opportunities=[SWOTItem("Services", potential="$150B+ TAM")],
+                threats=[threat])
+    assert str(swot.strengths[0]) == "Brand ($502B value)"
+    assert str(swot.opportunities[0]) == "Services - $150B+ TAM"
+    assert str(threat) == "Trade tensions (Impact: 5/5, Likelihood: 4/5)"
+    assert str(SWOTItem("Tariffs", impact=3)) == "Tariffs (Impact: 3/5)"
+    assert str(SWOTItem("Tariffs", likelihood=2)) == "Tariffs (Likelihood: 2/5)"
+    assert "• Plain text" in swot.generate_report()
+
+
+def test_items_are_hashable_and_equal_by_value():
+    a = SWOTItem("Brand", evidence="$502B value")
+    b = SWOTItem("Brand", evidence="$502B value")
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b, SWOTItem("Brand")}) == 2
+
+
+def test_top_threats_and_filtering():
+    swot = SWOT("TestCo", threats=[
+        SWOTItem("Low", impact=2, likelihood=2),
+        SWOTItem("High", impact=5, likelihood=4),
+        "Unrated threat",
+        SWOTItem("Mid", impact=3, likelihood=4),
+    ])
+    assert [str(t).split(" (")[0] for t in swot.top_threats(2)] == ["High", "Mid"]
+    assert [t.factor for t in swot.threats_where(min_likelihood=4)] == ["High", "Mid"]
+    assert swot.to_dict()["threats"][1] == {"factor": "High", "impact": 5, "likelihood": 4}
+
+
+def test_curated_swot_keeps_structure():
+    swot = CompanyDataLoader().get_swot("AAPL")
+    assert all(isinstance(t, SWOTItem) for t in swot.threats)
+    assert swot.top_threats(1)[0].factor == "US-China trade tensions"
+    assert str(swot.strengths[0]) == "World's most valuable brand ($502B brand value, #1 globally)"
+
+
+def test_long_lists_fit_or_paginate(tmp_path):
+    items = [f"Item {i} with a reasonably long description from one of many analysts" for i in range(120)]
+    swot = SWOT("Merged", strengths=items, threats=items[:2])
+
+    fig = swot.plot(show=False)
+    texts = [t.get_text() for t in fig.axes[0].texts]
+    assert any(t.startswith("+") and t.endswith("more (see plot_pages)") for t in texts)
+    assert not any(t.endswith("...") for t in texts)
+
+    pages = swot.plot_pages(save_path=str(tmp_path / "swot.png"), dpi=30)
+    assert len(pages) > 1 and (tmp_path / f"swot-{len(pages)}.png").exists()
+    drawn = [t.get_text() for page in pages for t in page.axes[0].texts]
+    assert sum(t.startswith("• Item ") for t in drawn) == 122
+
+
+def test_dollar_amounts_are_not_mathtext():
+    fig = SWOT("Co", strengths=["Financial strength ($166B cash, $97B net income)"]).plot(show=False)
+    item = next(t for t in fig.axes[0].texts if t.get_text().startswith("•"))
+    assert item.get_text() == "• Financial strength ($166B cash, $97B net income)"
+    assert not item.get_parse_math()
@@ -0,0 +1,77 @@
+"""Tests for measured-text wrapping, fitting and pagination"""
+
+import random
+import time
+
+import pytest
+from business_frameworks.text_layout import LINE_SPACING, fit, measure, paginate, wrap
+
+WORDS = "market growth brand pricing regulation supply chain digital services".split()
+
+
+def _items(n, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 25))) for _ in range(n)]
+
+
+def test_wrap_keeps_lines_inside_width_with_hanging_indent():
+    lines = wrap("Premium pricing limits the addressable market in emerging economies", 120,
+                 fontsize=9, prefix="• ")
+    assert len(lines) > 1 and lines[0].startswith("• ")
+    assert all(line.startswith(" ") for line in lines[1:])
+    assert all(measure(line, 9) <= 120 for line in lines)
+    assert " ".join(" ".join(lines)[2:].split()) == \
+        "Premium pricing limits the addressable market in emerging economies"
+    assert all(measure(line, 9) <= 40 for line in wrap("x" * 60, 40))
+
+
+def test_fit_shrinks_font_before_dropping_items():
+    assert fit(_items(3), 300, 200).fontsize == 9
+    tighter = fit(_items(12), 300, 200)
+    assert tighter.overflow == 0 and 6 <= tighter.fontsize < 9
+    assert len(tighter.lines) * tighter.pitch <= 200
+
+    crowded = fit(_items(100), 300, 200)
+    assert crowded.fontsize == 6 and crowded.items + crowded.overflow == 100
+    assert (len(crowded.lines) + 1) * crowded.pitch <= 200  # room left for the note
+
+
+def test_paginate_covers_every_item_and_is_fast():
+    items = _items(750)
+    start = time.perf_counter()
+    pages = paginate(items, 400, 300, fontsize=8)
+    assert time.perf_counter() - start < 1.0
+    assert all(len(page) <= 300 // (8 * LINE_SPACING) for page in pages)
+    bullets = sum(line.startswith("• ") for page in pages for line in page)
+    assert bullets == 750 and paginate([], 400, 300) == [[]]
+    with pytest.raises(ValueError):
+        paginate(items, 400, 5)
+
+
+@pytest.mark.parametrize("layout", ["single", "dashboard"])
+def test_fitted_text_stays_in_its_quadrant_after_layout(layout):
+    from business_frameworks import SWOT, AnsoffMatrix, PortersFiveForces
+    from business_frameworks.dashboard import render_dashboard
+
+    swot = SWOT("Merged", strengths=_items(60), threats=_items(3, seed=1))
+    ansoff = AnsoffMatrix("Co")
+    ansoff.add_strategy("Diversification", _items(12, seed=2))
+    if layout == "single":
+        figs = [swot.plot(show=False), ansoff.plot(show=False)]
+    else:  # small panels: layout shrinks the axes after the quadrants are drawn
+        figs = [render_dashboard([swot, PortersFiveForces("Tech", 3, 3, 3, 3, 3), ansoff],
+                                 figsize=(8, 5), show=False)]
+    notes = 0
+    for fig in figs:
+        renderer = fig.canvas.get_renderer()
+        for ax in fig.axes:
+            items = [t for t in ax.texts if t.get_text().startswith(("•", " ", "+"))]
+            for text in items:
+                box = text.get_window_extent(renderer)
+                x, y = ax.transData.inverted().transform(((box.x0, box.y0), (box.x1, box.y1))).T
+                # inside the unit quadrant the item's top-left corner is in
+                left, bottom = int(text.xy[0]), int(text.xy[1])
+                assert left <= x[0] and x[1] <= left + 1.0, text.get_text()
+                assert bottom <= y[0] and y[1] <= bottom + 1.0, text.get_text()
+            notes += sum(t.get_text().startswith("+") for t in items)
+    assert notes >= 1  # the 60 strengths cannot all fit
@@ -0,0 +1,48 @@
+"""Tests for single-render thumbnail pyramids"""
+
+import pytest
+from business_frameworks import SWOT, PortersFiveForces
+from business_frameworks.thumbnails import pyramid_key, render_pyramid
+
+SIZES = {"print": 120, "preview": 60, "thumb": 15}
+
+
+def test_one_draw_writes_every_size_under_one_key(tmp_path, monkeypatch):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from PIL import Image
+
+    draws = []
+    original = FigureCanvasAgg.draw
+    monkeypatch.setattr(FigureCanvasAgg, "draw", lambda self: draws.append(1) or original(self))
+    swot = SWOT("Co", strengths=["Brand"], threats=["Regulation"])
+    pyramid = render_pyramid(swot, tmp_path, sizes=SIZES, figsize=(6, 5))
+
+    assert len(draws) == 1 and pyramid.rendered
+    assert pyramid.key == pyramid_key(swot, SIZES, "png", figsize=(6, 5))
+    assert pyramid.pixels == {"print": (720, 600), "preview": (360, 300), "thumb": (90, 75)}
+    for name, path in pyramid.paths.items():
+        assert path == tmp_path / f"{pyramid.key}-{name}.png"
+        with Image.open(path) as image:
+            assert image.size == pyramid.pixels[name]
+
+    again = render_pyramid(SWOT("Co", strengths=["Brand"], threats=["Regulation"]), tmp_path,
+                           sizes=SIZES, figsize=(6, 5))
+    assert not again.rendered and len(draws) == 1 and again.pixels == pyramid.pixels
+    assert render_pyramid(swot, tmp_path, sizes=SIZES, figsize=(6, 4)).key != pyramid.key
+
+
+def test_custom_stem_and_format(tmp_path):
+    forces = PortersFiveForces("Tech", 4, 3, 3, 2, 3)
+    pyramid = render_pyramid(forces, tmp_path, sizes={"big": 40, "small": 10}, format="webp",
+                             stem="tech-forces")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tech-forces-big.webp", "tech-forces-small.webp"]
+    assert render_pyramid(forces, tmp_path, sizes={"big": 40, "small": 10}, format="webp",
+                          stem="tech-forces").rendered  # names don't identify content: redrawn
+    assert pyramid.pixels["small"][0] * 4 == pyramid.pixels["big"][0]
+
+
+def test_bad_input(tmp_path):
+    swot = SWOT("Co")
+    for kwargs in ({"format": "svg"}, {"sizes": {}}, {"sizes": {"a/b": 50}}, {"sizes": {"x": 0}}):
+        with pytest.raises(ValueError):
+            render_pyramid(swot, tmp_path, **kwargs)